@@ -6,6 +6,7 @@ Main class that handles metric collection and persistence.
 import contextlib
 import csv
 import inspect
+import itertools
 import json
 import threading
 import time
@@ -26,6 +27,70 @@ from .types import Metric, MetricAggregate, MetricLevel, MetricType, MetricValue
 logger = get_logger(__name__)
 
 
+class _MetricRowIter:
+    """
+    File-like object that serializes metrics to COPY rows on demand.
+
+    copy_expert pulls from read() as Postgres consumes data, so the flush
+    keeps a constant memory footprint regardless of batch size and the
+    Python encoder overlaps with the TCP send through OS buffers.
+    """
+
+    # Rows encoded per refill: large enough to amortize Python call
+    # dispatch, small enough to keep the footprint bounded.
+    _CHUNK_ROWS = 256
+
+    def __init__(self, metrics: List["Metric"]):
+        self._rows = iter(metrics)
+        self._pending = ""
+        self._out = StringIO()
+        self._writer = csv.writer(self._out, delimiter="\t")
+
+    @staticmethod
+    def _encode_row(metric: "Metric", _dumps=json.dumps) -> tuple:
+        return (
+            metric.name,
+            metric.value,
+            metric.metric_type.value,
+            metric.timestamp,
+            _dumps(metric.tags),
+            metric.level.value,
+            metric.description or "",
+            metric.source or "",
+            metric.unit or "",
+            _dumps(metric.metadata),
+        )
+
+    def read(self, size: int = -1) -> str:
+        encode_row = self._encode_row
+        while size < 0 or len(self._pending) < size:
+            rows = [encode_row(m) for m in itertools.islice(self._rows, self._CHUNK_ROWS)]
+            if not rows:
+                break
+
+            self._out.seek(0)
+            self._out.truncate()
+            self._writer.writerows(rows)
+            self._pending += self._out.getvalue()
+
+        if size < 0:
+            result, self._pending = self._pending, ""
+        else:
+            result, self._pending = self._pending[:size], self._pending[size:]
+        return result
+
+
+# Decode NUMERIC columns directly to float instead of Decimal, skipping the
+# Decimal-then-float round-trip per numeric cell in summary queries. Note:
+# this coercion is process-global for all psycopg2 connections.
+DEC2FLOAT = psycopg2.extensions.new_type(
+    psycopg2.extensions.DECIMAL.values,
+    "DEC2FLOAT",
+    lambda value, cursor: float(value) if value is not None else None,
+)
+psycopg2.extensions.register_type(DEC2FLOAT)
+
+
 class AdvancedMetricsCollector:
     """
     Advanced metrics collector with:
@@ -44,8 +109,9 @@ class AdvancedMetricsCollector:
         max_buffer_size: int = 10000,
         retention_days: int = 30,
         enable_aggregation: bool = True,
-        max_workers: int = 2,
-        max_connections: int = 5,
+        max_workers: int = 4,
+        max_connections: int = 8,
+        durability: str = "async",
     ):
         """
         Initialize the advanced metrics collector.
@@ -57,10 +123,19 @@ class AdvancedMetricsCollector:
             max_buffer_size: Maximum buffer size before forced flush
             retention_days: Days to keep metrics before auto-deletion
             enable_aggregation: Enable in-memory aggregation
-            max_workers: Thread pool workers for background tasks
+            max_workers: Thread pool workers for background tasks and
+                parallel batch inserts (keep balanced with max_connections)
             max_connections: Maximum database connections in pool
+            durability: 'async' sets synchronous_commit=off on metrics
+                connections (no fsync wait per commit; on crash up to
+                wal_writer_delay of samples may be lost, acceptable for
+                observational data). 'sync' keeps full durability.
         """
+        if durability not in ("sync", "async"):
+            raise MetricsError(f"Invalid durability mode: {durability}")
+
         self.db_config = db_config
+        self.durability = durability
         self.batch_size = batch_size
         self.flush_interval = flush_interval
         self.max_buffer_size = max_buffer_size
@@ -89,6 +164,10 @@ class AdvancedMetricsCollector:
         self.aggregates: Dict[str, MetricAggregate] = {}
         self.aggregate_lock = threading.RLock()
 
+        # Bumped on every record_metric; exporters use it to invalidate
+        # cached renders without comparing contents
+        self.version = 0
+
         # Background processing
         self.executor = ThreadPoolExecutor(
             max_workers=max_workers, thread_name_prefix="metrics-worker"
@@ -101,6 +180,10 @@ class AdvancedMetricsCollector:
         self.max_connections = max_connections
         self._init_connection_pool()
 
+        # Prepared statement names for get_metrics_summary, one per
+        # filter shape: (name_filter?, metric_type?, level?)
+        self._prepared: Dict[tuple, str] = {}
+
         # Initialize metrics table
         self._init_metrics_table()
 
@@ -129,6 +212,15 @@ class AdvancedMetricsCollector:
         conn = None
         try:
             conn = self.connection_pool.getconn()
+
+            # Metrics are retryable data: skip the fsync wait per commit.
+            # Applied once per pooled connection, WAL is still written.
+            if self.durability == "async" and not getattr(conn, "_metrics_async_commit", False):
+                with conn.cursor() as cursor:
+                    cursor.execute("SET synchronous_commit = off")
+                conn.commit()
+                conn._metrics_async_commit = True
+
             yield conn
         except Exception as e:
             logger.error("Error obteniendo conexión del pool", error=str(e))
@@ -336,6 +428,7 @@ class AdvancedMetricsCollector:
 
                 self.metrics_buffer.append(metric)
                 self.stats["total_metrics"] += 1
+                self.version += 1
 
                 # Update in-memory aggregates
                 if self.enable_aggregation:
@@ -359,6 +452,53 @@ class AdvancedMetricsCollector:
             self.stats["total_errors"] += 1
             raise MetricsError(f"Failed to record metric '{name}': {e}")
 
+    def record_metrics_batch(self, entries: List[tuple]) -> None:
+        """
+        Record several metrics under a single lock acquisition.
+
+        Args:
+            entries: List of (name, value, metric_type, tags, unit)
+                tuples sharing one timestamp. Tags dicts are stored by
+                reference and must not be mutated by the caller.
+        """
+        if not entries:
+            return
+
+        timestamp = datetime.now()
+        metrics = [
+            Metric(
+                name=name,
+                value=float(value),
+                metric_type=metric_type,
+                timestamp=timestamp,
+                tags=tags or {},
+                unit=unit,
+            )
+            for name, value, metric_type, tags, unit in entries
+        ]
+
+        with self.buffer_lock:
+            if len(self.metrics_buffer) + len(metrics) > self.max_buffer_size:
+                self.stats["buffer_overflow"] += 1
+                logger.warning(
+                    "Buffer de métricas lleno, forzando flush",
+                    buffer_size=len(self.metrics_buffer),
+                    max_buffer_size=self.max_buffer_size,
+                )
+                self.flush(force=True)
+
+            self.metrics_buffer.extend(metrics)
+            self.stats["total_metrics"] += len(metrics)
+            self.version += 1
+
+            if self.enable_aggregation:
+                for metric in metrics:
+                    self._update_aggregate(metric)
+
+            if len(self.metrics_buffer) >= self.batch_size:
+                with self.flush_condition:
+                    self.flush_condition.notify()
+
     def _get_caller_source(self) -> str:
         """Get the calling module/function as source."""
         try:
@@ -413,7 +553,7 @@ class AdvancedMetricsCollector:
         logger.debug("Iniciando flush de métricas", count=len(metrics_to_flush), force=force)
 
         try:
-            inserted_count = self._bulk_insert_metrics(metrics_to_flush)
+            inserted_count = self._insert_in_chunks(metrics_to_flush)
 
             # Update statistics
             with self.buffer_lock:
@@ -445,49 +585,104 @@ class AdvancedMetricsCollector:
             self.stats["total_errors"] += 1
             raise MetricsError(f"Failed to flush metrics: {e}")
 
-    def _bulk_insert_metrics(self, metrics: List[Metric]) -> int:
-        """Bulk insert metrics using COPY for maximum performance."""
+    def _insert_in_chunks(self, metrics: List[Metric]) -> int:
+        """
+        Insert metrics splitting into batch_size chunks.
+
+        A single chunk is inserted inline to avoid submit overhead; multiple
+        chunks (e.g. post-outage burst) run as parallel COPY operations on
+        separate pooled connections, overlapping network send and server-side
+        ingest.
+        """
+        chunks = [metrics[i : i + self.batch_size] for i in range(0, len(metrics), self.batch_size)]
+
+        if len(chunks) == 1:
+            return self._bulk_insert_metrics(chunks[0])
+
+        futures = [self.executor.submit(self._bulk_insert_metrics, chunk) for chunk in chunks]
+        return sum(future.result() for future in futures)
+
+    _METRIC_COLUMNS = (
+        "name",
+        "value",
+        "metric_type",
+        "timestamp",
+        "tags",
+        "level",
+        "description",
+        "source",
+        "unit",
+        "metadata",
+    )
+
+    def insert_into_daily_partition(self, metrics: List[Metric], partition_date=None) -> int:
+        """
+        Insert metrics into a per-day partition table (metrics_YYYYMMDD).
+
+        If the partition does not exist yet, it is created and populated with
+        COPY ... FREEZE inside the same transaction: tuples are written
+        already-frozen, skipping the later VACUUM FREEZE pass and halving
+        write amplification. FREEZE requires the table to be created (or
+        truncated) in the same transaction, so subsequent flushes to an
+        existing partition fall back to regular COPY.
+
+        Args:
+            metrics: Metrics to insert
+            partition_date: Date of the partition (defaults to today)
+
+        Returns:
+            Number of metrics inserted
+        """
+        if not metrics:
+            return 0
+
+        partition_date = partition_date or datetime.now().date()
+        partition_name = f"metrics_{partition_date.strftime('%Y%m%d')}"
+
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cursor:
-                    # Prepare data for COPY
-                    csv_buffer = StringIO()
-                    writer = csv.writer(csv_buffer, delimiter="\t")
-
-                    for metric in metrics:
-                        writer.writerow(
-                            [
-                                metric.name,
-                                metric.value,
-                                metric.metric_type.value,
-                                metric.timestamp,
-                                json.dumps(metric.tags),
-                                metric.level.value,
-                                metric.description or "",
-                                metric.source or "",
-                                metric.unit or "",
-                                json.dumps(metric.metadata),
-                            ]
+                    cursor.execute(
+                        "SELECT to_regclass(%s) IS NOT NULL", (f"public.{partition_name}",)
+                    )
+                    partition_exists = cursor.fetchone()[0]
+
+                    if not partition_exists:
+                        cursor.execute(
+                            f"CREATE TABLE {partition_name} "
+                            "(LIKE metrics INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
                         )
 
-                    csv_buffer.seek(0)
-
-                    # Execute COPY command
-                    cursor.copy_from(
-                        csv_buffer,
-                        "metrics",
-                        columns=[
-                            "name",
-                            "value",
-                            "metric_type",
-                            "timestamp",
-                            "tags",
-                            "level",
-                            "description",
-                            "source",
-                            "unit",
-                            "metadata",
-                        ],
+                    columns = ", ".join(self._METRIC_COLUMNS)
+                    freeze_option = ", FREEZE" if not partition_exists else ""
+                    cursor.copy_expert(
+                        f"COPY {partition_name} ({columns}) FROM STDIN "
+                        f"WITH (FORMAT text, DELIMITER E'\\t'{freeze_option})",
+                        _MetricRowIter(metrics),
+                    )
+
+                    conn.commit()
+                    return len(metrics)
+
+        except psycopg2.Error as e:
+            logger.error(
+                "Error de PostgreSQL en insert a partición",
+                partition=partition_name,
+                error=str(e),
+                pgcode=e.pgcode if hasattr(e, "pgcode") else None,
+            )
+            raise
+
+    def _bulk_insert_metrics(self, metrics: List[Metric]) -> int:
+        """Bulk insert metrics using COPY for maximum performance."""
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    columns = ", ".join(self._METRIC_COLUMNS)
+                    cursor.copy_expert(
+                        f"COPY metrics ({columns}) FROM STDIN "
+                        "WITH (FORMAT text, DELIMITER E'\\t')",
+                        _MetricRowIter(metrics),
                     )
 
                     conn.commit()
@@ -501,6 +696,78 @@ class AdvancedMetricsCollector:
             )
             raise
 
+    _SUMMARY_BASE_QUERY = """
+    SELECT
+        name,
+        metric_type,
+        COUNT(*) as count,
+        AVG(value) as avg_value,
+        MIN(value) as min_value,
+        MAX(value) as max_value,
+        PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY value) as p95,
+        PERCENTILE_CONT(0.99) WITHIN GROUP (ORDER BY value) as p99,
+        SUM(CASE WHEN level = 'error' THEN 1 ELSE 0 END) as error_count,
+        SUM(CASE WHEN level = 'warning' THEN 1 ELSE 0 END) as warning_count,
+        MIN(timestamp) as first_seen,
+        MAX(timestamp) as last_seen,
+        (SELECT tags FROM metrics m2
+         WHERE m2.name = metrics.name
+         ORDER BY timestamp DESC LIMIT 1) as latest_tags
+    FROM metrics
+    WHERE timestamp > NOW() - $1::interval
+    """
+
+    def _get_prepared_summary(self, cursor, conn, shape_key: tuple) -> str:
+        """
+        Get (preparing if needed) the server-side summary statement for a
+        filter shape.
+
+        One statement exists per distinct combination of optional filters
+        (name x type x level booleans, 8 shapes total), so Postgres parses
+        and plans each shape once per connection instead of on every call.
+        Prepared names are tracked per connection: a reset/new connection
+        simply re-prepares on first use.
+        """
+        stmt_name = self._prepared.get(shape_key)
+        if stmt_name is None:
+            suffix = "".join("1" if flag else "0" for flag in shape_key)
+            stmt_name = f"ms_summary_{suffix}"
+            self._prepared[shape_key] = stmt_name
+
+        prepared_on_conn = getattr(conn, "_prepared_summary_stmts", None)
+        if prepared_on_conn is None:
+            prepared_on_conn = set()
+            conn._prepared_summary_stmts = prepared_on_conn
+
+        if stmt_name not in prepared_on_conn:
+            name_filter, metric_type, level = shape_key
+            query = self._SUMMARY_BASE_QUERY
+            arg_types = ["interval"]
+
+            if name_filter:
+                arg_types.append("text")
+                query += f" AND name LIKE ${len(arg_types)}"
+
+            if metric_type:
+                arg_types.append("text")
+                query += f" AND metric_type = ${len(arg_types)}"
+
+            if level:
+                arg_types.append("text")
+                query += f" AND level = ${len(arg_types)}"
+
+            arg_types.append("int")
+            query += f"""
+            GROUP BY name, metric_type
+            ORDER BY count DESC
+            LIMIT ${len(arg_types)}
+            """
+
+            cursor.execute(f"PREPARE {stmt_name} ({', '.join(arg_types)}) AS {query}")
+            prepared_on_conn.add(stmt_name)
+
+        return stmt_name
+
     def get_metrics_summary(
         self,
         hours: int = 24,
@@ -525,52 +792,25 @@ class AdvancedMetricsCollector:
         try:
             with self._get_connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                    # Build query with filters
-                    query = """
-                    SELECT
-                        name,
-                        metric_type,
-                        COUNT(*) as count,
-                        AVG(value) as avg_value,
-                        MIN(value) as min_value,
-                        MAX(value) as max_value,
-                        PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY value) as p95,
-                        PERCENTILE_CONT(0.99) WITHIN GROUP (ORDER BY value) as p99,
-                        SUM(CASE WHEN level = 'error' THEN 1 ELSE 0 END) as error_count,
-                        SUM(CASE WHEN level = 'warning' THEN 1 ELSE 0 END) as warning_count,
-                        MIN(timestamp) as first_seen,
-                        MAX(timestamp) as last_seen,
-                        (SELECT tags FROM metrics m2
-                         WHERE m2.name = metrics.name
-                         ORDER BY timestamp DESC LIMIT 1) as latest_tags
-                    FROM metrics
-                    WHERE timestamp > NOW() - INTERVAL %s
-                    """
-
+                    # Collect params for the filter shape of this call
                     params: List[Any] = [f"{hours} hours"]
 
-                    # Apply filters
                     if name_filter:
-                        query += " AND name LIKE %s"
                         params.append(f"%{name_filter}%")
 
                     if metric_type:
-                        query += " AND metric_type = %s"
                         params.append(metric_type.value)
 
                     if level:
-                        query += " AND level = %s"
                         params.append(level.value)
 
-                    # Group and limit
-                    query += """
-                    GROUP BY name, metric_type
-                    ORDER BY count DESC
-                    LIMIT %s;
-                    """
                     params.append(limit)
 
-                    cursor.execute(query, params)
+                    shape_key = (bool(name_filter), bool(metric_type), bool(level))
+                    stmt_name = self._get_prepared_summary(cursor, conn, shape_key)
+
+                    placeholders = ", ".join(["%s"] * len(params))
+                    cursor.execute(f"EXECUTE {stmt_name} ({placeholders})", params)
                     results = cursor.fetchall()
 
                     # Build summary
@@ -589,11 +829,12 @@ class AdvancedMetricsCollector:
                             "name": row["name"],
                             "type": row["metric_type"],
                             "count": row["count"],
-                            "avg": float(row["avg_value"]) if row["avg_value"] else 0,
-                            "min": float(row["min_value"]) if row["min_value"] else 0,
-                            "max": float(row["max_value"]) if row["max_value"] else 0,
-                            "p95": float(row["p95"]) if row["p95"] else None,
-                            "p99": float(row["p99"]) if row["p99"] else None,
+                            # Values arrive as float already via DEC2FLOAT
+                            "avg": row["avg_value"] or 0,
+                            "min": row["min_value"] or 0,
+                            "max": row["max_value"] or 0,
+                            "p95": row["p95"],
+                            "p99": row["p99"],
                             "error_count": row["error_count"],
                             "warning_count": row["warning_count"],
                             "first_seen": (
@@ -2,17 +2,42 @@
 Decorators for automatic metric collection.
 """
 
-import functools
+import sys
 import time
 from typing import Callable, Optional
 
 from src.core.logger import get_logger
 
+from . import ringbuf
 from .registry import MetricsRegistry
 from .types import MetricLevel, MetricType, TagsDict
 
 logger = get_logger(__name__)
 
+# Claves de tags internadas: los inserts en los dicts de tags se
+# resuelven por identidad de puntero en lugar de rehashear el string
+_K_FUNCTION = sys.intern("function")
+_K_MODULE = sys.intern("module")
+_K_CLASS = sys.intern("class")
+_K_SUCCESS = sys.intern("success")
+_K_ERROR_TYPE = sys.intern("error_type")
+_K_ERROR_MESSAGE = sys.intern("error_message")
+_TRUE = sys.intern("True")
+_FALSE = sys.intern("False")
+
+
+def _adopt_metadata(wrapper, func):
+    """Copia solo los atributos de identidad que consumen logs y docs.
+
+    Reemplaza functools.wraps: evita copiar __dict__ y el resto de
+    WRAPPER_ASSIGNMENTS que estos wrappers no necesitan.
+    """
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
 
 def metrics_timer(
     metric_name: str,
@@ -30,52 +55,76 @@ def metrics_timer(
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            start_time = time.perf_counter()
-            success = False
+        # Partial evaluation at decoration time: static tags (including
+        # additional_tags) are merged once, names are preformatted, the
+        # collector reference is cached lazily, and perf_counter is bound
+        # to a closure local to skip the module attribute lookup per call.
+        base_tags = {_K_FUNCTION: func.__name__, _K_MODULE: func.__module__}
+        if additional_tags:
+            base_tags.update(additional_tags)
+        duration_name = f"{metric_name}.duration"
+        success_name = f"{metric_name}.success"
+        _collector_cache = [None]
+        perf_counter = time.perf_counter
+
+        def _record(duration, success, args):
+            tags = base_tags.copy()
+            tags[_K_SUCCESS] = _TRUE if success else _FALSE
+
+            # Add class name if method
+            if args and hasattr(args[0], "__class__"):
+                tags[_K_CLASS] = args[0].__class__.__name__
+
+            success_value = 1.0 if success else 0.0
+
+            # Coalesce through the per-thread ring when the drainer
+            # runs; falls back to direct record otherwise
+            pushed_duration = ringbuf.push_metric(
+                collector_name, duration_name, duration, MetricType.TIMER, tags, "seconds"
+            )
+            pushed_success = ringbuf.push_metric(
+                collector_name, success_name, success_value, MetricType.GAUGE, tags
+            )
 
-            try:
+            if not (pushed_duration and pushed_success):
+                collector = _collector_cache[0]
+                if collector is None:
+                    collector = MetricsRegistry.get_collector(collector_name)
+                    _collector_cache[0] = collector
+
+                # Both samples go through one lock acquisition, sharing
+                # the tags dict and timestamp
+                batch = []
+                if not pushed_duration:
+                    batch.append((duration_name, duration, MetricType.TIMER, tags, "seconds"))
+                if not pushed_success:
+                    batch.append((success_name, success_value, MetricType.GAUGE, tags, None))
+                collector.record_metrics_batch(batch)
+
+        # Two specialized closures selected once here, instead of
+        # re-evaluating "success or record_on_error" on every call
+        if record_on_error:
+
+            def wrapper(*args, **kwargs):
+                start_time = perf_counter()
+                success = False
+
+                try:
+                    result = func(*args, **kwargs)
+                    success = True
+                    return result
+                finally:
+                    _record(perf_counter() - start_time, success, args)
+
+        else:
+
+            def wrapper(*args, **kwargs):
+                start_time = perf_counter()
                 result = func(*args, **kwargs)
-                success = True
+                _record(perf_counter() - start_time, True, args)
                 return result
 
-            finally:
-                duration = time.perf_counter() - start_time
-
-                if success or record_on_error:
-                    collector = MetricsRegistry.get_collector(collector_name)
-
-                    tags = {
-                        "function": func.__name__,
-                        "module": func.__module__,
-                        "success": str(success),
-                    }
-
-                    if additional_tags:
-                        tags.update(additional_tags)
-
-                    # Add class name if method
-                    if args and hasattr(args[0], "__class__"):
-                        tags["class"] = args[0].__class__.__name__
-
-                    collector.record_metric(
-                        name=f"{metric_name}.duration",
-                        value=duration,
-                        metric_type=MetricType.TIMER,
-                        tags=tags,
-                        unit="seconds",
-                    )
-
-                    # Record success rate
-                    collector.record_metric(
-                        name=f"{metric_name}.success",
-                        value=1.0 if success else 0.0,
-                        metric_type=MetricType.GAUGE,
-                        tags=tags,
-                    )
-
-        return wrapper
+        return _adopt_metadata(wrapper, func)
 
     return decorator
 
@@ -96,23 +145,33 @@ def metrics_counter(
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
+        base_tags = {_K_FUNCTION: func.__name__, _K_MODULE: func.__module__}
+        if tags:
+            base_tags = {**tags, **base_tags}
+        count_name = f"{metric_name}.count"
+        _collector_cache = [None]
+
         def wrapper(*args, **kwargs):
-            collector = MetricsRegistry.get_collector(collector_name)
+            current_tags = base_tags.copy()
 
-            current_tags = tags.copy() if tags else {}
-            current_tags.update({"function": func.__name__, "module": func.__module__})
+            if not ringbuf.push_metric(
+                collector_name, count_name, increment, MetricType.COUNTER, current_tags
+            ):
+                collector = _collector_cache[0]
+                if collector is None:
+                    collector = MetricsRegistry.get_collector(collector_name)
+                    _collector_cache[0] = collector
 
-            collector.record_metric(
-                name=f"{metric_name}.count",
-                value=increment,
-                metric_type=MetricType.COUNTER,
-                tags=current_tags,
-            )
+                collector.record_metric(
+                    name=count_name,
+                    value=increment,
+                    metric_type=MetricType.COUNTER,
+                    tags=current_tags,
+                )
 
             return func(*args, **kwargs)
 
-        return wrapper
+        return _adopt_metadata(wrapper, func)
 
     return decorator
 
@@ -133,24 +192,32 @@ def metrics_error_counter(
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
+        base_tags = {_K_FUNCTION: func.__name__}
+        if tags:
+            base_tags = {**tags, **base_tags}
+        error_name = f"{metric_name}.error_count"
+        _collector_cache = [None]
+
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except exceptions as e:
-                collector = MetricsRegistry.get_collector(collector_name)
-
-                current_tags = tags.copy() if tags else {}
-                current_tags.update(
-                    {
-                        "function": func.__name__,
-                        "error_type": type(e).__name__,
-                        "error_message": str(e)[:100],
-                    }
-                )
+                collector = _collector_cache[0]
+                if collector is None:
+                    collector = MetricsRegistry.get_collector(collector_name)
+                    _collector_cache[0] = collector
+
+                current_tags = base_tags.copy()
+                current_tags[_K_ERROR_TYPE] = type(e).__name__
+
+                # Evita el dispatch de __str__ cuando el primer arg ya es
+                # el mensaje (el caso de la gran mayoría de excepciones)
+                first_arg = e.args[0] if e.args else None
+                msg = first_arg if isinstance(first_arg, str) else str(e)
+                current_tags[_K_ERROR_MESSAGE] = msg[:100]
 
                 collector.record_metric(
-                    name=f"{metric_name}.error_count",
+                    name=error_name,
                     value=1,
                     metric_type=MetricType.COUNTER,
                     tags=current_tags,
@@ -158,6 +225,6 @@ def metrics_error_counter(
                 )
                 raise
 
-        return wrapper
+        return _adopt_metadata(wrapper, func)
 
     return decorator
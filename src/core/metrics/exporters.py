@@ -2,39 +2,61 @@
 Export metrics to different formats.
 """
 
+import time
 from datetime import datetime
 from typing import Any, Dict
 
 from .registry import MetricsRegistry
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    import json
+
+    _HAS_ORJSON = False
+
 
 class PrometheusExporter:
     """Export metrics to Prometheus format."""
 
-    @staticmethod
-    def export(collector_name: str = "default", hours: int = 1) -> str:
+    # Rendered output per collector, keyed by the collector version at
+    # render time: scrapes between metric writes reuse the cached text
+    _cache: Dict[str, tuple] = {}
+
+    # Single reused build buffer; keeps its capacity between scrapes so
+    # rendering does not reallocate per export
+    _buffer = bytearray()
+
+    @classmethod
+    def export(cls, collector_name: str = "default", hours: int = 1) -> str:
         """Export to Prometheus format."""
-        MetricsRegistry.get_collector(collector_name)
+        collector = MetricsRegistry.get_collector(collector_name)
+
+        version = collector.version
+        cached = cls._cache.get(collector_name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        with collector.aggregate_lock:
+            aggregates = list(collector.aggregates.values())
 
-        # This would query the database and format for Prometheus
-        # Implementation depends on your storage
+        buffer = cls._buffer
+        del buffer[:]
 
-        lines = [
-            "# HELP etl_processed_records Total records processed",
-            "# TYPE etl_processed_records counter",
-            "etl_processed_records 1500",
-            "",
-            "# HELP etl_processing_duration_seconds Processing duration",
-            "# TYPE etl_processing_duration_seconds histogram",
-            'etl_processing_duration_seconds_bucket{le="0.1"} 10',
-            'etl_processing_duration_seconds_bucket{le="0.5"} 50',
-            'etl_processing_duration_seconds_bucket{le="1.0"} 100',
-            'etl_processing_duration_seconds_bucket{le="+Inf"} 150',
-            "etl_processing_duration_seconds_sum 75.5",
-            "etl_processing_duration_seconds_count 150",
-        ]
+        for agg in aggregates:
+            base = "etl_" + agg.name.replace(".", "_").replace("-", "_")
+            buffer.extend(f"# TYPE {base} {agg.metric_type.value}\n".encode())
+            buffer.extend(f"{base}_count {agg.count}\n".encode())
+            buffer.extend(f"{base}_sum {agg.sum:g}\n".encode())
+            buffer.extend(f"{base}_avg {agg.avg:g}\n".encode())
+            if agg.last_value is not None:
+                buffer.extend(f"{base}_last {agg.last_value:g}\n".encode())
 
-        return "\n".join(lines)
+        rendered = buffer.decode("utf-8")
+        cls._cache[collector_name] = (version, rendered)
+        return rendered
 
 
 class JSONExporter:
@@ -55,6 +77,28 @@ class JSONExporter:
             "data": summary,
         }
 
+    @staticmethod
+    def export_bytes(collector_name: str = "default", **filters) -> bytes:
+        """
+        Export to JSON bytes ready to write/send.
+
+        Avoids the per-metric datetime/isoformat path: the export
+        timestamp is emitted as epoch nanoseconds and, when orjson is
+        installed, the whole payload is serialized in one C call.
+        """
+        collector = MetricsRegistry.get_collector(collector_name)
+        summary = collector.get_metrics_summary(**filters)
+
+        payload = {
+            "exported_at_ns": time.time_ns(),
+            "format": "json",
+            "filters": filters,
+            "data": summary,
+        }
+        if _HAS_ORJSON:
+            return orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC)
+        return json.dumps(payload, default=str).encode("utf-8")
+
 
 class ConsoleExporter:
     """Export metrics to console for debugging."""
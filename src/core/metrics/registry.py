@@ -3,22 +3,31 @@ Global metrics registry for easy access to collectors.
 Singleton pattern for shared metrics collection.
 """
 
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
-from core import logger
 from src.core.exceptions import MetricsError
+from src.core.logger import get_logger
 
 from .collector import AdvancedMetricsCollector
+from .ringbuf import start_drainer, stop_drainer
+
+logger = get_logger(__name__)
 
 
 class MetricsRegistry:
     """
     Global registry for metrics collectors.
     Provides singleton access to configured collectors.
+
+    Readers see an immutable snapshot of the collectors mapping: every
+    registration rebuilds the dict and swaps in a fresh MappingProxyType,
+    so hot-path lookups and iteration need no locks or copies.
     """
 
     _instance = None
-    _collectors: Dict[str, AdvancedMetricsCollector] = {}
+    _collectors_dict: Dict[str, AdvancedMetricsCollector] = {}
+    _collectors: Mapping[str, AdvancedMetricsCollector] = MappingProxyType(_collectors_dict)
 
     def __new__(cls):
         if cls._instance is None:
@@ -35,15 +44,26 @@ class MetricsRegistry:
         validate_db_config(db_config)
 
         collector = AdvancedMetricsCollector(db_config, **kwargs)
-        cls._collectors[name] = collector
+
+        # Atomic snapshot swap: readers keep whichever proxy they saw
+        new_collectors = {**cls._collectors_dict, name: collector}
+        cls._collectors_dict = new_collectors
+        cls._collectors = MappingProxyType(new_collectors)
+
+        # With at least one collector registered the ring-buffer path is
+        # usable: start the drainer so push_metric stops falling back to
+        # the direct (locked) record path. Idempotent across calls.
+        start_drainer()
+
         return collector
 
     @classmethod
     def get_collector(cls, name: str = "default") -> AdvancedMetricsCollector:
         """Get a registered collector."""
-        if name not in cls._collectors:
+        try:
+            return cls._collectors[name]
+        except KeyError:
             raise MetricsError(f"Collector '{name}' not registered")
-        return cls._collectors[name]
 
     @classmethod
     def record_metric(cls, name: str, *args, **kwargs) -> None:
@@ -52,9 +72,9 @@ class MetricsRegistry:
         collector.record_metric(name, *args, **kwargs)
 
     @classmethod
-    def get_all_collectors(cls) -> Dict[str, AdvancedMetricsCollector]:
-        """Get all registered collectors."""
-        return cls._collectors.copy()
+    def get_all_collectors(cls) -> Mapping[str, AdvancedMetricsCollector]:
+        """Get all registered collectors (read-only snapshot)."""
+        return cls._collectors
 
     @classmethod
     def flush_all(cls) -> None:
@@ -64,3 +84,16 @@ class MetricsRegistry:
                 collector.flush(force=True)
             except Exception as e:
                 logger.error(f"Error flushing collector: {e}")
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Stop the ring drainer and close all collectors."""
+        # Stop the drainer first: it synchronously flushes whatever is
+        # still buffered in the rings into the collectors
+        stop_drainer()
+
+        for collector in cls._collectors.values():
+            try:
+                collector.close()
+            except Exception as e:
+                logger.error(f"Error closing collector: {e}")
@@ -0,0 +1,168 @@
+"""
+Per-thread ring buffers that coalesce metric writes from decorators.
+
+Instead of acquiring the collector lock on every decorated call, hot
+threads push into their own single-producer/single-consumer ring and a
+background drainer thread forwards the entries to the collector in
+batches every few milliseconds.
+"""
+
+import threading
+import time
+from typing import Any, List, Optional
+
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# How often the drainer forwards ring contents to the collectors
+DRAIN_INTERVAL_SECONDS = 0.01
+
+
+class RingBuffer:
+    """
+    Fixed-size single-producer/single-consumer ring.
+
+    The owner thread only writes the head index and the drainer only
+    writes the tail index; under the GIL each index update is atomic, so
+    push/drain need no locking. A full ring rejects the push and the
+    caller falls back to the direct record path.
+    """
+
+    __slots__ = ("_items", "_capacity", "_head", "_tail")
+
+    def __init__(self, capacity: int = 4096):
+        self._capacity = capacity
+        self._items: List[Any] = [None] * capacity
+        self._head = 0  # next slot to write (producer side)
+        self._tail = 0  # next slot to read (consumer side)
+
+    def push(self, item: tuple) -> bool:
+        """Push an entry; returns False when the ring is full."""
+        head = self._head
+        next_head = (head + 1) % self._capacity
+        if next_head == self._tail:
+            return False
+
+        self._items[head] = item
+        self._head = next_head
+        return True
+
+    def drain(self) -> List[tuple]:
+        """Consume and return all currently available entries."""
+        items = []
+        tail = self._tail
+        head = self._head
+
+        while tail != head:
+            items.append(self._items[tail])
+            self._items[tail] = None
+            tail = (tail + 1) % self._capacity
+
+        self._tail = tail
+        return items
+
+
+_local = threading.local()
+_rings: List[RingBuffer] = []
+_rings_lock = threading.Lock()
+_drainer: Optional["RingDrainer"] = None
+
+
+def _get_ring() -> RingBuffer:
+    """Get (creating and registering if needed) this thread's ring."""
+    ring = getattr(_local, "ring", None)
+    if ring is None:
+        ring = RingBuffer()
+        _local.ring = ring
+        with _rings_lock:
+            _rings.append(ring)
+    return ring
+
+
+def push_metric(collector_name, name, value, metric_type, tags, unit=None, level=None) -> bool:
+    """
+    Push a metric entry into this thread's ring.
+
+    Returns False when the drainer is not running or the ring is full,
+    in which case the caller should record directly on the collector.
+    """
+    if _drainer is None or not _drainer.running:
+        return False
+    return _get_ring().push((collector_name, name, value, metric_type, tags, unit, level))
+
+
+class RingDrainer(threading.Thread):
+    """Daemon thread that forwards ring entries to their collectors."""
+
+    def __init__(self, interval: float = DRAIN_INTERVAL_SECONDS):
+        super().__init__(daemon=True, name="metrics-ring-drainer")
+        self.interval = interval
+        self.running = False
+
+    def run(self) -> None:
+        from .registry import MetricsRegistry
+
+        while self.running:
+            try:
+                with _rings_lock:
+                    rings = list(_rings)
+
+                collectors = {}
+                for ring in rings:
+                    for entry in ring.drain():
+                        collector_name, name, value, metric_type, tags, unit, level = entry
+
+                        collector = collectors.get(collector_name)
+                        if collector is None:
+                            collector = MetricsRegistry.get_collector(collector_name)
+                            collectors[collector_name] = collector
+
+                        kwargs = {"metric_type": metric_type, "tags": tags, "unit": unit}
+                        if level is not None:
+                            kwargs["level"] = level
+                        collector.record_metric(name, value, **kwargs)
+
+            except Exception as e:
+                logger.error("Error drenando ring buffers de métricas", error=str(e))
+
+            time.sleep(self.interval)
+
+
+def start_drainer() -> None:
+    """Start the background drainer (idempotent)."""
+    global _drainer
+    if _drainer is not None and _drainer.running:
+        return
+    _drainer = RingDrainer()
+    _drainer.running = True
+    _drainer.start()
+
+
+def stop_drainer() -> None:
+    """Stop the drainer and flush remaining ring entries synchronously."""
+    global _drainer
+    if _drainer is None:
+        return
+
+    _drainer.running = False
+    _drainer.join(timeout=5)
+    _drainer = None
+
+    # Forward anything still buffered so entries are not lost on shutdown
+    from .registry import MetricsRegistry
+
+    with _rings_lock:
+        rings = list(_rings)
+
+    for ring in rings:
+        for entry in ring.drain():
+            collector_name, name, value, metric_type, tags, unit, level = entry
+            try:
+                collector = MetricsRegistry.get_collector(collector_name)
+                kwargs = {"metric_type": metric_type, "tags": tags, "unit": unit}
+                if level is not None:
+                    kwargs["level"] = level
+                collector.record_metric(name, value, **kwargs)
+            except Exception as e:
+                logger.error("Error vaciando ring buffer al detener", error=str(e))
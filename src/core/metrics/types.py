@@ -5,7 +5,38 @@ Type definitions for the metrics system.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Sequence, Union
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    import json
+
+    _HAS_ORJSON = False
+
+try:
+    import numpy as np
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _aggregate_batch(values):
+        """Compiled count/sum/min/max reduction over a value array."""
+        total = 0.0
+        vmin = values[0]
+        vmax = values[0]
+        for v in values:
+            total += v
+            if v < vmin:
+                vmin = v
+            if v > vmax:
+                vmax = v
+        return total, vmin, vmax
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
 
 
 class MetricType(str, Enum):
@@ -33,8 +64,13 @@ class MetricLevel(str, Enum):
 MetricValue = Union[int, float]
 TagsDict = Dict[str, Union[str, int, float, bool]]
 
+# Valores de enum cacheados a nivel módulo: la serialización evita la
+# cadena de lookups .value por métrica
+_METRIC_TYPE_VALUES = {member: member.value for member in MetricType}
+_METRIC_LEVEL_VALUES = {member: member.value for member in MetricLevel}
+
 
-@dataclass
+@dataclass(slots=True)
 class Metric:
     """Representa una métrica individual."""
 
@@ -54,18 +90,42 @@ class Metric:
         return {
             "name": self.name,
             "value": float(self.value),
-            "metric_type": self.metric_type.value,
+            "metric_type": _METRIC_TYPE_VALUES[self.metric_type],
             "timestamp": self.timestamp.isoformat(),
             "tags": self.tags,
-            "level": self.level.value,
+            "level": _METRIC_LEVEL_VALUES[self.level],
+            "description": self.description,
+            "source": self.source,
+            "unit": self.unit,
+            "metadata": self.metadata,
+        }
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serializa directo a bytes JSON.
+
+        El timestamp viaja como int de nanosegundos epoch, evitando el
+        camino isoformat por métrica; con orjson instalado la
+        serialización corre en C, si no, cae a json estándar.
+        """
+        payload = {
+            "name": self.name,
+            "value": float(self.value),
+            "metric_type": _METRIC_TYPE_VALUES[self.metric_type],
+            "timestamp_ns": int(self.timestamp.timestamp() * 1_000_000_000),
+            "tags": self.tags,
+            "level": _METRIC_LEVEL_VALUES[self.level],
             "description": self.description,
             "source": self.source,
             "unit": self.unit,
             "metadata": self.metadata,
         }
+        if _HAS_ORJSON:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(payload).encode("utf-8")
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricAggregate:
     """Agregación de múltricas para análisis."""
 
@@ -82,17 +142,50 @@ class MetricAggregate:
 
     def update(self, metric: Metric) -> None:
         """Actualiza con nueva métrica."""
+        value = metric.value
+        timestamp = metric.timestamp
+
         self.count += 1
-        self.sum += metric.value
+        self.sum += value
+
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        self.avg = self.sum / self.count
+        self.last_value = value
+
+        self.first_seen = self.first_seen or timestamp
+        self.last_seen = timestamp
+
+    def update_batch(self, values: Sequence[float], timestamp: datetime) -> None:
+        """
+        Actualiza con un lote de valores de una sola vez.
+
+        Amortiza el overhead por-métrica sobre el lote completo; si numba
+        está disponible la reducción corre como kernel compilado, si no,
+        usa los builtins de C (sum/min/max).
+        """
+        if not values:
+            return
+
+        if _HAS_NUMBA:
+            total, vmin, vmax = _aggregate_batch(np.asarray(values, dtype=np.float64))
+        else:
+            total = sum(values)
+            vmin = min(values)
+            vmax = max(values)
+
+        self.count += len(values)
+        self.sum += total
 
-        if metric.value < self.min:
-            self.min = metric.value
-        if metric.value > self.max:
-            self.max = metric.value
+        if vmin < self.min:
+            self.min = vmin
+        if vmax > self.max:
+            self.max = vmax
 
         self.avg = self.sum / self.count
-        self.last_value = metric.value
+        self.last_value = values[-1]
 
         if not self.first_seen:
-            self.first_seen = metric.timestamp
-        self.last_seen = metric.timestamp
+            self.first_seen = timestamp
+        self.last_seen = timestamp
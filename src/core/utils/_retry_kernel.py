@@ -0,0 +1,41 @@
+"""
+Kernel numérico para el cálculo de delays de reintento.
+
+Con numba instalado la aritmética corre compilada (cache=True paga el
+costo de compilación una sola vez); sin numba el fallback es la misma
+función en Python puro.
+"""
+
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+def _next_delay(current, jitter, jitter_unit, max_delay, backoff):
+    """
+    Calcula el próximo delay con jitter y backoff acotados.
+
+    Args:
+        current: Delay actual en segundos
+        jitter: Fracción de aleatoriedad configurada
+        jitter_unit: Valor uniforme en [-1, 1]
+        max_delay: Delay máximo permitido
+        backoff: Factor de multiplicación del delay
+
+    Returns:
+        Tupla (actual_delay, new_current)
+    """
+    jitter_amount = current * jitter
+    actual = current + jitter_amount * jitter_unit
+    actual = max(0.1, min(actual, max_delay))
+    new_current = min(current * backoff, max_delay)
+    return actual, new_current
+
+
+if _HAS_NUMBA:
+    next_delay = njit(cache=True, fastmath=True)(_next_delay)
+else:
+    next_delay = _next_delay
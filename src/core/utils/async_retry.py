@@ -27,16 +27,19 @@ def async_retry(
     """
 
     def decorator(func):
+        # Caso común de un solo tipo: evita iterar la tupla por excepción
+        catch = exceptions[0] if len(exceptions) == 1 else exceptions
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            attempt = 1
             current_delay = delay
+            _sleep = asyncio.sleep
 
-            while attempt <= max_attempts:
+            for attempt in range(1, max_attempts + 1):
                 try:
                     return await func(*args, **kwargs)
 
-                except exceptions as e:
+                except catch as e:
                     if attempt == max_attempts:
                         logger.error(
                             f" {func.__name__} falló después de {max_attempts} intentos async: {e}"
@@ -55,9 +58,8 @@ def async_retry(
                             logger.error(f"Error en on_retry callback: {callback_error}")
 
                     # Espera asíncrona
-                    await asyncio.sleep(current_delay)
+                    await _sleep(current_delay)
 
-                    attempt += 1
                     current_delay *= backoff
 
             # Nunca debería llegar aquí
@@ -21,16 +21,19 @@ def retry_context(
             conn = connect_to_database()
             cursor = conn.cursor()
     """
-    attempt = 1
     current_delay = delay
+    _sleep = time.sleep
 
-    while attempt <= max_attempts:
+    # Caso común de un solo tipo: evita iterar la tupla por excepción
+    catch = exceptions[0] if len(exceptions) == 1 else exceptions
+
+    for attempt in range(1, max_attempts + 1):
         try:
             # Si entramos aquí, el bloque se ejecutó sin excepciones
             yield
             return  # Salir exitosamente
 
-        except exceptions as e:
+        except catch as e:
             if attempt == max_attempts:
                 logger.error(f"  {operation_name} falló después de {max_attempts} intentos: {e}")
                 raise
@@ -40,6 +43,5 @@ def retry_context(
                 f"Reintentando en {current_delay}s... Error: {e}"
             )
 
-            time.sleep(current_delay)
-            attempt += 1
+            _sleep(current_delay)
             current_delay *= backoff
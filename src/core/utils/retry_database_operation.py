@@ -4,34 +4,52 @@ from typing import Callable
 
 from core import logger
 
+try:
+    import psycopg2
+except ImportError:
+    psycopg2 = None
 
-def retry_database_operation(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0):
-    """
-    Decorador especializado para operaciones de base de datos.
-    Captura excepciones comunes de bases de datos.
-    """
+try:
     import mysql.connector
-    import psycopg2
+except ImportError:
+    mysql = None
 
-    database_exceptions = (
-        psycopg2.OperationalError,
-        psycopg2.InterfaceError,
-        mysql.connector.Error,
+# Tupla de excepciones construida una sola vez al importar el módulo,
+# incluyendo solo los drivers realmente instalados
+DATABASE_EXCEPTIONS = tuple(
+    exc
+    for exc in (
+        psycopg2.OperationalError if psycopg2 else None,
+        psycopg2.InterfaceError if psycopg2 else None,
+        mysql.connector.Error if mysql else None,
         ConnectionError,
         TimeoutError,
     )
+    if exc is not None
+)
+
+
+def retry_database_operation(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0):
+    """
+    Decorador especializado para operaciones de base de datos.
+    Captura excepciones comunes de bases de datos.
+    """
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            attempt = 1
             current_delay = delay
+            _sleep = time.sleep
+
+            # Método ligado resuelto una sola vez: evita el probe de
+            # atributo en cada intento fallido
+            reset = getattr(args[0], "reset_connection", None) if args else None
 
-            while attempt <= max_attempts:
+            for attempt in range(1, max_attempts + 1):
                 try:
                     return func(*args, **kwargs)
 
-                except database_exceptions as e:
+                except DATABASE_EXCEPTIONS as e:
                     if attempt == max_attempts:
                         logger.error(
                             f" Operación de base de datos {func.__name__} falló después de {max_attempts} intentos: {e}"
@@ -44,14 +62,13 @@ def retry_database_operation(max_attempts: int = 3, delay: float = 1.0, backoff:
                     )
 
                     # Intentar resetear la conexión si es posible
-                    if hasattr(args[0], "reset_connection"):
+                    if reset is not None:
                         try:
-                            args[0].reset_connection()
+                            reset()
                         except Exception:
                             pass
 
-                    time.sleep(current_delay)
-                    attempt += 1
+                    _sleep(current_delay)
                     current_delay *= backoff
 
         return wrapper
@@ -4,8 +4,14 @@ import random
 import time
 from typing import Any, Callable, Optional, Tuple, Type
 
+from ._retry_kernel import next_delay
+
 logger = logging.getLogger(__name__)
 
+# Instancia propia de PRNG para el jitter: evita el estado global
+# compartido del módulo random en código con reintentos concurrentes
+_JITTER_RNG = random.Random()
+
 
 def retry_advanced(
     max_attempts: int = 3,
@@ -41,16 +47,29 @@ def retry_advanced(
     """
 
     def decorator(func: Callable) -> Callable:
+        # Timeout en nanosegundos enteros, calculado una sola vez
+        timeout_ns = int(timeout * 1e9) if timeout else None
+
+        # Caso común de un solo tipo: el except atrapa la clase directa
+        # sin iterar la tupla en cada excepción
+        catch = exceptions[0] if len(exceptions) == 1 else exceptions
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            start_time = time.time()
-            attempt = 1
+            _monotonic_ns = time.monotonic_ns
+            _sleep = time.sleep
+            start_ns = _monotonic_ns()
             current_delay = initial_delay
 
-            while attempt <= max_attempts:
+            # Jitter precalculado para todos los intentos en un solo paso,
+            # en lugar de llamar al PRNG en cada reintento
+            _rand = _JITTER_RNG.random
+            jitters = [2.0 * _rand() - 1.0 for _ in range(max_attempts)]
+
+            for attempt in range(1, max_attempts + 1):
                 try:
-                    # Verificar timeout global
-                    if timeout and (time.time() - start_time) > timeout:
+                    # Verificar timeout global (reloj monotónico, compara enteros)
+                    if timeout_ns is not None and (_monotonic_ns() - start_ns) > timeout_ns:
                         raise TimeoutError(f"Timeout global de {timeout}s excedido")
 
                     # Intentar ejecutar la función
@@ -59,14 +78,14 @@ def retry_advanced(
                     # Ejecutar callback de éxito si existe
                     if on_success:
                         try:
-                            duration = time.time() - start_time
+                            duration = (_monotonic_ns() - start_ns) * 1e-9
                             on_success(result, duration)
                         except Exception as e:
                             logger.warning(f"Error en on_success callback: {e}")
 
                     return result
 
-                except exceptions as e:
+                except catch as e:
                     # Verificar si debemos reintentar basado en el predicado
                     if retry_predicate and not retry_predicate(e):
                         logger.info(f"No se reintenta {func.__name__}: {e}")
@@ -76,7 +95,8 @@ def retry_advanced(
                     if attempt == max_attempts:
                         logger.error(
                             f" {func.__name__} falló definitivamente después de {max_attempts} intentos. "
-                            f"Duración total: {time.time() - start_time:.2f}s. Error: {type(e).__name__}: {e}"
+                            f"Duración total: {(_monotonic_ns() - start_ns) * 1e-9:.2f}s. "
+                            f"Error: {type(e).__name__}: {e}"
                         )
 
                         # Ejecutar callback de fallo
@@ -88,10 +108,11 @@ def retry_advanced(
 
                         raise
 
-                    # Calcular próximo delay con jitter
-                    jitter_amount = current_delay * jitter
-                    actual_delay = current_delay + (jitter_amount * (2 * random.random() - 1))
-                    actual_delay = max(0.1, min(actual_delay, max_delay))
+                    # Calcular próximo delay con jitter (kernel compilado
+                    # si numba está disponible)
+                    actual_delay, next_current = next_delay(
+                        current_delay, jitter, jitters[attempt - 1], max_delay, backoff_factor
+                    )
 
                     # Log del reintento
                     logger.warning(
@@ -108,11 +129,10 @@ def retry_advanced(
                             logger.error(f"Error en on_retry callback: {callback_error}")
 
                     # Esperar antes del siguiente intento
-                    time.sleep(actual_delay)
+                    _sleep(actual_delay)
 
                     # Actualizar para próximo intento
-                    attempt += 1
-                    current_delay = min(current_delay * backoff_factor, max_delay)
+                    current_delay = next_current
 
                 except Exception as e:
                     # Capturar cualquier otra excepción no esperada
@@ -3,7 +3,7 @@ Base validators and decorators.
 """
 
 import inspect
-from typing import Any, Callable, List
+from typing import Any, Callable, List, Optional
 
 
 def validate_with(validator_func: Callable, error_message: str = "Validation failed"):
@@ -12,6 +12,11 @@ def validate_with(validator_func: Callable, error_message: str = "Validation fai
     """
 
     def decorator(func):
+        # Sin validador no hay nada que envolver: se devuelve la función
+        # original y desaparece el frame extra por llamada
+        if validator_func is None:
+            return func
+
         def wrapper(*args, **kwargs):
             for arg in args:
                 if not validator_func(arg):
@@ -34,17 +39,71 @@ def validate_arguments(**validators):
     """
 
     def decorator(func):
+        # La firma se analiza una sola vez al decorar: nombres
+        # posicionales, defaults y los validadores que realmente aplican
         sig = inspect.signature(func)
+        positional_names = [
+            p.name
+            for p in sig.parameters.values()
+            if p.kind
+            in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        ]
+        defaults = {
+            p.name: p.default
+            for p in sig.parameters.values()
+            if p.default is not inspect.Parameter.empty
+        }
+        relevant = {name: validators[name] for name in validators if name in sig.parameters}
+        has_varargs = any(
+            p.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+            for p in sig.parameters.values()
+        )
+
+        # Sin validadores aplicables no hay nada que envolver
+        if not relevant:
+            return func
+
+        if has_varargs:
+            # Con *args/**kwargs el mapeo por índice no alcanza (los
+            # extras se agrupan en el parámetro vararg): acá se paga
+            # sig.bind por llamada para mantener la semántica original
+            def wrapper(*args, **kwargs):
+                bound = sig.bind(*args, **kwargs)
+                bound.apply_defaults()
+
+                for name, validator in relevant.items():
+                    if name in bound.arguments and not validator(bound.arguments[name]):
+                        raise ValueError(
+                            f"Invalid value for parameter '{name}': {bound.arguments[name]}"
+                        )
+
+                return func(*args, **kwargs)
+
+            return wrapper
 
         def wrapper(*args, **kwargs):
-            bound_args = sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-
-            for param_name, validator in validators.items():
-                if param_name in bound_args.arguments:
-                    value = bound_args.arguments[param_name]
+            # Indexación directa contra la lista de parámetros en lugar
+            # de sig.bind por llamada; zip corta en la lista más corta,
+            # así que args de más los rechaza la llamada a func
+            seen = set()
+            for name, value in zip(positional_names, args):
+                seen.add(name)
+                validator = relevant.get(name)
+                if validator is not None and not validator(value):
+                    raise ValueError(f"Invalid value for parameter '{name}': {value}")
+
+            for name, value in kwargs.items():
+                seen.add(name)
+                validator = relevant.get(name)
+                if validator is not None and not validator(value):
+                    raise ValueError(f"Invalid value for parameter '{name}': {value}")
+
+            # Defaults no provistos, igual que hacía apply_defaults
+            for name, validator in relevant.items():
+                if name not in seen and name in defaults:
+                    value = defaults[name]
                     if not validator(value):
-                        raise ValueError(f"Invalid value for parameter '{param_name}': {value}")
+                        raise ValueError(f"Invalid value for parameter '{name}': {value}")
 
             return func(*args, **kwargs)
 
@@ -55,32 +114,32 @@ def validate_arguments(**validators):
 
 def validate_all(*validators: Callable, value: Any) -> bool:
     """Aplica múltiples validadores a un valor."""
-    for validator in validators:
-        if not validator(value):
-            return False
-    return True
+    return all(validator(value) for validator in validators)
 
 
 def validate_any(*validators: Callable, value: Any) -> bool:
     """Valida si al menos un validador pasa."""
-    for validator in validators:
-        if validator(value):
-            return True
-    return False
+    return any(validator(value) for validator in validators)
 
 
-def get_validation_errors(*validators: Callable, value: Any) -> List[str]:
+def get_validation_errors(
+    *validators: Callable, value: Any, limit: Optional[int] = None
+) -> List[str]:
     """
     Obtiene mensajes de error de todos los validadores que fallan.
 
     Args:
         *validators: Pares (validator, error_message)
         value: Valor a validar
+        limit: Corta después de acumular esta cantidad de errores
+            (útil cuando al caller solo le importa el primero)
     """
     errors = []
 
     for validator, error_msg in validators:
         if not validator(value):
             errors.append(error_msg)
+            if limit is not None and len(errors) >= limit:
+                break
 
     return errors
@@ -0,0 +1,65 @@
+"""
+Validación columnar por lotes sobre DataFrames.
+
+pandas es una dependencia opcional: si no está instalado, la función
+falla con ImportError al ser llamada y el camino por-registro de
+log_validators sigue disponible.
+"""
+
+from typing import Any
+
+try:
+    import pandas as pd
+
+    _HAS_PANDAS = True
+except ImportError:
+    _HAS_PANDAS = False
+
+from .http_validators import VALID_HTTP_METHODS
+from .ip_validators import validate_ip_address
+from .timestamp_validators import validate_timestamp
+from .url_validators import validate_url
+
+
+def validate_log_dataframe(df: Any) -> "pd.DataFrame":
+    """
+    Valida un DataFrame de registros de log columna por columna.
+
+    Las columnas numéricas se chequean con operaciones vectorizadas y
+    las de strings con Series.map sobre los validadores memoizados
+    (lru_cache), así las IPs/URLs repetidas se validan una sola vez.
+
+    Args:
+        df: DataFrame con columnas timestamp, ip_address, http_method,
+            url y status_code
+
+    Returns:
+        DataFrame booleano con una columna por chequeo más la columna
+        'valid' combinada
+
+    Raises:
+        ImportError: Si pandas no está instalado
+    """
+    if not _HAS_PANDAS:
+        raise ImportError("pandas es requerido para validate_log_dataframe")
+
+    status_ok = pd.to_numeric(df["status_code"], errors="coerce").between(100, 599)
+
+    methods = df["http_method"]
+    method_ok = methods.isin(VALID_HTTP_METHODS) | methods.str.upper().isin(VALID_HTTP_METHODS)
+
+    ip_ok = df["ip_address"].map(validate_ip_address)
+    timestamp_ok = df["timestamp"].map(validate_timestamp)
+    url_ok = df["url"].map(validate_url)
+
+    result = pd.DataFrame(
+        {
+            "status_ok": status_ok,
+            "method_ok": method_ok,
+            "ip_ok": ip_ok,
+            "timestamp_ok": timestamp_ok,
+            "url_ok": url_ok,
+        }
+    )
+    result["valid"] = status_ok & method_ok & ip_ok & timestamp_ok & url_ok
+    return result
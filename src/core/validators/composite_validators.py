@@ -2,7 +2,10 @@
 Composite validators for common use cases.
 """
 
+import ipaddress
+from collections import OrderedDict
 from typing import Any, Dict, List
+from urllib.parse import urlparse
 
 from .http_validators import validate_http_method, validate_http_status
 from .ip_validators import validate_ip_address
@@ -26,43 +29,45 @@ class LogRecordValidator:
         "processing_time": {"type": float, "required": False, "min": 0},
     }
 
+    # Plan de chequeos semánticos precalculado: una tupla
+    # (campo, validador, plantilla de error) recorrida en una pasada
+    _SEMANTIC_CHECKS = (
+        ("timestamp", validate_timestamp, "Invalid timestamp format: {}"),
+        ("ip_address", validate_ip_address, "Invalid IP address: {}"),
+        ("http_method", validate_http_method, "Invalid HTTP method: {}"),
+        ("status_code", validate_http_status, "Invalid HTTP status code: {}"),
+        ("url", validate_http_url, "Invalid URL: {}"),
+    )
+
     def __init__(self, strict: bool = True):
         self.strict = strict
+        # Monomorfización por instancia: la rama strict se decide una
+        # sola vez acá y no en cada registro
+        self.validate = self._validate_strict if strict else self._validate_lenient
 
-    def validate(self, record: Dict[str, Any]) -> List[str]:
-        """Validate a log record."""
-        errors = []
-
-        # Schema validation
+    def _validate_strict(self, record: Dict[str, Any]) -> List[str]:
+        """Validate a log record (corta ante errores de esquema)."""
         schema_errors = validate_schema(record, self.LOG_SCHEMA)
-        errors.extend(schema_errors)
-
-        if errors and self.strict:
-            return errors
-
-        # Semantic validation
-        if "timestamp" in record:
-            if not validate_timestamp(record["timestamp"]):
-                errors.append(f"Invalid timestamp format: {record['timestamp']}")
+        if schema_errors:
+            return schema_errors
 
-        if "ip_address" in record:
-            if not validate_ip_address(record["ip_address"]):
-                errors.append(f"Invalid IP address: {record['ip_address']}")
-
-        if "http_method" in record:
-            if not validate_http_method(record["http_method"]):
-                errors.append(f"Invalid HTTP method: {record['http_method']}")
-
-        if "status_code" in record:
-            if not validate_http_status(record["status_code"]):
-                errors.append(f"Invalid HTTP status code: {record['status_code']}")
-
-        if "url" in record:
-            if not validate_http_url(record["url"]):
-                errors.append(f"Invalid URL: {record['url']}")
+        errors = []
+        self._run_semantic_checks(record, errors)
+        return errors
 
+    def _validate_lenient(self, record: Dict[str, Any]) -> List[str]:
+        """Validate a log record (acumula esquema + semántica)."""
+        errors = validate_schema(record, self.LOG_SCHEMA)
+        self._run_semantic_checks(record, errors)
         return errors
 
+    def _run_semantic_checks(self, record: Dict[str, Any], errors: List[str]) -> None:
+        get = record.get
+        for field, validator, template in self._SEMANTIC_CHECKS:
+            value = get(field)
+            if value is not None and not validator(value):
+                errors.append(template.format(value))
+
     def is_valid(self, record: Dict[str, Any]) -> bool:
         """Check if record is valid."""
         return len(self.validate(record)) == 0
@@ -81,34 +86,23 @@ class NetworkValidator:
             "errors": [],
         }
 
-        if not validate_ip_address(ip_string):
+        # Un solo parse: el mismo objeto decide la validez y aporta
+        # version/is_private/is_global
+        try:
+            ip = ipaddress.ip_address(ip_string)
+        except (ValueError, TypeError):
             result["errors"].append(f"Invalid IP address: {ip_string}")
             return result
 
         result["valid"] = True
-
-        try:
-            import ipaddress
-
-            ip = ipaddress.ip_address(ip_string)
-
-            if isinstance(ip, ipaddress.IPv4Address):
-                result["version"] = 4
-            else:
-                result["version"] = 6
-
-            result["is_private"] = ip.is_private
-            result["is_public"] = ip.is_global and not ip.is_private
-
-        except Exception as e:
-            result["errors"].append(f"Error analyzing IP: {e}")
+        result["version"] = ip.version
+        result["is_private"] = ip.is_private
+        result["is_public"] = ip.is_global and not ip.is_private
 
         return result
 
     def validate_url_with_components(self, url_string: str) -> Dict[str, Any]:
         """Validate URL and return parsed components."""
-        from urllib.parse import urlparse
-
         result = {
             "valid": False,
             "scheme": None,
@@ -123,37 +117,57 @@ class NetworkValidator:
             result["errors"].append(f"Invalid URL: {url_string}")
             return result
 
+        # validate_url ya garantizó que la URL parsea
+        parsed = urlparse(url_string)
         result["valid"] = True
-
-        try:
-            parsed = urlparse(url_string)
-            result["scheme"] = parsed.scheme
-            result["netloc"] = parsed.netloc
-            result["path"] = parsed.path
-            result["query"] = parsed.query
-            result["fragment"] = parsed.fragment
-
-        except Exception as e:
-            result["errors"].append(f"Error parsing URL: {e}")
+        result["scheme"] = parsed.scheme
+        result["netloc"] = parsed.netloc
+        result["path"] = parsed.path
+        result["query"] = parsed.query
+        result["fragment"] = parsed.fragment
 
         return result
 
 
 class ConfigValidator:
-    """Composite validator for configuration."""
+    """
+    Composite validator for configuration.
+
+    Los resultados se cachean por identidad del dict de config: validar
+    el mismo objeto sin cambios (recargas/startup repetidos) cuesta solo
+    un lookup. El cache asume que los configs no se mutan después de
+    validarse.
+    """
+
+    _CACHE_MAX = 16
 
     def __init__(self, schema: Dict[str, Any]):
         self.schema = schema
+        self._cache: "OrderedDict[int, tuple]" = OrderedDict()
+
+        # Plan por campo resuelto una sola vez: requeridos y la tupla
+        # (type, min, max) que _validate_field consultaba por llamada
+        self._required_fields = [
+            name for name, field_schema in schema.items() if field_schema.get("required", False)
+        ]
+        self._field_plans = {
+            name: (field_schema.get("type"), field_schema.get("min"), field_schema.get("max"))
+            for name, field_schema in schema.items()
+        }
 
     def validate(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Validate configuration with detailed results."""
+        cache_key = id(config)
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] is config:
+            self._cache.move_to_end(cache_key)
+            return self._copy_result(cached[1])
+
         result = {"valid": False, "errors": [], "warnings": [], "missing": [], "invalid": []}
 
         # Check required fields
-        for field_name, field_schema in self.schema.items():
-            is_required = field_schema.get("required", False)
-
-            if is_required and field_name not in config:
+        for field_name in self._required_fields:
+            if field_name not in config:
                 result["missing"].append(field_name)
 
         if result["missing"]:
@@ -163,35 +177,46 @@ class ConfigValidator:
             return result
 
         # Validate each field
+        plans = self._field_plans
         for field_name, field_value in config.items():
-            if field_name not in self.schema:
+            plan = plans.get(field_name)
+            if plan is None:
                 result["warnings"].append(f"Unknown field: {field_name}")
                 continue
 
-            field_schema = self.schema[field_name]
-            field_errors = self._validate_field(field_name, field_value, field_schema)
+            field_errors = self._validate_field(field_name, field_value, plan)
 
             if field_errors:
                 result["invalid"].append(field_name)
                 result["errors"].extend(field_errors)
 
         result["valid"] = len(result["errors"]) == 0
+
+        self._cache[cache_key] = (config, self._copy_result(result))
+        if len(self._cache) > self._CACHE_MAX:
+            self._cache.popitem(last=False)
+
         return result
 
-    def _validate_field(self, field_name: str, value: Any, schema: Dict[str, Any]) -> List[str]:
-        """Validate a single field."""
+    @staticmethod
+    def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copia defensiva: las listas del resultado no comparten estado."""
+        return {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in result.items()
+        }
+
+    def _validate_field(self, field_name: str, value: Any, plan: tuple) -> List[str]:
+        """Validate a single field against its precomputed plan."""
         errors = []
+        expected_type, min_val, max_val = plan
 
-        expected_type = schema.get("type")
         if expected_type and not isinstance(value, expected_type):
             errors.append(
                 f"{field_name}: Expected type {expected_type.__name__}, got {type(value).__name__}"
             )
 
         if isinstance(value, (int, float)):
-            min_val = schema.get("min")
-            max_val = schema.get("max")
-
             if min_val is not None and value < min_val:
                 errors.append(f"{field_name}: Value {value} is less than minimum {min_val}")
 
@@ -4,7 +4,14 @@ Valida archivos de configuración YAML y variables de entorno.
 """
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Prefijos de directorios de sistema: str.startswith acepta una tupla y
+# resuelve el OR en C
+_DANGEROUS_PREFIXES = ("/bin", "/usr", "/etc", "/sys", "/proc")
+
+# Niveles de logging válidos (membership directo antes de .upper())
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
 
 
 def validate_config_dict(
@@ -35,77 +42,56 @@ def validate_config_dict(
     if not config:
         raise ValueError("Config no puede estar vacío")
 
-    # Validar claves requeridas
+    # Validar claves requeridas: una sola caminata por clave obtiene
+    # existencia y valor a la vez
     if required_keys:
         for key in required_keys:
-            if not _has_nested_key(config, key):
+            found, value = _probe_nested(config, key.split("."))
+            if not found:
                 raise ValueError(f"Clave requerida faltante: '{key}'")
 
-            if strict:
-                value = _get_nested_value(config, key)
-                if value is None or value == "":
-                    raise ValueError(f"Clave '{key}' no puede estar vacía")
+            if strict and (value is None or value == ""):
+                raise ValueError(f"Clave '{key}' no puede estar vacía")
 
     return True
 
 
-def validate_database_config(config: Dict[str, Any]) -> bool:
-    """
-    Valida configuración específica de base de datos.
-
-    Args:
-        config: Diccionario con configuración de BD
-
-    Returns:
-        bool: True si la configuración es válida
-
-    Raises:
-        ValueError: Si la configuración es inválida
-
-    Example:
-        >>> db_config = {
-        ...     'host': 'localhost',
-        ...     'port': 5432,
-        ...     'name': 'etl_db',
-        ...     'user': 'postgres'
-        ... }
-        >>> validate_database_config(db_config)
-        True
-    """
+def _check_database_config(config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Variante sin excepciones: devuelve (ok, mensaje de error)."""
     required_keys = ["host", "port", "name", "user"]
 
     for key in required_keys:
         if key not in config:
-            raise ValueError(f"Configuración de BD faltante: '{key}'")
+            return False, (f"Configuración de BD faltante: '{key}'")
 
         if not config[key]:
-            raise ValueError(f"Configuración de BD '{key}' no puede estar vacía")
+            return False, (f"Configuración de BD '{key}' no puede estar vacía")
 
     # Validar tipos específicos
-    if not isinstance(config["port"], int):
-        raise ValueError(f"Puerto debe ser entero, recibido: {type(config['port'])}")
+    if type(config["port"]) is not int:
+        return False, (f"Puerto debe ser entero, recibido: {type(config['port'])}")
 
     if not (1 <= config["port"] <= 65535):
-        raise ValueError(f"Puerto inválido: {config['port']} (debe estar entre 1-65535)")
+        return False, (f"Puerto inválido: {config['port']} (debe estar entre 1-65535)")
 
     # Validar campos opcionales si existen
     if "pool_size" in config:
-        if not isinstance(config["pool_size"], int) or config["pool_size"] < 1:
-            raise ValueError(f"pool_size inválido: {config.get('pool_size')}")
+        if type(config["pool_size"]) is not int or config["pool_size"] < 1:
+            return False, (f"pool_size inválido: {config.get('pool_size')}")
 
     if "timeout" in config:
-        if not isinstance(config["timeout"], (int, float)) or config["timeout"] <= 0:
-            raise ValueError(f"timeout inválido: {config.get('timeout')}")
+        if type(config["timeout"]) not in (int, float) or config["timeout"] <= 0:
+            return False, (f"timeout inválido: {config.get('timeout')}")
 
-    return True
+    return True, None
 
 
-def validate_processing_config(config: Dict[str, Any]) -> bool:
+def validate_database_config(config: Dict[str, Any]) -> bool:
     """
-    Valida configuración de procesamiento ETL.
+    Valida configuración específica de base de datos.
 
     Args:
-        config: Diccionario con configuración de procesamiento
+        config: Diccionario con configuración de BD
 
     Returns:
         bool: True si la configuración es válida
@@ -114,72 +100,98 @@ def validate_processing_config(config: Dict[str, Any]) -> bool:
         ValueError: Si la configuración es inválida
 
     Example:
-        >>> proc_config = {
-        ...     'batch_size': 1000,
-        ...     'max_workers': 4,
-        ...     'chunk_size': 10000
+        >>> db_config = {
+        ...     'host': 'localhost',
+        ...     'port': 5432,
+        ...     'name': 'etl_db',
+        ...     'user': 'postgres'
         ... }
-        >>> validate_processing_config(proc_config)
+        >>> validate_database_config(db_config)
         True
     """
+    ok, error = _check_database_config(config)
+    if not ok:
+        raise ValueError(error)
+    return True
+
+
+def _check_processing_config(config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Variante sin excepciones: devuelve (ok, mensaje de error)."""
     # Validar batch_size
     if "batch_size" in config:
         batch_size = config["batch_size"]
-        if not isinstance(batch_size, int) or batch_size < 1:
-            raise ValueError(f"batch_size debe ser entero positivo: {batch_size}")
+        if type(batch_size) is not int or batch_size < 1:
+            return False, (f"batch_size debe ser entero positivo: {batch_size}")
 
         if batch_size > 100000:
-            raise ValueError(f"batch_size muy grande: {batch_size} (máximo recomendado: 100000)")
+            return False, (f"batch_size muy grande: {batch_size} (máximo recomendado: 100000)")
 
     # Validar max_workers
     if "max_workers" in config:
         max_workers = config["max_workers"]
-        if not isinstance(max_workers, int) or max_workers < 1:
-            raise ValueError(f"max_workers debe ser entero positivo: {max_workers}")
+        if type(max_workers) is not int or max_workers < 1:
+            return False, (f"max_workers debe ser entero positivo: {max_workers}")
 
         if max_workers > 32:
-            raise ValueError(f"max_workers muy grande: {max_workers} (máximo recomendado: 32)")
+            return False, (f"max_workers muy grande: {max_workers} (máximo recomendado: 32)")
 
     # Validar chunk_size
     if "chunk_size" in config:
         chunk_size = config["chunk_size"]
-        if not isinstance(chunk_size, int) or chunk_size < 1:
-            raise ValueError(f"chunk_size debe ser entero positivo: {chunk_size}")
+        if type(chunk_size) is not int or chunk_size < 1:
+            return False, (f"chunk_size debe ser entero positivo: {chunk_size}")
 
     # Validar retry_attempts
     if "retry_attempts" in config:
         retry = config["retry_attempts"]
-        if not isinstance(retry, int) or retry < 0:
-            raise ValueError(f"retry_attempts debe ser entero no negativo: {retry}")
+        if type(retry) is not int or retry < 0:
+            return False, (f"retry_attempts debe ser entero no negativo: {retry}")
 
         if retry > 10:
-            raise ValueError(f"retry_attempts muy grande: {retry} (máximo recomendado: 10)")
+            return False, (f"retry_attempts muy grande: {retry} (máximo recomendado: 10)")
 
-    return True
+    return True, None
 
 
-def validate_logging_config(config: Dict[str, Any]) -> bool:
+def validate_processing_config(config: Dict[str, Any]) -> bool:
     """
-    Valida configuración de logging.
+    Valida configuración de procesamiento ETL.
 
     Args:
-        config: Diccionario con configuración de logging
+        config: Diccionario con configuración de procesamiento
 
     Returns:
         bool: True si la configuración es válida
 
     Raises:
         ValueError: Si la configuración es inválida
+
+    Example:
+        >>> proc_config = {
+        ...     'batch_size': 1000,
+        ...     'max_workers': 4,
+        ...     'chunk_size': 10000
+        ... }
+        >>> validate_processing_config(proc_config)
+        True
     """
-    valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
+    ok, error = _check_processing_config(config)
+    if not ok:
+        raise ValueError(error)
+    return True
 
+
+def _check_logging_config(config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Variante sin excepciones: devuelve (ok, mensaje de error)."""
     if "level" in config:
-        level = config["level"].upper() if isinstance(config["level"], str) else config["level"]
-        if level not in valid_levels:
-            raise ValueError(
-                f"Nivel de logging inválido: '{config['level']}'. "
-                f"Valores válidos: {valid_levels}"
-            )
+        level = config["level"]
+        if level not in _VALID_LOG_LEVELS:
+            level = level.upper() if isinstance(level, str) else level
+            if level not in _VALID_LOG_LEVELS:
+                return False, (
+                    f"Nivel de logging inválido: '{config['level']}'. "
+                    f"Valores válidos: {set(_VALID_LOG_LEVELS)}"
+                )
 
     if "log_file" in config:
         log_file = Path(config["log_file"])
@@ -188,27 +200,27 @@ def validate_logging_config(config: Dict[str, Any]) -> bool:
             try:
                 log_file.parent.mkdir(parents=True, exist_ok=True)
             except Exception as e:
-                raise ValueError(f"No se puede crear directorio de logs: {e}")
+                return False, (f"No se puede crear directorio de logs: {e}")
 
     if "max_file_size_mb" in config:
         size = config["max_file_size_mb"]
-        if not isinstance(size, (int, float)) or size <= 0:
-            raise ValueError(f"max_file_size_mb inválido: {size}")
+        if type(size) not in (int, float) or size <= 0:
+            return False, (f"max_file_size_mb inválido: {size}")
 
     if "backup_count" in config:
         count = config["backup_count"]
-        if not isinstance(count, int) or count < 0:
-            raise ValueError(f"backup_count inválido: {count}")
+        if type(count) is not int or count < 0:
+            return False, (f"backup_count inválido: {count}")
 
-    return True
+    return True, None
 
 
-def validate_file_paths_config(config: Dict[str, Any]) -> bool:
+def validate_logging_config(config: Dict[str, Any]) -> bool:
     """
-    Valida configuración de rutas de archivos.
+    Valida configuración de logging.
 
     Args:
-        config: Diccionario con configuración de paths
+        config: Diccionario con configuración de logging
 
     Returns:
         bool: True si la configuración es válida
@@ -216,6 +228,14 @@ def validate_file_paths_config(config: Dict[str, Any]) -> bool:
     Raises:
         ValueError: Si la configuración es inválida
     """
+    ok, error = _check_logging_config(config)
+    if not ok:
+        raise ValueError(error)
+    return True
+
+
+def _check_file_paths_config(config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Variante sin excepciones: devuelve (ok, mensaje de error)."""
     path_keys = ["input_dir", "output_dir", "processed_dir", "failed_dir", "checkpoint_dir"]
 
     for key in path_keys:
@@ -223,20 +243,37 @@ def validate_file_paths_config(config: Dict[str, Any]) -> bool:
             path_str = config[key]
 
             if not isinstance(path_str, str):
-                raise ValueError(f"{key} debe ser string, recibido: {type(path_str)}")
+                return False, (f"{key} debe ser string, recibido: {type(path_str)}")
 
             if not path_str.strip():
-                raise ValueError(f"{key} no puede estar vacío")
+                return False, (f"{key} no puede estar vacío")
 
             path = Path(path_str)
 
-            # Validar que no sea ruta absoluta peligrosa
-            if path.is_absolute():
-                # Permitir rutas absolutas pero advertir sobre rutas de sistema
-                dangerous_paths = ["/bin", "/usr", "/etc", "/sys", "/proc"]
-                if any(str(path).startswith(dp) for dp in dangerous_paths):
-                    raise ValueError(f"{key} apunta a directorio de sistema: {path}")
+            # Validar que no sea ruta absoluta peligrosa (se permiten
+            # rutas absolutas, pero no de sistema)
+            if path.is_absolute() and str(path).startswith(_DANGEROUS_PREFIXES):
+                return False, (f"{key} apunta a directorio de sistema: {path}")
+
+    return True, None
+
+
+def validate_file_paths_config(config: Dict[str, Any]) -> bool:
+    """
+    Valida configuración de rutas de archivos.
 
+    Args:
+        config: Diccionario con configuración de paths
+
+    Returns:
+        bool: True si la configuración es válida
+
+    Raises:
+        ValueError: Si la configuración es inválida
+    """
+    ok, error = _check_file_paths_config(config)
+    if not ok:
+        raise ValueError(error)
     return True
 
 
@@ -286,39 +323,47 @@ def validate_env_vars(
     return True
 
 
-def validate_metrics_config(config: Dict[str, Any]) -> bool:
-    """
-    Valida configuración de métricas.
-
-    Args:
-        config: Diccionario con configuración de métricas
-
-    Returns:
-        bool: True si la configuración es válida
-
-    Raises:
-        ValueError: Si la configuración es inválida
-    """
+def _check_metrics_config(config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Variante sin excepciones: devuelve (ok, mensaje de error)."""
     if "collection_interval_seconds" in config:
         interval = config["collection_interval_seconds"]
-        if not isinstance(interval, (int, float)) or interval <= 0:
-            raise ValueError(f"collection_interval_seconds inválido: {interval}")
+        if type(interval) not in (int, float) or interval <= 0:
+            return False, (f"collection_interval_seconds inválido: {interval}")
 
         if interval < 1:
-            raise ValueError(
+            return False, (
                 f"collection_interval_seconds muy pequeño: {interval} "
                 "(mínimo recomendado: 1 segundo)"
             )
 
     if "enable_prometheus" in config:
         if not isinstance(config["enable_prometheus"], bool):
-            raise ValueError(f"enable_prometheus debe ser booleano: {config['enable_prometheus']}")
+            return False, (f"enable_prometheus debe ser booleano: {config['enable_prometheus']}")
 
     if "prometheus_port" in config:
         port = config["prometheus_port"]
-        if not isinstance(port, int) or not (1024 <= port <= 65535):
-            raise ValueError(f"prometheus_port inválido: {port} (debe estar entre 1024-65535)")
+        if type(port) is not int or not (1024 <= port <= 65535):
+            return False, (f"prometheus_port inválido: {port} (debe estar entre 1024-65535)")
+
+    return True, None
+
+
+def validate_metrics_config(config: Dict[str, Any]) -> bool:
+    """
+    Valida configuración de métricas.
+
+    Args:
+        config: Diccionario con configuración de métricas
+
+    Returns:
+        bool: True si la configuración es válida
 
+    Raises:
+        ValueError: Si la configuración es inválida
+    """
+    ok, error = _check_metrics_config(config)
+    if not ok:
+        raise ValueError(error)
     return True
 
 
@@ -344,45 +389,22 @@ def validate_full_config(config: Dict[str, Any]) -> Dict[str, bool]:
     """
     results = {}
 
-    # Validar sección database
-    if "database" in config:
-        try:
-            results["database"] = validate_database_config(config["database"])
-        except ValueError as e:
-            results["database"] = False
-            results["database_error"] = str(e)
-
-    # Validar sección processing
-    if "processing" in config:
-        try:
-            results["processing"] = validate_processing_config(config["processing"])
-        except ValueError as e:
-            results["processing"] = False
-            results["processing_error"] = str(e)
-
-    # Validar sección logging
-    if "logging" in config:
-        try:
-            results["logging"] = validate_logging_config(config["logging"])
-        except ValueError as e:
-            results["logging"] = False
-            results["logging_error"] = str(e)
-
-    # Validar sección files
-    if "files" in config:
-        try:
-            results["files"] = validate_file_paths_config(config["files"])
-        except ValueError as e:
-            results["files"] = False
-            results["files_error"] = str(e)
-
-    # Validar sección metrics
-    if "metrics" in config:
-        try:
-            results["metrics"] = validate_metrics_config(config["metrics"])
-        except ValueError as e:
-            results["metrics"] = False
-            results["metrics_error"] = str(e)
+    # Las variantes _check_* devuelven (ok, error) sin construir
+    # excepciones para los caminos inválidos esperados
+    sections = (
+        ("database", _check_database_config),
+        ("processing", _check_processing_config),
+        ("logging", _check_logging_config),
+        ("files", _check_file_paths_config),
+        ("metrics", _check_metrics_config),
+    )
+
+    for section, checker in sections:
+        if section in config:
+            ok, error = checker(config[section])
+            results[section] = ok
+            if not ok:
+                results[f"{section}_error"] = error
 
     return results
 
@@ -390,6 +412,27 @@ def validate_full_config(config: Dict[str, Any]) -> Dict[str, bool]:
 # ========== FUNCIONES AUXILIARES PRIVADAS ==========
 
 
+def _probe_nested(data: Dict[str, Any], parts: List[str]) -> tuple:
+    """
+    Camina una ruta anidada ya dividida devolviendo (found, value).
+
+    Args:
+        data: Diccionario a buscar
+        parts: Segmentos de la ruta (resultado de key.split('.'))
+
+    Returns:
+        tuple: (True, valor) si la clave existe, (False, None) si no
+    """
+    current = data
+
+    for part in parts:
+        if not isinstance(current, dict) or part not in current:
+            return False, None
+        current = current[part]
+
+    return True, current
+
+
 def _has_nested_key(data: Dict[str, Any], key_path: str) -> bool:
     """
     Verifica si existe una clave anidada usando dot notation.
@@ -5,17 +5,19 @@ HTTP protocol validators.
 from typing import Optional, Union
 
 # Métodos HTTP válidos
-VALID_HTTP_METHODS = {
-    "GET",
-    "POST",
-    "PUT",
-    "DELETE",
-    "HEAD",
-    "OPTIONS",
-    "PATCH",
-    "TRACE",
-    "CONNECT",
-}
+VALID_HTTP_METHODS = frozenset(
+    {
+        "GET",
+        "POST",
+        "PUT",
+        "DELETE",
+        "HEAD",
+        "OPTIONS",
+        "PATCH",
+        "TRACE",
+        "CONNECT",
+    }
+)
 
 # Códigos de estado HTTP por categoría
 HTTP_STATUS_CATEGORIES = {
@@ -26,17 +28,36 @@ HTTP_STATUS_CATEGORIES = {
     "server_error": range(500, 600),
 }
 
+# Despacho aritmético: la categoría se indexa por code // 100 sin
+# iterar el dict de rangos
+_CATEGORY_BY_HUNDREDS = (
+    None,
+    "informational",
+    "success",
+    "redirection",
+    "client_error",
+    "server_error",
+)
+
 
 def validate_http_method(method: str) -> bool:
     """Valida un método HTTP."""
+    # El guard de tipo va fuera de todo cache: lru_cache levanta
+    # TypeError con argumentos no hasheables antes del isinstance.
+    # Con el guard hecho, el membership en frozenset ya es más barato
+    # que un probe de cache, así que no hay camino memoizado.
     if not method or not isinstance(method, str):
         return False
 
-    return method.upper() in VALID_HTTP_METHODS
+    # Membership directo primero: los logs bien formados ya vienen en
+    # mayúsculas, así que .upper() casi nunca necesita alocar
+    return method in VALID_HTTP_METHODS or method.upper() in VALID_HTTP_METHODS
 
 
 def validate_http_status(status_code: Union[int, str]) -> bool:
     """Valida un código de estado HTTP."""
+    # Sin lru_cache: además del problema de hasheabilidad, int() más la
+    # comparación de rango cuestan menos que el probe del cache
     try:
         code = int(status_code)
         return 100 <= code <= 599
@@ -46,27 +67,20 @@ def validate_http_status(status_code: Union[int, str]) -> bool:
 
 def validate_http_status_category(status_code: Union[int, str], category: str) -> bool:
     """Valida que un código de estado pertenezca a una categoría específica."""
-    if category not in HTTP_STATUS_CATEGORIES:
-        return False
-
     try:
         code = int(status_code)
-        return code in HTTP_STATUS_CATEGORIES[category]
     except (ValueError, TypeError):
         return False
 
+    if not 100 <= code <= 599:
+        return False
+
+    return category == _CATEGORY_BY_HUNDREDS[code // 100]
+
 
 def get_http_status_category(status_code: Union[int, str]) -> Optional[str]:
     """Obtiene la categoría de un código de estado HTTP."""
     if not validate_http_status(status_code):
         return None
 
-    try:
-        code = int(status_code)
-        for category, code_range in HTTP_STATUS_CATEGORIES.items():
-            if code in code_range:
-                return category
-    except (ValueError, TypeError):
-        pass
-
-    return None
+    return _CATEGORY_BY_HUNDREDS[int(status_code) // 100]
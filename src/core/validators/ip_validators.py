@@ -3,6 +3,9 @@ IP address validators (IPv4, IPv6).
 """
 
 import ipaddress
+import re
+import socket
+from functools import lru_cache
 from typing import Optional
 
 # Patrones regex
@@ -12,25 +15,45 @@ IPV4_PATTERN = (
 IPV6_PATTERN = r"^(([0-9a-fA-F]{1,4}:){7,7}[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,7}:|([0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,5}(:[0-9a-fA-F]{1,4}){1,2}|([0-9a-fA-F]{1,4}:){1,4}(:[0-9a-fA-F]{1,4}){1,3}|([0-9a-fA-F]{1,4}:){1,3}(:[0-9a-fA-F]{1,4}){1,4}|([0-9a-fA-F]{1,4}:){1,2}(:[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:((:[0-9a-fA-F]{1,4}){1,6})|:((:[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(:[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(ffff(:0{1,4}){0,1}:){0,1}((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])|([0-9a-fA-F]{1,4}:){1,4}:((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9]))$"
 
 
+# Solo el patrón IPv6 se compila: inet_pton ya cubre por completo la
+# validación estructural de IPv4, así que compilar IPV4_PATTERN sería
+# trabajo de import muerto. Los strings siguen exportados como API.
+_IPV6_RE = re.compile(IPV6_PATTERN, re.ASCII)
+
+
 def validate_ip_address(ip_string: str, version: Optional[int] = None) -> bool:
     """Valida una dirección IP (IPv4 o IPv6)."""
+    # El guard de tipo va fuera del cache: lru_cache levanta TypeError
+    # con argumentos no hasheables antes de llegar al isinstance
     if not ip_string or not isinstance(ip_string, str):
         return False
 
-    try:
-        ip = ipaddress.ip_address(ip_string)
+    return _validate_ip_cached(ip_string, version)
+
 
-        if version is None:
+@lru_cache(maxsize=4096)
+def _validate_ip_cached(ip_string: str, version: Optional[int]) -> bool:
+    """Camino memoizado de validate_ip_address (solo llega con str)."""
+    # Camino rápido: inet_pton es una rutina C estricta, mucho más
+    # barata que ipaddress.ip_address y sin costo de excepción Python
+    # para el caso válido
+    if version == 4 or (version is None and ":" not in ip_string):
+        try:
+            socket.inet_pton(socket.AF_INET, ip_string)
             return True
-        elif version == 4:
-            return isinstance(ip, ipaddress.IPv4Address)
-        elif version == 6:
-            return isinstance(ip, ipaddress.IPv6Address)
-        else:
+        except OSError:
             return False
 
-    except (ValueError, ipaddress.AddressValueError):
-        return False
+    if version == 6 or version is None:
+        try:
+            socket.inet_pton(socket.AF_INET6, ip_string)
+            return True
+        except OSError:
+            # inet_pton no entiende zone-ids (fe80::1%eth0); el regex
+            # precompilado los cubre sin pasar por ipaddress
+            return bool(_IPV6_RE.match(ip_string))
+
+    return False
 
 
 def validate_ipv4(ip_string: str) -> bool:
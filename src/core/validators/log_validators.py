@@ -6,14 +6,32 @@ import json
 import re
 from typing import Any, Dict, List
 
+try:
+    import hyperscan
+
+    _HAS_HYPERSCAN = True
+except ImportError:
+    _HAS_HYPERSCAN = False
+
+from .http_validators import validate_http_method, validate_http_status
+from .ip_validators import validate_ip_address
+from .timestamp_validators import validate_timestamp
+from .url_validators import validate_url
+
+
+# Patrones compilados una sola vez al cargar el módulo; toleran el
+# newline final para evitar el strip() por línea
+_FORMAT_RES = {
+    "apache": re.compile(r'^(\S+) (\S+) (\S+) \[([^\]]+)\] "(\S+) (\S+) (\S+)" (\d+) (\d+)\s*$'),
+    "nginx": re.compile(r'^(\S+) - (\S+) \[([^\]]+)\] "(\S+) (\S+) (\S+)" (\d+) (\d+)'),
+}
+
 
 def validate_log_format(log_line: str, format_type: str = "apache") -> bool:
     """Valida el formato de una línea de log."""
     if not log_line or not isinstance(log_line, str):
         return False
 
-    log_line = log_line.strip()
-
     if format_type == "json":
         try:
             json.loads(log_line)
@@ -21,51 +39,116 @@ def validate_log_format(log_line: str, format_type: str = "apache") -> bool:
         except json.JSONDecodeError:
             return False
 
-    elif format_type == "apache":
-        apache_pattern = r'^(\S+) (\S+) (\S+) \[([^\]]+)\] "(\S+) (\S+) (\S+)" (\d+) (\d+)$'
-        return bool(re.match(apache_pattern, log_line))
+    pattern = _FORMAT_RES.get(format_type)
+    if pattern is not None:
+        return bool(pattern.match(log_line))
+
+    return bool(log_line.strip())
 
-    elif format_type == "nginx":
-        nginx_pattern = r'^(\S+) - (\S+) \[([^\]]+)\] "(\S+) (\S+) (\S+)" (\d+) (\d+)'
-        return bool(re.match(nginx_pattern, log_line))
 
-    else:
-        return bool(log_line)
+# Tabla (campo, validador, etiqueta de error) recorrida una sola vez
+# por registro; los imports viven a nivel módulo en vez de por llamada
+_FIELD_VALIDATORS = (
+    ("ip_address", validate_ip_address, "Invalid IP address"),
+    ("http_method", validate_http_method, "Invalid HTTP method"),
+    ("status_code", validate_http_status, "Invalid HTTP status"),
+    ("timestamp", validate_timestamp, "Invalid timestamp"),
+    ("url", validate_url, "Invalid URL"),
+)
 
 
 def validate_log_record(record: Dict[str, Any]) -> List[str]:
     """Valida un registro de log parseado."""
     errors = []
 
-    from .http_validators import validate_http_method, validate_http_status
-    from .ip_validators import validate_ip_address
-    from .timestamp_validators import validate_timestamp
-    from .url_validators import validate_url
-
-    required_fields = ["timestamp", "ip_address", "http_method", "url", "status_code"]
-
-    for field in required_fields:
+    for field in ("timestamp", "ip_address", "http_method", "url", "status_code"):
         if field not in record:
             errors.append(f"Missing required field: {field}")
 
-    if "ip_address" in record:
-        if not validate_ip_address(record["ip_address"]):
-            errors.append(f"Invalid IP address: {record['ip_address']}")
-
-    if "http_method" in record:
-        if not validate_http_method(record["http_method"]):
-            errors.append(f"Invalid HTTP method: {record['http_method']}")
+    for field, validator, label in _FIELD_VALIDATORS:
+        if field in record and not validator(record[field]):
+            errors.append(f"{label}: {record[field]}")
 
-    if "status_code" in record:
-        if not validate_http_status(record["status_code"]):
-            errors.append(f"Invalid HTTP status: {record['status_code']}")
-
-    if "timestamp" in record:
-        if not validate_timestamp(record["timestamp"]):
-            errors.append(f"Invalid timestamp: {record['timestamp']}")
+    return errors
 
-    if "url" in record:
-        if not validate_url(record["url"]):
-            errors.append(f"Invalid URL: {record['url']}")
 
-    return errors
+class BulkLogFormatValidator:
+    """
+    Validador de formato por lotes.
+
+    Con hyperscan instalado los patrones apache/nginx se compilan a una
+    base DFA y cada línea se escanea en C; sin hyperscan cae a los
+    patrones re precompilados del módulo.
+    """
+
+    _FORMAT_IDS = {"apache": 0, "nginx": 1}
+
+    def __init__(self):
+        self._db = None
+        if _HAS_HYPERSCAN:
+            self._db = hyperscan.Database()
+            self._db.compile(
+                expressions=[
+                    _FORMAT_RES["apache"].pattern.encode("utf-8"),
+                    _FORMAT_RES["nginx"].pattern.encode("utf-8"),
+                ],
+                ids=[0, 1],
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * 2,
+            )
+
+    def validate_many(self, lines: List[str], format_type: str = "apache") -> List[bool]:
+        """Valida el formato de un lote de líneas."""
+        if self._db is not None and format_type in self._FORMAT_IDS:
+            wanted = self._FORMAT_IDS[format_type]
+            results = []
+            for line in lines:
+                matched = [False]
+
+                def _on_match(pat_id, start, end, flags, context):
+                    if pat_id == wanted:
+                        matched[0] = True
+
+                self._db.scan(line.encode("utf-8"), match_event_handler=_on_match)
+                results.append(matched[0])
+            return results
+
+        _validate = validate_log_format
+        return [_validate(line, format_type) for line in lines]
+
+
+_REQUIRED_FIELDS = ("timestamp", "ip_address", "http_method", "url", "status_code")
+
+
+def validate_log_records_bulk(records: List[Dict[str, Any]]) -> List[bool]:
+    """
+    Valida un lote de registros en una sola pasada.
+
+    Devuelve un bool por registro en lugar de la lista de errores
+    detallada de validate_log_record: los validadores se resuelven una
+    sola vez como locales y el loop corre sin dispatch de imports ni
+    construcción de mensajes por registro, pensado para la etapa bulk
+    del pipeline.
+    """
+    _vip = validate_ip_address
+    _vmethod = validate_http_method
+    _vstatus = validate_http_status
+    _vts = validate_timestamp
+    _vurl = validate_url
+    _fields = _REQUIRED_FIELDS
+
+    results = []
+    append = results.append
+
+    for record in records:
+        get = record.get
+        valid = (
+            all(get(field) is not None for field in _fields)
+            and _vip(get("ip_address"))
+            and _vmethod(get("http_method"))
+            and _vstatus(get("status_code"))
+            and _vts(get("timestamp"))
+            and _vurl(get("url"))
+        )
+        append(valid)
+
+    return results
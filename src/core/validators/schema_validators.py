@@ -4,10 +4,25 @@ Data schema validators.
 
 import json
 import re
-from typing import Any, Dict, List, Union
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import fastjsonschema
+
+    _HAS_FASTJSONSCHEMA = True
+except ImportError:
+    _HAS_FASTJSONSCHEMA = False
+
 
 class ValidatorModel(BaseModel):
     """Base Pydantic model para validación de datos."""
@@ -17,38 +32,41 @@ class ValidatorModel(BaseModel):
         validate_assignment = True
 
 
-def validate_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> List[str]:
-    """Valida datos contra un esquema simple."""
-    errors = []
-
-    if not isinstance(data, dict):
-        return ["Data must be a dictionary"]
-
-    if not isinstance(schema, dict):
-        return ["Schema must be a dictionary"]
-
-    for field_name, field_schema in schema.items():
-        is_required = field_schema.get("required", False)
-        field_value = data.get(field_name)
-
-        if is_required and field_value is None:
-            errors.append(f"{field_name}: Field is required")
-            continue
-
+def _compile_field(field_name: str, field_schema: Dict[str, Any]) -> Callable:
+    """
+    Compila el esquema de un campo a un closure de chequeo.
+
+    Las claves del esquema (type, min, regex, etc.) se resuelven una
+    sola vez acá; el closure resultante solo ejecuta los chequeos con
+    las constantes ya ligadas, sin lookups de dict por llamada. Los
+    patrones regex quedan precompilados.
+    """
+    is_required = field_schema.get("required", False)
+    expected_type = field_schema.get("type")
+    min_val = field_schema.get("min")
+    max_val = field_schema.get("max")
+    min_len = field_schema.get("min_length")
+    max_len = field_schema.get("max_length")
+    pattern = field_schema.get("regex")
+    regex = re.compile(pattern) if pattern else None
+    allowed_values = field_schema.get("allowed")
+    nested_schema = field_schema.get("schema")
+
+    required_msg = f"{field_name}: Field is required"
+
+    def check(field_value: Any, errors: List[str]) -> None:
         if field_value is None:
-            continue
+            if is_required:
+                errors.append(required_msg)
+            return
 
-        expected_type = field_schema.get("type")
         if expected_type and not isinstance(field_value, expected_type):
             errors.append(
                 f"{field_name}: Expected type {expected_type.__name__}, got {type(field_value).__name__}"
             )
-            continue
+            return
 
         if isinstance(field_value, (int, float)):
-            min_val = field_schema.get("min")
-            max_val = field_schema.get("max")
-
             if min_val is not None and field_value < min_val:
                 errors.append(f"{field_name}: Value {field_value} is less than minimum {min_val}")
 
@@ -58,9 +76,6 @@ def validate_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> List[str]:
                 )
 
         if isinstance(field_value, (str, list)):
-            min_len = field_schema.get("min_length")
-            max_len = field_schema.get("max_length")
-
             if min_len is not None and len(field_value) < min_len:
                 errors.append(
                     f"{field_name}: Length {len(field_value)} is less than minimum {min_len}"
@@ -71,43 +86,123 @@ def validate_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> List[str]:
                     f"{field_name}: Length {len(field_value)} is greater than maximum {max_len}"
                 )
 
-        if isinstance(field_value, str):
-            pattern = field_schema.get("regex")
-            if pattern and not re.match(pattern, field_value):
-                errors.append(f"{field_name}: Value does not match pattern")
+        if regex is not None and isinstance(field_value, str) and not regex.match(field_value):
+            errors.append(f"{field_name}: Value does not match pattern")
 
-        allowed_values = field_schema.get("allowed")
         if allowed_values and field_value not in allowed_values:
             errors.append(
                 f"{field_name}: Value {field_value} not in allowed values {allowed_values}"
             )
 
-        nested_schema = field_schema.get("schema")
         if nested_schema and isinstance(field_value, dict):
             nested_errors = validate_schema(field_value, nested_schema)
             errors.extend([f"{field_name}.{error}" for error in nested_errors])
 
+    return check
+
+
+# Cache de planes compilados por identidad del dict de esquema (los
+# esquemas son constantes de módulo/clase, así que la identidad es
+# estable). Mismo patrón que el cache de ConfigValidator.
+_PLAN_CACHE: "OrderedDict[int, tuple]" = OrderedDict()
+_PLAN_CACHE_MAX = 32
+
+
+def _get_plan(schema: Dict[str, Any]) -> List[Tuple[str, Callable]]:
+    """Obtiene (o compila) el plan de chequeos de un esquema."""
+    cache_key = id(schema)
+    cached = _PLAN_CACHE.get(cache_key)
+    if cached is not None and cached[0] is schema:
+        _PLAN_CACHE.move_to_end(cache_key)
+        return cached[1]
+
+    plan = [
+        (field_name, _compile_field(field_name, field_schema))
+        for field_name, field_schema in schema.items()
+    ]
+
+    _PLAN_CACHE[cache_key] = (schema, plan)
+    if len(_PLAN_CACHE) > _PLAN_CACHE_MAX:
+        _PLAN_CACHE.popitem(last=False)
+
+    return plan
+
+
+def validate_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> List[str]:
+    """Valida datos contra un esquema simple."""
+    if not isinstance(data, dict):
+        return ["Data must be a dictionary"]
+
+    if not isinstance(schema, dict):
+        return ["Schema must be a dictionary"]
+
+    errors: List[str] = []
+    get = data.get
+
+    for field_name, check in _get_plan(schema):
+        check(get(field_name), errors)
+
     return errors
 
 
+# Validadores JSON Schema compilados por identidad del esquema (solo
+# con fastjsonschema disponible)
+_JSON_VALIDATOR_CACHE: "OrderedDict[int, tuple]" = OrderedDict()
+_JSON_VALIDATOR_CACHE_MAX = 32
+
+
+def _get_json_validator(schema: Dict[str, Any]) -> Callable:
+    """Obtiene (o compila) el validador fastjsonschema de un esquema."""
+    cache_key = id(schema)
+    cached = _JSON_VALIDATOR_CACHE.get(cache_key)
+    if cached is not None and cached[0] is schema:
+        _JSON_VALIDATOR_CACHE.move_to_end(cache_key)
+        return cached[1]
+
+    validator = fastjsonschema.compile(schema)
+
+    _JSON_VALIDATOR_CACHE[cache_key] = (schema, validator)
+    if len(_JSON_VALIDATOR_CACHE) > _JSON_VALIDATOR_CACHE_MAX:
+        _JSON_VALIDATOR_CACHE.popitem(last=False)
+
+    return validator
+
+
 def validate_json_schema(json_data: Union[str, Dict], schema: Dict[str, Any]) -> List[str]:
-    """Valida JSON contra un esquema JSON Schema."""
+    """
+    Valida JSON contra un esquema JSON Schema.
+
+    Con orjson instalado el parseo corre en su loads nativo; con
+    fastjsonschema, el esquema se compila una vez a código Python plano
+    en lugar del tree-walk interpretado de jsonschema. Ambos son
+    opcionales: sin ellos se usa json/jsonschema como siempre.
+    """
+    try:
+        if isinstance(json_data, str):
+            data = orjson.loads(json_data) if _HAS_ORJSON else json.loads(json_data)
+        else:
+            data = json_data
+    except json.JSONDecodeError as e:
+        return [f"Invalid JSON: {str(e)}"]
+
+    if _HAS_FASTJSONSCHEMA:
+        try:
+            _get_json_validator(schema)(data)
+            return []
+        except fastjsonschema.JsonSchemaException as e:
+            return [f"Validation error: {e.message}"]
+        except Exception as e:
+            return [f"Validation error: {str(e)}"]
+
     try:
         import jsonschema
     except ImportError:
         return ["jsonschema package is required for JSON schema validation"]
 
     try:
-        if isinstance(json_data, str):
-            data = json.loads(json_data)
-        else:
-            data = json_data
-
         jsonschema.validate(instance=data, schema=schema)
         return []
 
-    except json.JSONDecodeError as e:
-        return [f"Invalid JSON: {str(e)}"]
     except jsonschema.ValidationError as e:
         return [f"Validation error: {e.message} at {'.'.join(map(str, e.path))}"]
     except Exception as e:
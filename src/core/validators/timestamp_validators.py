@@ -2,7 +2,8 @@
 Timestamp and date validators.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Union
 
 # Formatos de timestamp comunes
@@ -17,11 +18,87 @@ TIMESTAMP_FORMATS = [
     "%s",
 ]
 
+# Despacho por longitud: para los largos canónicos solo estos formatos
+# pueden matchear, así el caso común es un único strptime en lugar de
+# probar la lista completa. Strings con largos no mapeados (o que
+# fallan acá, p.ej. campos sin cero a la izquierda) caen al loop de
+# siempre, manteniendo la semántica.
+_FORMATS_BY_LEN = {
+    14: ("%Y%m%d%H%M%S",),
+    19: ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"),
+    20: ("%Y-%m-%dT%H:%M:%S%z",),
+    21: ("%Y-%m-%dT%H:%M:%S.%f",),
+    22: ("%Y-%m-%dT%H:%M:%S.%f",),
+    23: ("%Y-%m-%dT%H:%M:%S.%f",),
+    24: ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S%z"),
+    25: ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S%z"),
+    26: ("%Y-%m-%dT%H:%M:%S.%f", "%d/%b/%Y:%H:%M:%S %z"),
+}
+
+# Cache plano para parse_timestamp: los timestamps de logs se repiten
+# muchísimo y datetime es inmutable. Dict con tope simple (se vacía al
+# llenarse) para no pagar el overhead de lru_cache en el camino caliente.
+_PARSE_CACHE: dict = {}
+_PARSE_CACHE_MAX = 4096
+_MISS = object()
+
+
+# Meses abreviados del formato Apache (siempre en inglés)
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+
+def parse_apache_ts(s: str) -> Optional[datetime]:
+    """
+    Parsea el timestamp de Apache ('10/Jan/2026:14:23:45 +0000').
+
+    El formato es de ancho fijo, así que los campos se extraen por
+    offsets y el datetime se construye directo, sin la interpretación
+    del format string que hace strptime en cada llamada.
+
+    Args:
+        s: Timestamp en formato '%d/%b/%Y:%H:%M:%S %z'
+
+    Returns:
+        datetime con zona horaria, o None si no respeta el formato
+    """
+    try:
+        month = _MONTHS[s[3:6]]
+        sign = 1 if s[21] == "+" else -1
+        tz = timezone(
+            timedelta(hours=sign * int(s[22:24]), minutes=sign * int(s[24:26]))
+        )
+        return datetime(
+            int(s[7:11]),
+            month,
+            int(s[0:2]),
+            int(s[12:14]),
+            int(s[15:17]),
+            int(s[18:20]),
+            tzinfo=tz,
+        )
+    except (KeyError, ValueError, IndexError):
+        return None
+
 
 def validate_timestamp(
     timestamp: Union[str, int, float], format_hint: Optional[str] = None
 ) -> bool:
     """Valida un timestamp en múltiples formatos."""
+    # Los guards de tipo van fuera del cache: lru_cache levanta
+    # TypeError con argumentos no hasheables antes de los isinstance
     if timestamp is None:
         return False
 
@@ -32,25 +109,49 @@ def validate_timestamp(
             return False
 
     if isinstance(timestamp, str):
-        formats_to_try = []
+        return _validate_timestamp_str(timestamp, format_hint)
 
-        if format_hint:
-            formats_to_try.append(format_hint)
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _validate_timestamp_str(timestamp: str, format_hint: Optional[str]) -> bool:
+    """Camino memoizado de validate_timestamp (solo llega con str)."""
+    if format_hint:
+        try:
+            datetime.strptime(timestamp, format_hint)
+            return True
+        except ValueError:
+            pass
 
-        formats_to_try.extend(TIMESTAMP_FORMATS)
+    # Formato Apache: parser dedicado por offsets fijos (si no
+    # matchea se sigue con strptime como siempre)
+    if len(timestamp) == 26 and timestamp[2] == "/":
+        if parse_apache_ts(timestamp) is not None:
+            return True
 
-        for fmt in formats_to_try:
+    # Camino rápido: formato(s) candidatos según la longitud
+    candidates = _FORMATS_BY_LEN.get(len(timestamp))
+    if candidates:
+        for fmt in candidates:
             try:
                 datetime.strptime(timestamp, fmt)
                 return True
             except ValueError:
                 continue
 
+    for fmt in TIMESTAMP_FORMATS:
         try:
-            datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            datetime.strptime(timestamp, fmt)
             return True
         except ValueError:
-            pass
+            continue
+
+    try:
+        datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        return True
+    except ValueError:
+        pass
 
     return False
 
@@ -69,25 +170,88 @@ def parse_timestamp(
             return None
 
     if isinstance(timestamp, str):
-        formats_to_try = []
+        key = (timestamp, format_hint)
+        cached = _PARSE_CACHE.get(key, _MISS)
+        if cached is not _MISS:
+            return cached
+
+        result = None
 
         if format_hint:
-            formats_to_try.append(format_hint)
+            try:
+                result = datetime.strptime(timestamp, format_hint)
+            except ValueError:
+                pass
+
+        if result is None and len(timestamp) == 26 and timestamp[2] == "/":
+            # Formato Apache: parser dedicado por offsets fijos
+            result = parse_apache_ts(timestamp)
 
-        formats_to_try.extend(TIMESTAMP_FORMATS)
+        if result is None:
+            # Camino rápido: formato(s) candidatos según la longitud
+            candidates = _FORMATS_BY_LEN.get(len(timestamp))
+            if candidates:
+                for fmt in candidates:
+                    try:
+                        result = datetime.strptime(timestamp, fmt)
+                        break
+                    except ValueError:
+                        continue
 
-        for fmt in formats_to_try:
+        if result is None:
+            for fmt in TIMESTAMP_FORMATS:
+                try:
+                    result = datetime.strptime(timestamp, fmt)
+                    break
+                except ValueError:
+                    continue
+
+        if result is None:
             try:
-                return datetime.strptime(timestamp, fmt)
+                result = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
             except ValueError:
-                continue
+                pass
 
+        if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+            _PARSE_CACHE.clear()
+        _PARSE_CACHE[key] = result
+
+        return result
+
+
+def validate_timestamps_bulk(values) -> "list[bool]":
+    """
+    Valida una secuencia de timestamps en una sola pasada.
+
+    Los resultados se memoizan en un dict local además del lru_cache
+    de validate_timestamp: en logs los timestamps se repiten muchísimo,
+    así cada valor distinto se valida una sola vez por lote.
+
+    Args:
+        values: Secuencia de timestamps (str, int o float)
+
+    Returns:
+        list[bool]: Máscara de validez, en el mismo orden de entrada
+    """
+    validate = validate_timestamp
+    seen: dict = {}
+    results = []
+    append = results.append
+
+    for value in values:
         try:
-            return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        except ValueError:
-            pass
+            result = seen.get(value)
+        except TypeError:
+            # Valor no hasheable: no se puede memoizar, validar directo
+            # (validate_timestamp lo rechaza con False, no con excepción)
+            append(validate(value))
+            continue
+        if result is None:
+            result = validate(value)
+            seen[value] = result
+        append(result)
 
-    return None
+    return results
 
 
 def validate_timestamp_range(
@@ -3,6 +3,7 @@ URL and domain validators.
 """
 
 import re
+from functools import lru_cache
 from typing import List
 from urllib.parse import urlparse
 
@@ -10,13 +11,33 @@ from urllib.parse import urlparse
 URL_PATTERN = r"^(https?|ftp)://[^\s/$.?#].[^\s]*$"
 DOMAIN_PATTERN = r"^(?!-)[A-Za-z0-9-]{1,63}(?<!-)(\.[A-Za-z0-9-]{1,63}(?<!-))*\.[A-Za-z]{2,}$"
 
+# Compilados una sola vez con IGNORECASE incorporado: re.match con el
+# string paga el lookup del cache interno de re en cada llamada
+_URL_RE = re.compile(URL_PATTERN, re.IGNORECASE)
+_DOMAIN_RE = re.compile(DOMAIN_PATTERN, re.IGNORECASE)
+
+# Prefijos de esquema válidos (case-insensitive vía lower): descarta
+# los no-URL con un startswith antes de tocar el motor de regex
+_SCHEME_PREFIXES = ("http://", "https://", "ftp://")
+
 
 def validate_url(url_string: str, require_https: bool = False) -> bool:
     """Valida una URL."""
+    # El guard de tipo va fuera del cache: lru_cache levanta TypeError
+    # con argumentos no hasheables antes de llegar al isinstance
     if not url_string or not isinstance(url_string, str):
         return False
 
-    if not re.match(URL_PATTERN, url_string, re.IGNORECASE):
+    return _validate_url_cached(url_string, require_https)
+
+
+@lru_cache(maxsize=4096)
+def _validate_url_cached(url_string: str, require_https: bool) -> bool:
+    """Camino memoizado de validate_url (solo llega con str no vacío)."""
+    if not url_string.lower().startswith(_SCHEME_PREFIXES):
+        return False
+
+    if not _URL_RE.match(url_string):
         return False
 
     try:
@@ -30,7 +51,7 @@ def validate_url(url_string: str, require_https: bool = False) -> bool:
 
         if parsed.scheme in ("http", "https"):
             domain = parsed.netloc.split(":")[0]
-            if not re.match(DOMAIN_PATTERN, domain, re.IGNORECASE):
+            if not _DOMAIN_RE.match(domain):
                 return False
 
         return True
@@ -58,7 +79,9 @@ def validate_url_endpoint(url_string: str, allowed_paths: List[str] = None) -> b
         parsed = urlparse(url_string)
         path = parsed.path
 
-        if not any(path.startswith(allowed_path) for allowed_path in allowed_paths):
+        # startswith acepta una tupla y chequea los prefijos en C,
+        # sin el generador Python por elemento
+        if not path.startswith(tuple(allowed_paths)):
             return False
 
     return True
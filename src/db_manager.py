@@ -3,13 +3,22 @@ Gestor de conexion y operacion de PostgresSQL
 Manejo de conexiones , cracion de tablas y inserciones de datos
 """
 
+import asyncio
+import csv
+import io
 from typing import Dict, List, Optional
 
 import psycopg2
-from psycopg2.extras import execute_batch
 
 from src.config import Config
 
+try:
+    import asyncpg
+
+    _HAS_ASYNCPG = True
+except ImportError:
+    _HAS_ASYNCPG = False
+
 
 class DatabaseManager:
     """
@@ -96,7 +105,9 @@ class DatabaseManager:
     def insert_batch(self, records: List[Dict]) -> int:
         """
         Inserta un lote de registros en la tabla web_logs.
-        Usa execute_batch para mejor performance.
+        Usa COPY FROM STDIN: los registros se serializan a un buffer CSV
+        en memoria y entran por el protocolo de carga masiva de
+        PostgreSQL, que evita el parseo SQL por fila de los INSERT.
 
         Args:
             records (list): Lista de diccionarios con los datos parseados
@@ -110,18 +121,76 @@ class DatabaseManager:
         if not records:
             return 0
 
-        insert_query = """
-        INSERT INTO web_logs (ip, timestamp, method, url, status, bytes)
-        VALUES (%(ip)s, %(timestamp)s, %(method)s, %(url)s, %(status)s, %(bytes)s)
+        buf = io.StringIO()
+        writerow = csv.writer(buf, delimiter="\t").writerow
+        for record in records:
+            writerow(
+                (
+                    record["ip"],
+                    record["timestamp"].isoformat(),
+                    record["method"],
+                    record["url"],
+                    record["status"],
+                    record["bytes"],
+                )
+            )
+
+        return self._copy_buffer(buf, len(records))
+
+    def insert_batch_columnar(
+        self,
+        ips: List[str],
+        timestamps: List,
+        methods: List[str],
+        urls: List[str],
+        statuses: List[int],
+        sizes: List[int],
+    ) -> int:
         """
+        Inserta un lote en formato columnar (listas paralelas).
+
+        Misma ruta COPY que insert_batch, pero recibe una lista por
+        columna en lugar de una lista de dicts: la serialización recorre
+        las columnas con zip sin tocar un dict por registro.
+
+        Args:
+            ips, timestamps, methods, urls, statuses, sizes: Columnas
+                paralelas del mismo largo
+
+        Returns:
+            int: Cantidad de registros insertados
+
+        Raises:
+            psycopg2.Error: Si hay error en la inserción
+        """
+        if not ips:
+            return 0
+
+        buf = io.StringIO()
+        writerow = csv.writer(buf, delimiter="\t").writerow
+        for ip, timestamp, method, url, status, size in zip(
+            ips, timestamps, methods, urls, statuses, sizes
+        ):
+            writerow((ip, timestamp.isoformat(), method, url, status, size))
+
+        return self._copy_buffer(buf, len(ips))
+
+    # Query COPY compartida por las dos variantes de inserción
+    _COPY_QUERY = (
+        "COPY web_logs (ip, timestamp, method, url, status, bytes) "
+        "FROM STDIN WITH (FORMAT csv, DELIMITER E'\\t')"
+    )
+
+    def _copy_buffer(self, buf: io.StringIO, count: int) -> int:
+        """Ejecuta el COPY del buffer CSV ya serializado y commitea."""
+        buf.seek(0)
 
         try:
-            # execute_batch es más eficiente que executemany
-            execute_batch(self.cursor, insert_query, records)
+            self.cursor.copy_expert(self._COPY_QUERY, buf)
             self.conn.commit()
 
-            count = len(records)
-            print(f" Insertados {count} registros en la base de datos")
+            # Sin print por lote: a batches chicos el stdout por inserción
+            # cuesta más que el COPY; el caller reporta el progreso
             return count
 
         except psycopg2.Error as e:
@@ -154,6 +223,113 @@ class DatabaseManager:
         self.disconnect()
 
 
+class AsyncDatabaseManager:
+    """
+    Variante asíncrona del gestor, sobre un pool de asyncpg.
+
+    Los lotes entran por copy_records_to_table (COPY con protocolo
+    binario) y pueden despacharse en paralelo con insert_batches, que
+    solapa los round-trips de red entre conexiones del pool.
+
+    asyncpg es una dependencia opcional: sin él, connect() falla con
+    ImportError y el DatabaseManager síncrono sigue disponible.
+    """
+
+    _COLUMNS = ("ip", "timestamp", "method", "url", "status", "bytes")
+
+    def __init__(self, pool_size: int = 4):
+        self.pool_size = pool_size
+        self.pool: Optional["asyncpg.Pool"] = None
+
+    async def connect(self):
+        """
+        Crea el pool de conexiones con la configuración de Config.
+
+        Raises:
+            ImportError: Si asyncpg no está instalado
+        """
+        if not _HAS_ASYNCPG:
+            raise ImportError("asyncpg es requerido para AsyncDatabaseManager")
+
+        params = Config.get_db_connection_string()
+        self.pool = await asyncpg.create_pool(
+            host=params["host"],
+            port=params["port"],
+            database=params["database"],
+            user=params["user"],
+            password=params["password"],
+            min_size=1,
+            max_size=self.pool_size,
+        )
+        print(f" Pool asyncpg creado: {params['database']}@{params['host']}")
+
+    async def disconnect(self):
+        """Cierra el pool de conexiones."""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+            print(" Pool asyncpg cerrado")
+
+    async def insert_batch(self, records: List[Dict]) -> int:
+        """
+        Inserta un lote de registros vía COPY binario.
+
+        Args:
+            records (list): Lista de diccionarios con los datos parseados
+
+        Returns:
+            int: Cantidad de registros insertados
+        """
+        if not records:
+            return 0
+
+        rows = [
+            (
+                record["ip"],
+                record["timestamp"],
+                record["method"],
+                record["url"],
+                record["status"],
+                record["bytes"],
+            )
+            for record in records
+        ]
+
+        async with self.pool.acquire() as conn:
+            await conn.copy_records_to_table("web_logs", records=rows, columns=self._COLUMNS)
+
+        return len(rows)
+
+    async def insert_batches(self, batches: List[List[Dict]], max_concurrency: int = 4) -> int:
+        """
+        Despacha varios lotes en paralelo, acotados por un semáforo.
+
+        Args:
+            batches (list): Lista de lotes de registros
+            max_concurrency (int): Lotes en vuelo simultáneos
+
+        Returns:
+            int: Total de registros insertados
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(batch):
+            async with semaphore:
+                return await self.insert_batch(batch)
+
+        counts = await asyncio.gather(*(_bounded(batch) for batch in batches))
+        return sum(counts)
+
+    async def __aenter__(self):
+        """Soporte para async with."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Cierra el pool automáticamente al salir del contexto."""
+        await self.disconnect()
+
+
 # Testing directo del módulo
 if __name__ == "__main__":
     print("Testing DatabaseManager...")
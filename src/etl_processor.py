@@ -3,13 +3,44 @@ Procesador ETL principal.
 Orquesta el proceso de extracción, transformación y carga de logs.
 """
 
+import mmap
+import multiprocessing
+import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
 from src.config import Config
 from src.db_manager import DatabaseManager
 from src.log_parser import LogParser
 
+# A partir de cuántas líneas conviene paralelizar transform: por debajo
+# el costo de levantar el Pool supera lo que se ahorra parseando
+_PARALLEL_THRESHOLD = 10_000
+
+
+def _parse_chunk(lines: List[str]) -> Tuple[List[Dict], int]:
+    """
+    Parsea un chunk de líneas en un proceso worker.
+
+    Vive a nivel de módulo para ser pickleable por multiprocessing.
+
+    Returns:
+        tuple: (registros parseados, cantidad de errores)
+    """
+    parse_line = LogParser.parse_line
+    records = []
+    append = records.append
+    errors = 0
+
+    for line in lines:
+        record = parse_line(line.strip())
+        if record:
+            append(record)
+        else:
+            errors += 1
+
+    return records, errors
+
 
 class ETLProcessor:
     """
@@ -33,12 +64,28 @@ class ETLProcessor:
         # Estadísticas del proceso
         self.stats = {"total_lines": 0, "parsed_successfully": 0, "parse_errors": 0, "inserted": 0}
 
-    def extract(self) -> List[str]:
+        # Buffers columnares (SoA) preasignados al tamaño del batch:
+        # una lista por campo en lugar de una lista de dicts, así el
+        # batch en vuelo no retiene un dict por registro
+        size = self.batch_size
+        self._ips: List = [None] * size
+        self._timestamps: List = [None] * size
+        self._methods: List = [None] * size
+        self._urls: List = [None] * size
+        self._statuses: List = [None] * size
+        self._sizes: List = [None] * size
+
+    def extract(self) -> Iterator[str]:
         """
-        Extrae las líneas del archivo de log.
+        Extrae las líneas del archivo de log en streaming vía mmap.
 
-        Returns:
-            list: Lista de líneas del archivo
+        El archivo se mapea a memoria y el kernel paginea bajo demanda
+        (con hint de lectura secuencial donde está disponible), sin
+        pasar por el buffer de I/O de usuario. La memoria residente
+        queda acotada por el tamaño del batch, no por el del archivo.
+
+        Yields:
+            str: Cada línea del archivo
 
         Raises:
             FileNotFoundError: Si el archivo no existe
@@ -50,13 +97,17 @@ class ETLProcessor:
 
         print(f" Leyendo archivo: {self.log_file_path}")
 
-        with open(log_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        # mmap no admite archivos vacíos
+        if log_path.stat().st_size == 0:
+            return
 
-        self.stats["total_lines"] = len(lines)
-        print(f" Total de líneas leídas: {len(lines)}")
+        with open(log_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
 
-        return lines
+                for line in iter(mm.readline, b""):
+                    yield line.decode("utf-8")
 
     def transform(self, lines: List[str]) -> List[Dict]:
         """
@@ -70,20 +121,35 @@ class ETLProcessor:
         """
         print(f" Parseando {len(lines)} líneas...")
 
-        parsed_records = []
-
-        for line_num, line in enumerate(lines, start=1):
-            # Parsear línea
-            record = self.parser.parse_line(line.strip())
-
-            if record:
-                parsed_records.append(record)
-                self.stats["parsed_successfully"] += 1
-            else:
-                self.stats["parse_errors"] += 1
-                # Log de error solo para las primeras 5 líneas fallidas
-                if self.stats["parse_errors"] <= 5:
-                    print(f"  Error en línea {line_num}: formato inválido")
+        parsed_records: List[Dict] = []
+
+        if len(lines) < _PARALLEL_THRESHOLD:
+            # Camino secuencial para lotes chicos
+            for line_num, line in enumerate(lines, start=1):
+                # Parsear línea
+                record = self.parser.parse_line(line.strip())
+
+                if record:
+                    parsed_records.append(record)
+                    self.stats["parsed_successfully"] += 1
+                else:
+                    self.stats["parse_errors"] += 1
+                    # Log de error solo para las primeras 5 líneas fallidas
+                    if self.stats["parse_errors"] <= 5:
+                        print(f"  Error en línea {line_num}: formato inválido")
+        else:
+            # El parseo es CPU-bound y por línea: se reparte en chunks
+            # entre procesos, con imap (ordenado) para preservar el
+            # orden de los registros
+            ncpu = os.cpu_count() or 1
+            chunk_size = max(1, len(lines) // (ncpu * 4))
+            chunks = [lines[i : i + chunk_size] for i in range(0, len(lines), chunk_size)]
+
+            with multiprocessing.Pool() as pool:
+                for records, errors in pool.imap(_parse_chunk, chunks):
+                    parsed_records.extend(records)
+                    self.stats["parsed_successfully"] += len(records)
+                    self.stats["parse_errors"] += errors
 
         print(f" Parseadas correctamente: {self.stats['parsed_successfully']}")
         print(f" Errores de parsing: {self.stats['parse_errors']}")
@@ -112,15 +178,19 @@ class ETLProcessor:
 
             # Insertar en batches
             total_inserted = 0
+            total = len(records)
 
-            for i in range(0, len(records), self.batch_size):
+            for batch_num, i in enumerate(range(0, total, self.batch_size), start=1):
                 batch = records[i : i + self.batch_size]
                 inserted = self.db.insert_batch(batch)
                 total_inserted += inserted
 
-                # Mostrar progreso
-                progress = (i + len(batch)) / len(records) * 100
-                print(f"  Progreso: {progress:.1f}% ({i + len(batch)}/{len(records)})")
+                # Progreso rate-limited: cada 10 lotes y al terminar,
+                # para que stdout no pese en lotes chicos
+                done = i + len(batch)
+                if batch_num % 10 == 0 or done == total:
+                    progress = done / total * 100
+                    print(f"  Progreso: {progress:.1f}% ({done}/{total})")
 
             self.stats["inserted"] = total_inserted
             print(f" Total insertado: {total_inserted} registros")
@@ -131,7 +201,11 @@ class ETLProcessor:
 
     def run(self):
         """
-        Ejecuta el proceso ETL completo: Extract → Transform → Load.
+        Ejecuta el proceso ETL completo como un pipeline en streaming.
+
+        Las líneas se extraen, parsean e insertan en un solo paso:
+        cada batch_size registros parseados se flushean a la base.
+        Una sola conexión abarca todo el stream.
 
         Returns:
             dict: Estadísticas del proceso
@@ -141,14 +215,65 @@ class ETLProcessor:
         print("=" * 60)
 
         try:
-            # 1. EXTRACT - Leer archivo de logs
-            lines = self.extract()
-
-            # 2. TRANSFORM - Parsear líneas
-            records = self.transform(lines)
-
-            # 3. LOAD - Insertar en PostgreSQL
-            self.load(records)
+            # Conectar una sola vez al inicio del stream
+            self.db.connect()
+
+            try:
+                self.db.create_tables()
+
+                parse_line = self.parser.parse_line
+                stats = self.stats
+                batch_size = self.batch_size
+
+                ips = self._ips
+                timestamps = self._timestamps
+                methods = self._methods
+                urls = self._urls
+                statuses = self._statuses
+                sizes = self._sizes
+
+                n = 0
+
+                for line in self.extract():
+                    stats["total_lines"] += 1
+
+                    record = parse_line(line.strip())
+                    if record:
+                        # Llenado columnar por índice
+                        ips[n] = record["ip"]
+                        timestamps[n] = record["timestamp"]
+                        methods[n] = record["method"]
+                        urls[n] = record["url"]
+                        statuses[n] = record["status"]
+                        sizes[n] = record["bytes"]
+                        n += 1
+                        stats["parsed_successfully"] += 1
+
+                        if n == batch_size:
+                            stats["inserted"] += self.db.insert_batch_columnar(
+                                ips, timestamps, methods, urls, statuses, sizes
+                            )
+                            n = 0
+                    else:
+                        stats["parse_errors"] += 1
+                        # Log de error solo para las primeras 5 líneas fallidas
+                        if stats["parse_errors"] <= 5:
+                            print(f"  Error en línea {stats['total_lines']}: formato inválido")
+
+                # Flush del batch parcial final
+                if n:
+                    stats["inserted"] += self.db.insert_batch_columnar(
+                        ips[:n],
+                        timestamps[:n],
+                        methods[:n],
+                        urls[:n],
+                        statuses[:n],
+                        sizes[:n],
+                    )
+
+            finally:
+                # Siempre desconectar, incluso si hay error
+                self.db.disconnect()
 
             # Mostrar resumen
             self.print_summary()
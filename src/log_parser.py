@@ -1,11 +1,164 @@
 """
 Parsear de logs de Apache / Nginx
-Extraer informacion estructurada de archivos de archivos de logs usando expresiones regulares
+Extraer informacion estructurada de archivos de logs con un scanner posicional
 """
 
-import re
-from datetime import datetime
-from typing import Dict, Optional
+import socket
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+class LogRow:
+    """
+    Registro de log parseado, con __slots__ en lugar de dict.
+
+    Un dict de 6 entradas ronda los 230 B por registro; esta clase con
+    slots baja a ~90 B, lo que domina el consumo de memoria cuando hay
+    millones de registros en vuelo. Mantiene acceso por subíndice
+    (row['ip']) para los consumidores existentes con forma de dict.
+    """
+
+    __slots__ = ("ip", "timestamp", "method", "url", "status", "bytes")
+
+    def __init__(self, ip, timestamp, method, url, status, size):
+        self.ip = ip
+        self.timestamp = timestamp
+        self.method = method
+        self.url = url
+        self.status = status
+        self.bytes = size
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __repr__(self):
+        return (
+            f"LogRow(ip={self.ip!r}, timestamp={self.timestamp!r}, "
+            f"method={self.method!r}, url={self.url!r}, "
+            f"status={self.status!r}, bytes={self.bytes!r})"
+        )
+
+
+# LRU acotado para timestamps parseados: en logs de Apache el mismo
+# segundo se repite en muchas líneas consecutivas, así el caso común es
+# un lookup de dict en lugar de construir datetime + timezone de nuevo
+_TS_CACHE: "OrderedDict[str, datetime]" = OrderedDict()
+_TS_CACHE_MAX = 1024
+
+
+def _scan_line(buf):
+    """
+    Escanea una línea CLF byte a byte y devuelve offsets y enteros.
+
+    Escrito como loop plano sobre un buffer de bytes para que numba
+    pueda compilarlo. Devuelve una tupla de 10 enteros:
+    (ok, ip_end, ts_start, ts_end, m_start, m_end, u_start, u_end,
+    status, bytes); ok es 0 si la línea no respeta el formato.
+    """
+    fail = (0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+    n = len(buf)
+
+    # IP hasta el primer espacio (32)
+    ip_end = 0
+    while ip_end < n and buf[ip_end] != 32:
+        ip_end += 1
+    if ip_end == 0 or ip_end >= n:
+        return fail
+
+    # Campos ident y authuser: el formato exige dos tokens entre la IP
+    # y el '[' (típicamente '- -'), igual que el viejo LOG_PATTERN
+    i = ip_end + 1
+    t_start = i
+    while i < n and buf[i] != 32:
+        i += 1
+    if i == t_start or i >= n:
+        return fail
+    i += 1
+    t_start = i
+    while i < n and buf[i] != 32:
+        i += 1
+    if i == t_start or i >= n:
+        return fail
+    i += 1
+
+    # Timestamp entre corchetes (91 / 93), inmediatamente después
+    if i >= n or buf[i] != 91:
+        return fail
+    ts_start = i + 1
+    ts_end = ts_start
+    while ts_end < n and buf[ts_end] != 93:
+        ts_end += 1
+    if ts_end >= n:
+        return fail
+
+    # Request entre comillas (34): exactamente METHOD URL VERSION
+    q1 = ts_end
+    while q1 < n and buf[q1] != 34:
+        q1 += 1
+    if q1 >= n:
+        return fail
+    m_start = q1 + 1
+    m_end = m_start
+    while m_end < n and buf[m_end] != 32 and buf[m_end] != 34:
+        m_end += 1
+    if m_end == m_start or m_end >= n or buf[m_end] != 32:
+        return fail
+    u_start = m_end + 1
+    u_end = u_start
+    while u_end < n and buf[u_end] != 32 and buf[u_end] != 34:
+        u_end += 1
+    if u_end == u_start or u_end >= n or buf[u_end] != 32:
+        return fail
+    v_end = u_end + 1
+    while v_end < n and buf[v_end] != 34:
+        if buf[v_end] == 32:
+            return fail
+        v_end += 1
+    if v_end >= n or v_end == u_end + 1:
+        return fail
+
+    # Status y bytes: corridas de dígitos (48-57) tras la comilla
+    i = v_end + 1
+    while i < n and buf[i] == 32:
+        i += 1
+    status = 0
+    digits = 0
+    while i < n and 48 <= buf[i] <= 57:
+        status = status * 10 + (buf[i] - 48)
+        digits += 1
+        i += 1
+    if digits == 0 or i >= n or buf[i] != 32:
+        return fail
+    while i < n and buf[i] == 32:
+        i += 1
+    nbytes = 0
+    digits = 0
+    while i < n and 48 <= buf[i] <= 57:
+        nbytes = nbytes * 10 + (buf[i] - 48)
+        digits += 1
+        i += 1
+    if digits == 0:
+        return fail
+    # Después de bytes solo se admite espacio o fin de línea (campos
+    # extra tipo referrer/user-agent quedan ignorados, como antes)
+    if i < n and buf[i] != 32 and buf[i] != 10 and buf[i] != 13:
+        return fail
+
+    return (1, ip_end, ts_start, ts_end, m_start, m_end, u_start, u_end, status, nbytes)
+
+
+if _HAS_NUMBA:
+    _scan_line = njit(cache=True)(_scan_line)
 
 
 class LogParser:
@@ -22,31 +175,37 @@ class LogParser:
 
     """
 
-    # Patrón regex para Apache Combined Log Format
-    LOG_PATTERN = re.compile(
-        r"(?P<ip>\S+) "  # Dirección IP
-        r"\S+ \S+ "  # Campos ignorados (-, -)
-        r"\[(?P<timestamp>[^\]]+)\] "  # Timestamp entre []
-        r'"(?P<method>\S+) '  # Método HTTP (GET, POST, etc.)
-        r"(?P<url>\S+) "  # URL solicitada
-        r'\S+" '  # Versión HTTP (ignorada)
-        r"(?P<status>\d+) "  # Código de estado HTTP
-        r"(?P<bytes>\d+)"  # Bytes transferidos
-    )
-
-    # Formato de timestamp de Apache
-    TIMESTAMP_FORMAT = "%d/%b/%Y:%H:%M:%S %z"
+    # Meses abreviados del timestamp de Apache (siempre en inglés,
+    # independiente del locale)
+    MONTHS = {
+        "Jan": 1,
+        "Feb": 2,
+        "Mar": 3,
+        "Apr": 4,
+        "May": 5,
+        "Jun": 6,
+        "Jul": 7,
+        "Aug": 8,
+        "Sep": 9,
+        "Oct": 10,
+        "Nov": 11,
+        "Dec": 12,
+    }
 
     @staticmethod
-    def parse_line(line: str) -> Optional[Dict]:
+    def _parse_line_py(line: str) -> Optional[LogRow]:
         """
-        Parsea una línea de log y retorna un diccionario con los datos.
+        Parsea una línea de log y retorna un LogRow con los datos.
+
+        Los delimitadores del formato son fijos (espacio, '[', ']', '"'),
+        así que en lugar de un regex con backtracking se localizan con
+        str.find y se extraen los campos por slicing directo.
 
         Args:
             line (str): Línea de log a parsear
 
         Returns:
-            dict: Diccionario con los campos parseados, o None si el formato es inválido
+            LogRow: Registro con los campos parseados, o None si el formato es inválido
 
         Example:
             >>> parser = LogParser()
@@ -55,35 +214,152 @@ class LogParser:
             >>> print(result['ip'])
             '192.168.1.1'
         """
-        # Aplicar regex
-        match = LogParser.LOG_PATTERN.match(line)
+        # IP hasta el primer espacio
+        sp1 = line.find(" ")
+        if sp1 <= 0:
+            return None
+        ip = line[:sp1]
 
-        if not match:
+        # Campos ident y authuser: dos tokens obligatorios entre la IP
+        # y el '[' (típicamente '- -'), igual que el viejo LOG_PATTERN
+        sp2 = line.find(" ", sp1 + 1)
+        if sp2 == -1 or sp2 == sp1 + 1:
+            return None
+        sp3 = line.find(" ", sp2 + 1)
+        if sp3 == -1 or sp3 == sp2 + 1:
             return None
 
-        try:
-            # Extraer grupos del regex
-            data = match.groupdict()
+        # Timestamp entre corchetes, inmediatamente después
+        lb = sp3 + 1
+        if lb >= len(line) or line[lb] != "[":
+            return None
+        rb = line.find("]", lb + 1)
+        if rb == -1:
+            return None
+
+        timestamp = LogParser._parse_timestamp(line[lb + 1 : rb])
+        if timestamp is None:
+            return None
+
+        # Request entre comillas: METHOD URL HTTP/x.y
+        q1 = line.find('"', rb + 1)
+        if q1 == -1:
+            return None
+        q2 = line.find('"', q1 + 1)
+        if q2 == -1:
+            return None
+
+        request = line[q1 + 1 : q2].split(" ")
+        if len(request) != 3:
+            return None
+        method, url, version = request
+        # Los tres tokens deben ser no vacíos (la variante numba también
+        # rechaza la versión vacía; mantener ambas implementaciones igual)
+        if not method or not url or not version:
+            return None
+
+        # Status y bytes después de la comilla de cierre
+        tail = line[q2 + 1 :].split()
+        if len(tail) < 2 or not tail[0].isdigit() or not tail[1].isdigit():
+            return None
+
+        return LogRow(ip, timestamp, method, url, int(tail[0]), int(tail[1]))
+
+    @staticmethod
+    def _parse_line_jit(line: str) -> Optional[LogRow]:
+        """
+        Variante con kernel compilado: el escaneo de delimitadores y el
+        parseo de status/bytes corren en _scan_line (numba @njit sobre
+        el buffer de bytes); en Python solo se decodifican los campos
+        y se arma el dict de salida.
+        """
+        buf = line.encode("utf-8")
+        (ok, ip_end, ts_start, ts_end, m_start, m_end, u_start, u_end, status, nbytes) = _scan_line(
+            buf
+        )
+        if not ok:
+            return None
+
+        timestamp = LogParser._parse_timestamp(buf[ts_start:ts_end].decode("utf-8"))
+        if timestamp is None:
+            return None
+
+        return LogRow(
+            buf[:ip_end].decode("utf-8"),
+            timestamp,
+            buf[m_start:m_end].decode("utf-8"),
+            buf[u_start:u_end].decode("utf-8"),
+            status,
+            nbytes,
+        )
+
+    # Selección en tiempo de definición: con numba instalado el escaneo
+    # corre compilado, si no queda el scanner puro de Python
+    parse_line = _parse_line_jit if _HAS_NUMBA else _parse_line_py
+
+    @staticmethod
+    def _parse_timestamp(ts: str) -> Optional[datetime]:
+        """
+        Parsea el timestamp de Apache por posiciones fijas.
+
+        El layout es siempre 'dd/Mon/yyyy:HH:MM:SS +ZZZZ' (26 chars),
+        así que los campos se extraen por slicing y se construye el
+        datetime directamente, sin pasar por strptime.
+
+        Args:
+            ts (str): Timestamp sin corchetes
+
+        Returns:
+            datetime: Timestamp con zona horaria, o None si es inválido
+        """
+        cached = _TS_CACHE.get(ts)
+        if cached is not None:
+            _TS_CACHE.move_to_end(ts)
+            return cached
+
+        if (
+            len(ts) != 26
+            or ts[2] != "/"
+            or ts[6] != "/"
+            or ts[11] != ":"
+            or ts[14] != ":"
+            or ts[17] != ":"
+            or ts[20] != " "
+        ):
+            return None
 
-            # Convertir timestamp a objeto datetime
-            timestamp_str = data["timestamp"]
-            timestamp = datetime.strptime(timestamp_str, LogParser.TIMESTAMP_FORMAT)
+        month = LogParser.MONTHS.get(ts[3:6])
+        if month is None:
+            return None
 
-            # Construir diccionario de salida
-            return {
-                "ip": data["ip"],
-                "timestamp": timestamp,
-                "method": data["method"],
-                "url": data["url"],
-                "status": int(data["status"]),
-                "bytes": int(data["bytes"]),
-            }
+        sign = ts[21]
+        if sign == "+":
+            offset_sign = 1
+        elif sign == "-":
+            offset_sign = -1
+        else:
+            return None
 
-        except (ValueError, KeyError) as e:
-            # Error al parsear timestamp o campos inválidos
-            print(f"  Error parseando línea: {e}")
+        try:
+            offset_minutes = offset_sign * (int(ts[22:24]) * 60 + int(ts[24:26]))
+            result = datetime(
+                int(ts[7:11]),  # año
+                month,
+                int(ts[0:2]),  # día
+                int(ts[12:14]),  # hora
+                int(ts[15:17]),  # minutos
+                int(ts[18:20]),  # segundos
+                tzinfo=timezone(timedelta(minutes=offset_minutes)),
+            )
+        except ValueError:
             return None
 
+        _TS_CACHE[ts] = result
+        if len(_TS_CACHE) > _TS_CACHE_MAX:
+            _TS_CACHE.popitem(last=False)
+
+        return result
+
     @staticmethod
     def validate_ip(ip: str) -> bool:
         """
@@ -95,14 +371,13 @@ class LogParser:
         Returns:
             bool: True si la IP es válida
         """
-        # Validación simple de IPv4
-        parts = ip.split(".")
-        if len(parts) != 4:
-            return False
-
+        # inet_pton parsea la IPv4 completa en una sola llamada C, sin
+        # split ni un int() por octeto (y es estricto, a diferencia de
+        # inet_aton que acepta formas octales/abreviadas)
         try:
-            return all(0 <= int(part) <= 255 for part in parts)
-        except ValueError:
+            socket.inet_pton(socket.AF_INET, ip)
+            return True
+        except OSError:
             return False
 
     @staticmethod
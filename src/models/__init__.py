@@ -28,10 +28,19 @@ from .base import BaseETLModel
 
 # Enriched log models
 from .enriched_log import EnrichedLogEntry, GeoLocationInfo, SessionInfo, ThreatInfo, UserAgentInfo
+from .enriched_log_fast import (
+    EnrichedLogEntryFast,
+    GeoLocationInfoFast,
+    SessionInfoFast,
+    ThreatInfoFast,
+    UserAgentInfoFast,
+)
 from .immutable_etl_model import ImmutableETLModel
 
 # Log models
 from .log_entry import HTTPMethod, LogEntry
+from .log_entry_batch import LogEntryBatch
+from .log_entry_fast import LogEntryFast
 
 # Result models
 from .results import ParserStatsModel, ProcessingResultModel, ValidationErrorModel
@@ -45,6 +54,8 @@ __all__ = [
     "ImmutableETLModel",
     # Log models
     "LogEntry",
+    "LogEntryFast",
+    "LogEntryBatch",
     "HTTPMethod",
     # Result models
     "ProcessingResultModel",
@@ -56,6 +67,12 @@ __all__ = [
     "UserAgentInfo",
     "ThreatInfo",
     "SessionInfo",
+    # Enriched models (msgspec, opcional)
+    "EnrichedLogEntryFast",
+    "GeoLocationInfoFast",
+    "UserAgentInfoFast",
+    "ThreatInfoFast",
+    "SessionInfoFast",
     # Serializers
     "ModelSerializer",
     "ModelDeserializer",
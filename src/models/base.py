@@ -6,9 +6,9 @@ para todas las clases de modelos del sistema.
 """
 
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class BaseETLModel(BaseModel):
@@ -56,3 +56,36 @@ class BaseETLModel(BaseModel):
     @classmethod
     def from_json(cls, json_str: str):
         return cls.model_validate_json(json_str)
+
+    @classmethod
+    def _get_list_adapter(cls) -> TypeAdapter:
+        """
+        TypeAdapter de List[cls], construido una vez y cacheado en la
+        clase concreta (se consulta __dict__ para no heredar el adapter
+        de una superclase).
+        """
+        adapter = cls.__dict__.get("_list_adapter")
+        if adapter is None:
+            adapter = TypeAdapter(List[cls])
+            cls._list_adapter = adapter
+        return adapter
+
+    @classmethod
+    def from_log_records_batch(cls, records: List[Dict[str, Any]]) -> List["BaseETLModel"]:
+        """
+        Valida un lote de log records en una sola llamada.
+
+        Usa el TypeAdapter cacheado, así el lote cruza la frontera
+        Python→Rust de pydantic una vez en lugar de una por registro.
+        """
+        return cls._get_list_adapter().validate_python(records)
+
+    @classmethod
+    def from_json_lines(cls, json_bytes: bytes) -> List["BaseETLModel"]:
+        """
+        Valida un array JSON de registros (bytes) en una sola llamada.
+
+        El parseo JSON y la validación corren del lado Rust sin pasar
+        por objetos Python intermedios.
+        """
+        return cls._get_list_adapter().validate_json(json_bytes)
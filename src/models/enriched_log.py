@@ -3,13 +3,136 @@ Modelo de log enriquecido con información adicional.
 Extiende LogEntry con datos de geolocalización, user-agent parsing, threat intel, etc.
 """
 
-from typing import Optional
+import ipaddress
+import re
+import sys
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from typing import Callable, Dict, List, Optional
 
-from pydantic import Field, field_validator
+from pydantic import ConfigDict, Field, field_validator
 
 from .base import BaseETLModel
 from .log_entry import LogEntry
 
+# Patrones de endpoint sospechoso compilados una vez: evita rearmar la
+# lista y re-lowercasear el endpoint en cada acceso a is_suspicious
+_SUSP_ENDPOINT_RE = re.compile(r"\.\.|admin|config|backup", re.IGNORECASE)
+
+# Heurísticas de User-Agent: el orden importa (Edge y Opera se anuncian
+# también como Chrome; Chrome se anuncia como Safari)
+_UA_BROWSERS = (
+    ("edg", "Edge"),
+    ("opr/", "Opera"),
+    ("opera", "Opera"),
+    ("chrome", "Chrome"),
+    ("safari", "Safari"),
+    ("firefox", "Firefox"),
+)
+_UA_BOT_RE = re.compile(r"bot|crawler|spider|slurp|curl|wget", re.IGNORECASE)
+
+
+@lru_cache(maxsize=65536)
+def _parse_user_agent(ua: str) -> "UserAgentInfo":
+    """
+    Parsea un User-Agent con heurísticas de substring, memoizado.
+
+    Los UA de logs web son de cardinalidad bajísima (<10k distintos en
+    millones de requests), así que los repetidos salen del LRU en O(1).
+    El resultado cacheado se comparte entre filas: tratarlo como
+    solo-lectura.
+    """
+    ua_lower = ua.lower()
+
+    bot_match = _UA_BOT_RE.search(ua)
+    is_bot = bot_match is not None
+
+    browser = None
+    for needle, name in _UA_BROWSERS:
+        if needle in ua_lower:
+            browser = name
+            break
+
+    os_name = None
+    if "windows" in ua_lower:
+        os_name = "Windows"
+    elif "mac os x" in ua_lower or "macintosh" in ua_lower:
+        os_name = "macOS"
+    elif "android" in ua_lower:
+        os_name = "Android"
+    elif "iphone" in ua_lower or "ipad" in ua_lower:
+        os_name = "iOS"
+    elif "linux" in ua_lower:
+        os_name = "Linux"
+
+    is_tablet = "ipad" in ua_lower or "tablet" in ua_lower
+    is_mobile = not is_tablet and ("mobile" in ua_lower or "android" in ua_lower)
+
+    if is_bot:
+        device_type = "bot"
+    elif is_tablet:
+        device_type = "tablet"
+    elif is_mobile:
+        device_type = "mobile"
+    else:
+        device_type = "desktop"
+
+    return UserAgentInfo(
+        browser=browser,
+        os=os_name,
+        device_type=device_type,
+        is_bot=is_bot,
+        bot_name=bot_match.group(0).capitalize() if is_bot else None,
+        is_mobile=is_mobile,
+        is_tablet=is_tablet,
+    )
+
+
+def _geo_prefix(ip: str) -> int:
+    """Prefijo de red para cachear geo-lookups: /24 en IPv4, /48 en IPv6."""
+    addr = ipaddress.ip_address(ip)
+    if addr.version == 4:
+        return int(addr) & 0xFFFFFF00
+    return int(addr) >> 80
+
+
+def make_geo_prefix_lookup(
+    resolver: Callable[[str], Optional["GeoLocationInfo"]],
+    maxsize: int = 131072,
+) -> Callable[[str], Optional["GeoLocationInfo"]]:
+    """
+    Envuelve un resolver de geolocalización con un LRU por prefijo de red.
+
+    Las bases GeoIP (MaxMind y similares) indexan por bloque de red, así
+    que IPs adyacentes casi siempre caen en el mismo registro — y los
+    logs web tienen localidad temporal altísima por subred. Cachear por
+    /24 (o /48 en IPv6) convierte la enorme mayoría de lookups en un
+    probe de dict, llamando al resolver solo en los misses.
+
+    Args:
+        resolver: Función ip -> GeoLocationInfo (o None), p.ej. un
+            cliente MMDB
+        maxsize: Entradas máximas del LRU
+
+    Returns:
+        Callable con la misma firma que resolver, cacheado por prefijo
+    """
+    cache: "OrderedDict[int, Optional[GeoLocationInfo]]" = OrderedDict()
+
+    def lookup(ip: str) -> Optional["GeoLocationInfo"]:
+        prefix = _geo_prefix(ip)
+        if prefix in cache:
+            cache.move_to_end(prefix)
+            return cache[prefix]
+
+        info = resolver(ip)
+        cache[prefix] = info
+        if len(cache) > maxsize:
+            cache.popitem(last=False)
+        return info
+
+    return lookup
+
 
 class GeoLocationInfo(BaseETLModel):
     """
@@ -60,6 +183,12 @@ class GeoLocationInfo(BaseETLModel):
 
     asn: Optional[int] = Field(None, description="Autonomous System Number")
 
+    @field_validator("country_code")
+    @classmethod
+    def intern_country_code(cls, v: Optional[str]) -> Optional[str]:
+        """Interna el código de país (~250 valores repetidos por millones de filas)."""
+        return sys.intern(v) if v is not None else None
+
 
 class UserAgentInfo(BaseETLModel):
     """
@@ -127,6 +256,28 @@ class UserAgentInfo(BaseETLModel):
 
     is_tablet: bool = Field(default=False, description="Si es tablet")
 
+    @field_validator("browser", "os", "device_type")
+    @classmethod
+    def intern_low_cardinality(cls, v: Optional[str]) -> Optional[str]:
+        """Interna campos de cardinalidad baja (browser/os/device_type)."""
+        return sys.intern(v) if v is not None else None
+
+    @classmethod
+    def from_user_agent(cls, ua: Optional[str]) -> Optional["UserAgentInfo"]:
+        """
+        Parsea un string de User-Agent (memoizado por string).
+
+        Los UA repetidos devuelven la MISMA instancia cacheada: no
+        mutarla. Para parsing completo (marca/modelo/versiones) usar una
+        librería dedicada como ua-parser.
+
+        Returns:
+            UserAgentInfo o None si ua es None/vacío
+        """
+        if not ua:
+            return None
+        return _parse_user_agent(ua)
+
 
 class ThreatInfo(BaseETLModel):
     """
@@ -219,6 +370,14 @@ class EnrichedLogEntry(LogEntry):
         ... )
     """
 
+    # Los payloads de enriquecimiento vienen de servicios externos con
+    # campos que no modelamos: ignorarlos (en vez del forbid heredado)
+    # evita el error por extras sin alocar un dict de extras por fila.
+    # defer_build=False paga el build del schema al importar, una vez.
+    model_config = ConfigDict(
+        **{**LogEntry.model_config, "extra": "ignore", "defer_build": False}
+    )
+
     # ========== INFORMACIÓN ENRIQUECIDA ==========
 
     geo_info: Optional[GeoLocationInfo] = Field(
@@ -249,6 +408,92 @@ class EnrichedLogEntry(LogEntry):
         examples=[["maxmind_geoip", "abuseipdb", "user_agents"]],
     )
 
+    @classmethod
+    def from_basic(
+        cls,
+        basic: LogEntry,
+        geo_info: Optional[GeoLocationInfo] = None,
+        user_agent_info: Optional[UserAgentInfo] = None,
+        threat_info: Optional[ThreatInfo] = None,
+        session_info: Optional[SessionInfo] = None,
+        enrichment_timestamp: Optional[str] = None,
+        enrichment_sources: Optional[list[str]] = None,
+    ) -> "EnrichedLogEntry":
+        """
+        Enriquece un LogEntry ya validado sin revalidarlo.
+
+        El patrón EnrichedLogEntry(**basic.model_dump(), ...) materializa
+        un dict y vuelve a validar cada campo del LogEntry. Como basic ya
+        pasó por la validación completa (y los sub-modelos de
+        enriquecimiento se construyen validados aparte), acá se usa
+        model_construct para saltear la segunda pasada.
+
+        Args:
+            basic: Log básico ya validado
+            geo_info: Geolocalización ya construida (opcional)
+            user_agent_info: User-Agent parseado (opcional)
+            threat_info: Threat intelligence (opcional)
+            session_info: Información de sesión (opcional)
+            enrichment_timestamp: Timestamp del enriquecimiento
+            enrichment_sources: Fuentes usadas
+
+        Returns:
+            EnrichedLogEntry construido sin revalidación
+        """
+        data = dict(basic.__dict__)
+        data.update(
+            geo_info=geo_info,
+            user_agent_info=user_agent_info,
+            threat_info=threat_info,
+            session_info=session_info,
+            enrichment_timestamp=enrichment_timestamp,
+            enrichment_sources=enrichment_sources,
+        )
+        return cls.model_construct(_fields_set=set(data), **data)
+
+    # ========== CONSTRUCCIÓN EN BATCH ==========
+
+    @classmethod
+    def enrich_batch(
+        cls,
+        basic_logs: List[LogEntry],
+        geo_lookups: Optional[Dict[str, GeoLocationInfo]] = None,
+        ua_lookups: Optional[Dict[str, UserAgentInfo]] = None,
+        threat_lookups: Optional[Dict[str, ThreatInfo]] = None,
+    ) -> List["EnrichedLogEntry"]:
+        """
+        Enriquece un batch completo en una sola validación.
+
+        Construir EnrichedLogEntry(**basic.model_dump(), ...) por fila
+        paga model_dump + revalidación por registro. Acá se arman dicts
+        planos desde el __dict__ de cada LogEntry (ya validado) y se
+        valida todo el batch con el TypeAdapter(List[...]) cacheado de
+        BaseETLModel: un solo recorrido del lado Rust.
+
+        Args:
+            basic_logs: Logs básicos ya validados
+            geo_lookups: GeoLocationInfo por IP (opcional)
+            ua_lookups: UserAgentInfo por string de User-Agent (opcional)
+            threat_lookups: ThreatInfo por IP (opcional)
+
+        Returns:
+            list: EnrichedLogEntry validados, en el orden de entrada
+        """
+        geo_lookups = geo_lookups or {}
+        ua_lookups = ua_lookups or {}
+        threat_lookups = threat_lookups or {}
+
+        payload = [
+            {
+                **log.__dict__,
+                "geo_info": geo_lookups.get(log.ip_address),
+                "user_agent_info": ua_lookups.get(log.user_agent) if log.user_agent else None,
+                "threat_info": threat_lookups.get(log.ip_address),
+            }
+            for log in basic_logs
+        ]
+        return cls._get_list_adapter().validate_python(payload)
+
     # ========== PROPIEDADES DERIVADAS ==========
 
     @property
@@ -265,11 +510,15 @@ class EnrichedLogEntry(LogEntry):
             return self.user_agent_info.is_bot
         return False
 
-    @property
+    @cached_property
     def is_suspicious(self) -> bool:
         """
         True si la petición es sospechosa.
 
+        Cacheada por instancia: los sinks aguas abajo (writer, alerter,
+        agregador) la leen varias veces por fila y los datos de
+        enriquecimiento no cambian después de construir el modelo.
+
         Considera:
         - Threat score alto
         - VPN/Proxy/Tor
@@ -284,17 +533,15 @@ class EnrichedLogEntry(LogEntry):
                 return True
 
         # Error 4xx/5xx con endpoint sospechoso
-        if self.is_error and any(
-            pattern in self.endpoint.lower() for pattern in ["..", "admin", "config", "backup"]
-        ):
+        if self.is_error and _SUSP_ENDPOINT_RE.search(self.endpoint):
             return True
 
         return False
 
-    @property
+    @cached_property
     def risk_level(self) -> str:
         """
-        Nivel de riesgo de la petición.
+        Nivel de riesgo de la petición (cacheado por instancia).
 
         Returns:
             str: 'low', 'medium', 'high', 'critical'
@@ -317,6 +564,16 @@ class EnrichedLogEntry(LogEntry):
 
         return "low"
 
+    @cached_property
+    def _location_string(self) -> Optional[str]:
+        """Ubicación formateada, calculada una sola vez por instancia."""
+        geo = self.geo_info
+        if not geo:
+            return None
+
+        # join directo sobre los campos filtrados, sin lista intermedia
+        return ", ".join(part for part in (geo.city, geo.country_name) if part) or None
+
     def get_location_string(self) -> Optional[str]:
         """
         Retorna ubicación como string legible.
@@ -324,16 +581,24 @@ class EnrichedLogEntry(LogEntry):
         Returns:
             str: "City, Country" o None
         """
-        if not self.geo_info:
+        return self._location_string
+
+    @cached_property
+    def _device_string(self) -> Optional[str]:
+        """Dispositivo formateado, calculado una sola vez por instancia."""
+        ua = self.user_agent_info
+        if not ua:
             return None
 
-        parts = []
-        if self.geo_info.city:
-            parts.append(self.geo_info.city)
-        if self.geo_info.country_name:
-            parts.append(self.geo_info.country_name)
+        browser = None
+        if ua.browser:
+            browser = f"{ua.browser} {ua.browser_version}" if ua.browser_version else ua.browser
+
+        os_part = None
+        if ua.os:
+            os_part = f"on {ua.os} {ua.os_version}" if ua.os_version else f"on {ua.os}"
 
-        return ", ".join(parts) if parts else None
+        return " ".join(part for part in (browser, os_part) if part) or None
 
     def get_device_string(self) -> Optional[str]:
         """
@@ -342,21 +607,9 @@ class EnrichedLogEntry(LogEntry):
         Returns:
             str: "Chrome 120.0 on Windows 10" o None
         """
-        if not self.user_agent_info:
-            return None
-
-        parts = []
-
-        if self.user_agent_info.browser:
-            browser = self.user_agent_info.browser
-            if self.user_agent_info.browser_version:
-                browser += f" {self.user_agent_info.browser_version}"
-            parts.append(browser)
+        return self._device_string
 
-        if self.user_agent_info.os:
-            os_str = self.user_agent_info.os
-            if self.user_agent_info.os_version:
-                os_str += f" {self.user_agent_info.os_version}"
-            parts.append(f"on {os_str}")
 
-        return " ".join(parts) if parts else None
+# Construye el core-schema una sola vez al importar: todas las filas
+# reutilizan el mismo validador ya compilado
+EnrichedLogEntry.model_rebuild(force=True)
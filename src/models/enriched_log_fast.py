@@ -0,0 +1,144 @@
+"""
+Variante msgspec de los modelos de enriquecimiento.
+
+Los cuatro modelos anidados de enriched_log.py (geo, user-agent, threat,
+sesión) son contenedores de datos puros: solo constraints de rango y
+longitud, sin field_validators. Construirlos con Pydantic paga el cruce
+Python↔Rust completo por registro; msgspec.Struct valida lo mismo en C,
+y con gc=False los structs (que solo contienen escalares) salen del
+recolector de ciclos, abaratando cada fila enriquecida.
+
+msgspec es opcional: sin él, este módulo importa igual y las clases
+fallan con ImportError recién al instanciarse. Los modelos Pydantic de
+enriched_log.py siguen siendo el camino por defecto.
+"""
+
+from typing import Annotated, Optional
+
+try:
+    import msgspec
+
+    _HAS_MSGSPEC = True
+except ImportError:
+    _HAS_MSGSPEC = False
+
+
+if _HAS_MSGSPEC:
+    from datetime import datetime
+
+    _Len2 = Annotated[str, msgspec.Meta(max_length=2)]
+    _Len20 = Annotated[str, msgspec.Meta(max_length=20)]
+    _Len50 = Annotated[str, msgspec.Meta(max_length=50)]
+    _Len64 = Annotated[str, msgspec.Meta(max_length=64)]
+    _Len100 = Annotated[str, msgspec.Meta(max_length=100)]
+    _Len200 = Annotated[str, msgspec.Meta(max_length=200)]
+    _Score = Annotated[int, msgspec.Meta(ge=0, le=100)]
+
+    class GeoLocationInfoFast(msgspec.Struct, frozen=True, gc=False):
+        """Equivalente msgspec de GeoLocationInfo."""
+
+        country_code: Optional[_Len2] = None
+        country_name: Optional[_Len100] = None
+        city: Optional[_Len100] = None
+        region: Optional[_Len100] = None
+        latitude: Optional[Annotated[float, msgspec.Meta(ge=-90, le=90)]] = None
+        longitude: Optional[Annotated[float, msgspec.Meta(ge=-180, le=180)]] = None
+        timezone: Optional[_Len50] = None
+        isp: Optional[_Len200] = None
+        organization: Optional[_Len200] = None
+        asn: Optional[int] = None
+
+    class UserAgentInfoFast(msgspec.Struct, frozen=True, gc=False):
+        """Equivalente msgspec de UserAgentInfo."""
+
+        browser: Optional[_Len50] = None
+        browser_version: Optional[_Len20] = None
+        os: Optional[_Len50] = None
+        os_version: Optional[_Len20] = None
+        device_type: Optional[_Len20] = None
+        device_brand: Optional[_Len50] = None
+        device_model: Optional[_Len50] = None
+        is_bot: bool = False
+        bot_name: Optional[_Len50] = None
+        is_mobile: bool = False
+        is_tablet: bool = False
+
+    class ThreatInfoFast(msgspec.Struct, frozen=True, gc=False):
+        """Equivalente msgspec de ThreatInfo."""
+
+        is_threat: bool = False
+        threat_level: Optional[_Len20] = None
+        threat_score: Optional[_Score] = None
+        is_vpn: bool = False
+        is_proxy: bool = False
+        is_tor: bool = False
+        is_datacenter: bool = False
+        abuse_confidence_score: Optional[_Score] = None
+        categories: Optional[list[str]] = None
+        last_seen_at: Optional[str] = None
+
+    class SessionInfoFast(msgspec.Struct, frozen=True, gc=False):
+        """Equivalente msgspec de SessionInfo."""
+
+        session_id: Optional[_Len64] = None
+        is_new_session: bool = True
+        session_duration_seconds: Optional[Annotated[float, msgspec.Meta(ge=0)]] = None
+        pages_visited: Optional[Annotated[int, msgspec.Meta(ge=0)]] = None
+        referrer_domain: Optional[_Len200] = None
+
+    class EnrichedLogEntryFast(msgspec.Struct, gc=False):
+        """
+        Entrada enriquecida con los info-objects como msgspec.Struct.
+
+        Pensada para el borde de enriquecimiento (respuestas HTTP de
+        MaxMind/AbuseIPDB decodificadas en batch); no reemplaza a
+        EnrichedLogEntry en las APIs públicas.
+        """
+
+        ip_address: str
+        timestamp: datetime
+        method: str
+        endpoint: str
+        status_code: Annotated[int, msgspec.Meta(ge=100, le=599)]
+        response_size: Annotated[int, msgspec.Meta(ge=0)]
+        http_version: str = "HTTP/1.1"
+        geo_info: Optional[GeoLocationInfoFast] = None
+        user_agent_info: Optional[UserAgentInfoFast] = None
+        threat_info: Optional[ThreatInfoFast] = None
+        session_info: Optional[SessionInfoFast] = None
+
+    # Decoders JSON reusables para respuestas de servicios de
+    # enriquecimiento (un Decoder compilado por tipo, no por llamada)
+    decode_geo_json = msgspec.json.Decoder(GeoLocationInfoFast).decode
+    decode_user_agent_json = msgspec.json.Decoder(UserAgentInfoFast).decode
+    decode_threat_json = msgspec.json.Decoder(ThreatInfoFast).decode
+
+else:
+
+    class _MsgspecRequired:
+        """Placeholder que falla al instanciar si msgspec no está instalado."""
+
+        def __init__(self, *args, **kwargs):
+            raise ImportError("msgspec no instalado. Ejecutar: pip install msgspec")
+
+    class GeoLocationInfoFast(_MsgspecRequired):
+        pass
+
+    class UserAgentInfoFast(_MsgspecRequired):
+        pass
+
+    class ThreatInfoFast(_MsgspecRequired):
+        pass
+
+    class SessionInfoFast(_MsgspecRequired):
+        pass
+
+    class EnrichedLogEntryFast(_MsgspecRequired):
+        pass
+
+    def _decode_requires_msgspec(data):
+        raise ImportError("msgspec no instalado. Ejecutar: pip install msgspec")
+
+    decode_geo_json = _decode_requires_msgspec
+    decode_user_agent_json = _decode_requires_msgspec
+    decode_threat_json = _decode_requires_msgspec
@@ -9,4 +9,8 @@ class ImmutableETLModel(BaseETLModel):
           - Estadisticas
           - Configuraciones"""
 
-    model_config = ConfigDict(**BaseETLModel.model_config, frozen=True)
+    # frozen=True ya rechaza toda asignación antes de validarla, así que
+    # validate_assignment (heredado de BaseETLModel) sería código muerto
+    model_config = ConfigDict(
+        **{**BaseETLModel.model_config, "validate_assignment": False}, frozen=True
+    )
@@ -0,0 +1,123 @@
+"""
+Variante liviana de LogEntry para el camino caliente de parseo.
+
+LogEntry (Pydantic) paga validación recursiva completa, colección de
+errores y el cruce Python↔Rust en cada registro. LogEntryFast es un
+dataclass con __slots__ y validadores manuales equivalentes: sirve para
+el loop de parseo por línea, mientras que LogEntry sigue siendo el
+modelo de los bordes (API / round-trip de almacenamiento).
+"""
+
+import re
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from src.core.validators import validate_http_method, validate_ip_address
+
+from .log_entry import _STATUS_CATEGORY, _SUSPICIOUS_RE
+
+# Mismo patrón que el campo http_version de LogEntry, precompilado
+_HTTP_VERSION_RE = re.compile(r"^HTTP/[0-9]\.[0-9]$")
+
+
+@dataclass(slots=True)
+class LogEntryFast:
+    """
+    Entrada de log validada a mano, sin el pipeline de Pydantic.
+
+    Mantiene los mismos campos y reglas de validación esenciales que
+    LogEntry (IP, método, endpoint, rangos de status/size, versión
+    HTTP), pero construida con chequeos directos en from_log_record.
+    """
+
+    ip_address: str
+    timestamp: datetime
+    method: str
+    endpoint: str
+    status_code: int
+    response_size: int
+    http_version: str = "HTTP/1.1"
+    user_agent: Optional[str] = None
+    referer: Optional[str] = None
+    remote_user: Optional[str] = None
+    request_time: Optional[float] = None
+    raw_line: Optional[str] = None
+    source_file: Optional[str] = None
+    line_number: Optional[int] = None
+
+    @classmethod
+    def from_log_record(cls, record: Dict[str, Any]) -> "LogEntryFast":
+        """
+        Construye una instancia validando los campos a mano.
+
+        Raises:
+            ValueError: Si algún campo no pasa la validación
+        """
+        ip_address = record["ip_address"]
+        if not validate_ip_address(ip_address):
+            raise ValueError(f"Dirección IP inválida: {ip_address}")
+
+        # Interna el método: pocos valores distintos, repetidos millones
+        # de veces, con hash cacheado para lookups posteriores
+        method = sys.intern(record["method"].upper().strip())
+        if not validate_http_method(method):
+            raise ValueError(f"Método HTTP inválido: {record['method']}")
+
+        endpoint = record["endpoint"].strip()
+        if not endpoint.startswith("/"):
+            raise ValueError(f"Endpoint debe comenzar con /: {endpoint}")
+
+        match = _SUSPICIOUS_RE.search(endpoint)
+        if match:
+            raise ValueError(f"Endpoint contiene patrón sospechoso: {match.group(0)}")
+
+        status_code = record["status_code"]
+        if not 100 <= status_code <= 599:
+            raise ValueError(f"Código de estado HTTP inválido: {status_code}")
+
+        response_size = record["response_size"]
+        if response_size < 0:
+            raise ValueError(f"Tamaño de respuesta negativo: {response_size}")
+
+        http_version = record.get("http_version", "HTTP/1.1")
+        if not _HTTP_VERSION_RE.match(http_version):
+            raise ValueError(f"Versión HTTP inválida: {http_version}")
+
+        get = record.get
+        return cls(
+            ip_address=ip_address,
+            timestamp=record["timestamp"],
+            method=method,
+            endpoint=endpoint,
+            status_code=status_code,
+            response_size=response_size,
+            http_version=http_version,
+            user_agent=get("user_agent"),
+            referer=get("referer"),
+            remote_user=get("remote_user"),
+            request_time=get("request_time"),
+            raw_line=get("raw_line"),
+            source_file=get("source_file"),
+            line_number=get("line_number"),
+        )
+
+    def to_log_record(self) -> Dict[str, Any]:
+        """Convierte a log_record (dict), igual que LogEntry."""
+        return asdict(self)
+
+    # ========== PROPIEDADES ==========
+    @property
+    def is_error(self) -> bool:
+        """True si es error 4xx o 5xx."""
+        return self.status_code >= 400
+
+    @property
+    def is_success(self) -> bool:
+        """True si es exitoso (2xx)."""
+        return 200 <= self.status_code < 300
+
+    def get_status_category(self) -> str:
+        """Retorna la categoría del status code (misma tabla que LogEntry)."""
+        return _STATUS_CATEGORY[self.status_code]
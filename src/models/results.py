@@ -9,15 +9,38 @@ Diferencias:
 El dataclass es el contrato, Pydantic es la implementación validada.
 """
 
+import struct
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import cached_property
+from typing import Any, ClassVar, Dict, Optional
 
-from pydantic import ConfigDict, Field, field_validator
+from pydantic import ConfigDict, Field, field_validator, model_validator
 
 from src.core.abstractions.types import ProcessingStatus
 from src.models.base import BaseETLModel
 from src.models.immutable_etl_model import ImmutableETLModel
 
+# Layout posicional para to_bytes/from_bytes: el enum viaja como índice
+# de un byte en lugar de su string. El orden de ProcessingStatus es parte
+# del formato (de ahí el SCHEMA_VERSION en el header).
+_STATUS_BY_CODE = tuple(ProcessingStatus)
+_STATUS_CODE = {status: code for code, status in enumerate(ProcessingStatus)}
+
+# Timestamp grueso para errores en bulk: datetime.now() por instancia es
+# un syscall por error; acá se refresca como mucho cada 100ms (precisión
+# más que suficiente para timestamps de error-log)
+_NOW_CACHE: list = [None, 0.0]
+
+
+def _coarse_now() -> datetime:
+    """datetime.now() refrescado a lo sumo cada 100ms."""
+    t = time.monotonic()
+    if _NOW_CACHE[0] is None or t - _NOW_CACHE[1] > 0.1:
+        _NOW_CACHE[0] = datetime.now()
+        _NOW_CACHE[1] = t
+    return _NOW_CACHE[0]
+
 
 class ProcessingResultModel(ImmutableETLModel):
     """
@@ -96,6 +119,72 @@ class ProcessingResultModel(ImmutableETLModel):
             return 0.0
         return self.records_processed / self.duration_seconds
 
+    SCHEMA_VERSION: ClassVar[int] = 1
+
+    # Header binario: versión, success, records_processed, errors,
+    # duration_seconds, status (índice de enum)
+    _STRUCT: ClassVar[struct.Struct] = struct.Struct("<BBIIdB")
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializa a un layout binario posicional compacto.
+
+        A diferencia de model_dump_json, no repite los nombres de campo
+        en cada payload: los campos fijos van struct-packed y solo
+        message/details (variables) viajan en msgpack. Para colas/caches
+        con millones de resultados el payload queda 5-10× más chico.
+
+        Returns:
+            bytes: header struct + (message, details) en msgpack
+
+        Raises:
+            ImportError: Si msgpack no está instalado
+        """
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError("msgpack no instalado. Ejecutar: pip install msgpack")
+
+        header = self._STRUCT.pack(
+            self.SCHEMA_VERSION,
+            self.success,
+            self.records_processed,
+            self.errors,
+            self.duration_seconds,
+            _STATUS_CODE[self.status],
+        )
+        tail = msgpack.packb((self.message, self.details), use_bin_type=True)
+        return header + tail
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ProcessingResultModel":
+        """
+        Reconstruye un ProcessingResultModel serializado con to_bytes.
+
+        Raises:
+            ValueError: Si la versión del schema no coincide
+            ImportError: Si msgpack no está instalado
+        """
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError("msgpack no instalado. Ejecutar: pip install msgpack")
+
+        version, success, records, errors, duration, status_code = cls._STRUCT.unpack_from(data)
+        if version != cls.SCHEMA_VERSION:
+            raise ValueError(f"Versión de schema no soportada: {version}")
+
+        message, details = msgpack.unpackb(data[cls._STRUCT.size :], raw=False)
+        return cls(
+            success=bool(success),
+            records_processed=records,
+            errors=errors,
+            duration_seconds=duration,
+            status=_STATUS_BY_CODE[status_code],
+            message=message,
+            details=details,
+        )
+
     def to_dataclass(self):
         """
         Convierte a la dataclass ProcessingResult de abstractions.
@@ -129,25 +218,25 @@ class ParserStatsModel(BaseETLModel):
     validation_errors: int = Field(default=0, ge=0)
     duration_seconds: float = Field(default=0.0, ge=0)
 
-    @field_validator("parsed_successfully")
-    @classmethod
-    def validate_parsed_not_exceed_total(cls, v, info):
-        """Parsed no puede ser mayor que total."""
-        total = info.data.get("total_lines", 0)
-        if v > total:
+    @model_validator(mode="after")
+    def validate_counts_not_exceed_total(self):
+        """Ni parsed ni parse_errors pueden ser mayores que total.
+
+        Un solo validador post-construcción (acceso a atributo directo)
+        en lugar de dos field_validators con probes a info.data.
+        """
+        total = self.total_lines
+        if self.parsed_successfully > total:
             raise ValueError(
-                f"parsed_successfully ({v}) no puede ser mayor que " f"total_lines ({total})"
+                f"parsed_successfully ({self.parsed_successfully}) no puede ser mayor que "
+                f"total_lines ({total})"
             )
-        return v
-
-    @field_validator("parse_errors")
-    @classmethod
-    def validate_parse_errors_not_exceed_total(cls, v, info):
-        """Parse errors no puede ser mayor que total."""
-        total = info.data.get("total_lines", 0)
-        if v > total:
-            raise ValueError(f"parse_errors ({v}) no puede ser mayor que " f"total_lines ({total})")
-        return v
+        if self.parse_errors > total:
+            raise ValueError(
+                f"parse_errors ({self.parse_errors}) no puede ser mayor que "
+                f"total_lines ({total})"
+            )
+        return self
 
     @property
     def success_rate(self) -> float:
@@ -171,6 +260,49 @@ class ParserStatsModel(BaseETLModel):
             return 0.0
         return self.total_lines / self.duration_seconds
 
+    SCHEMA_VERSION: ClassVar[int] = 1
+
+    # Todos los campos son fijos: versión + cuatro contadores + duración
+    _STRUCT: ClassVar[struct.Struct] = struct.Struct("<BIIIId")
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializa a un layout binario posicional (solo campos fijos).
+
+        Returns:
+            bytes: struct-packed, sin nombres de campo repetidos
+        """
+        return self._STRUCT.pack(
+            self.SCHEMA_VERSION,
+            self.total_lines,
+            self.parsed_successfully,
+            self.parse_errors,
+            self.validation_errors,
+            self.duration_seconds,
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ParserStatsModel":
+        """
+        Reconstruye un ParserStatsModel serializado con to_bytes.
+
+        Raises:
+            ValueError: Si la versión del schema no coincide
+        """
+        version, total, parsed, parse_errors, validation_errors, duration = cls._STRUCT.unpack(
+            data
+        )
+        if version != cls.SCHEMA_VERSION:
+            raise ValueError(f"Versión de schema no soportada: {version}")
+
+        return cls(
+            total_lines=total,
+            parsed_successfully=parsed,
+            parse_errors=parse_errors,
+            validation_errors=validation_errors,
+            duration_seconds=duration,
+        )
+
     def to_dataclass(self):
         """Convierte a la dataclass ParserStats de abstractions."""
         from src.core.abstractions.types import ParserStats
@@ -203,13 +335,19 @@ class ValidationErrorModel(BaseETLModel):
 
     raw_line: Optional[str] = Field(None, description="Línea original sin procesar")
 
-    timestamp: datetime = Field(default_factory=datetime.now, description="Timestamp del error")
+    timestamp: datetime = Field(default_factory=_coarse_now, description="Timestamp del error")
 
-    def __str__(self) -> str:
-        """Representación string del error."""
+    @cached_property
+    def _formatted(self) -> str:
+        """String del error, formateado una sola vez por instancia."""
         if self.line_number:
             return (
                 f"Línea {self.line_number}: {self.field_name} = "
                 f"{self.invalid_value} - {self.error_message}"
             )
         return f"{self.field_name} = {self.invalid_value} - " f"{self.error_message}"
+
+    def __str__(self) -> str:
+        """Representación string del error (cacheada: los volcados en
+        bulk la piden miles de veces)."""
+        return self._formatted
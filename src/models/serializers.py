@@ -11,6 +11,18 @@ from typing import Any, Dict, List
 
 from .base import BaseETLModel
 
+# msgspec serializa MessagePack en C (datetimes nativos como ext
+# timestamp, sin walk recursivo en Python); si no está, los métodos
+# msgpack caen al paquete msgpack clásico
+try:
+    import msgspec.msgpack
+
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder()
+    _HAS_MSGSPEC = True
+except ImportError:
+    _HAS_MSGSPEC = False
+
 
 class ModelSerializer:
     """
@@ -37,12 +49,15 @@ class ModelSerializer:
         """
         data = model.to_dict()
 
+        # csv.writer sobre la lista de valores: sin armar un DictWriter
+        # (que re-resuelve fieldnames) por cada fila
         if fields:
-            data = {k: data[k] for k in fields if k in data}
+            values = [data[k] for k in fields if k in data]
+        else:
+            values = list(data.values())
 
         output = StringIO()
-        writer = csv.DictWriter(output, fieldnames=data.keys())
-        writer.writerow(data)
+        csv.writer(output).writerow(values)
 
         return output.getvalue().strip()
 
@@ -68,16 +83,19 @@ class ModelSerializer:
         output = StringIO()
 
         # Usar campos del primer modelo
-        first_dict = models[0].to_dict()
-        fieldnames = list(first_dict.keys())
+        fieldnames = list(models[0].to_dict().keys())
 
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
+        # Un solo csv.writer con writerows sobre listas de valores:
+        # DictWriter volvía a mapear dict->fila por cada modelo
+        writer = csv.writer(output)
 
         if include_header:
-            writer.writeheader()
+            writer.writerow(fieldnames)
 
-        for model in models:
-            writer.writerow(model.to_dict())
+        writer.writerows(
+            [row.get(field, "") for field in fieldnames]
+            for row in (model.to_dict() for model in models)
+        )
 
         return output.getvalue()
 
@@ -134,8 +152,17 @@ class ModelSerializer:
             >>> log = LogEntry(...)
             >>> xml_str = ModelSerializer.to_xml(log)
         """
-        from xml.dom import minidom
-        from xml.etree.ElementTree import Element, SubElement, tostring
+        # lxml escribe pretty-print directo en C; sin él, ET.indent
+        # anota el árbol in-place. Ninguno de los dos paga el round-trip
+        # parse+reserialize de minidom.
+        try:
+            from lxml.etree import Element, SubElement, tostring
+
+            _use_lxml = True
+        except ImportError:
+            from xml.etree.ElementTree import Element, SubElement, indent, tostring
+
+            _use_lxml = False
 
         data = model.to_dict()
 
@@ -160,10 +187,11 @@ class ModelSerializer:
         dict_to_xml(root, data)
 
         # Pretty print
-        rough_string = tostring(root, encoding="unicode")
-        reparsed = minidom.parseString(rough_string)
+        if _use_lxml:
+            return tostring(root, pretty_print=True, encoding="unicode")
 
-        return reparsed.toprettyxml(indent="  ")
+        indent(root, space="  ")
+        return tostring(root, encoding="unicode") + "\n"
 
     @staticmethod
     def to_msgpack(model: BaseETLModel) -> bytes:
@@ -180,13 +208,18 @@ class ModelSerializer:
             >>> log = LogEntry(...)
             >>> msgpack_bytes = ModelSerializer.to_msgpack(log)
         """
+        data = model.to_dict()
+
+        # Encoder C de msgspec: datetimes van como ext timestamp
+        # estándar, sin el walk recursivo de conversión en Python
+        if _HAS_MSGSPEC:
+            return _MSGPACK_ENCODER.encode(data)
+
         try:
             import msgpack
         except ImportError:
             raise ImportError("msgpack no instalado. Ejecutar: pip install msgpack")
 
-        data = model.to_dict()
-
         # Convertir datetime a timestamp
         def convert_for_msgpack(obj):
             if isinstance(obj, dict):
@@ -283,6 +316,10 @@ class ModelDeserializer:
         Returns:
             Instancia del modelo
         """
+        if _HAS_MSGSPEC:
+            data = _MSGPACK_DECODER.decode(msgpack_bytes)
+            return model_class.from_dict(data)
+
         try:
             import msgpack
         except ImportError:
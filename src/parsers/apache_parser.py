@@ -7,13 +7,76 @@ Soporta:
 """
 
 import re
-from datetime import datetime
+import socket
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import List, Optional
 
 from src.core.abstractions.parsers import BaseParser
 from src.core.abstractions.types import LogRecord
 from src.core.constants.parsing_constants import ParsingConstants
 
+# google-re2 compila a un DFA sin backtracking: para el pattern de
+# Apache (lleno de \S+ y [^"]*) acelera el parseo masivo y acota el
+# peor caso. La API es compatible con re; sin re2 instalado, re.
+try:
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
+# Meses del timestamp Apache: lookup directo en vez de strptime (que
+# re-parsea el formato y consulta locale en cada llamada)
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_apache_ts(ts: str) -> datetime:
+    """
+    Parsea un timestamp Apache ('10/Jan/2026:14:23:45 +0000') por slicing.
+
+    El formato es de ancho fijo (26 chars), así que los campos salen por
+    offsets directos sin strptime. Dentro de un burst los timestamps se
+    repiten al segundo, por eso el lru_cache. Formas no estándar caen a
+    strptime con el formato de ParsingConstants.
+
+    Raises:
+        ValueError: Si el timestamp no es parseable en ningún camino
+    """
+    try:
+        if len(ts) != 26 or ts[2] != "/" or ts[6] != "/" or ts[11] != ":" or ts[20] != " ":
+            raise ValueError(ts)
+
+        offset = timedelta(hours=int(ts[22:24]), minutes=int(ts[24:26]))
+        if ts[21] == "-":
+            offset = -offset
+        elif ts[21] != "+":
+            raise ValueError(ts)
+
+        return datetime(
+            int(ts[7:11]),
+            _MONTHS[ts[3:6]],
+            int(ts[0:2]),
+            int(ts[12:14]),
+            int(ts[15:17]),
+            int(ts[18:20]),
+            tzinfo=timezone(offset),
+        )
+    except (KeyError, ValueError):
+        return datetime.strptime(ts, ParsingConstants.APACHE_TIMESTAMP_FORMAT)
+
 
 class ApacheParser(BaseParser):
     """
@@ -27,7 +90,7 @@ class ApacheParser(BaseParser):
     """
 
     # REGEX PATTERN - Explicado línea por línea
-    LOG_PATTERN = re.compile(
+    LOG_PATTERN = _regex_engine.compile(
         r"(?P<ip>\S+) "  # 1. Dirección IP (sin espacios)
         r"\S+ \S+ "  # 2. Ignorar campos ident y authuser
         r"\[(?P<timestamp>[^\]]+)\] "  # 3. Timestamp entre corchetes
@@ -75,27 +138,28 @@ class ApacheParser(BaseParser):
             return None
 
         try:
-            # 3. Extraer grupos nombrados del regex
-            data = match.groupdict()
+            # 3. Extraer grupos por posición en una sola llamada
+            # (group(1..8) evita el dict que construye groupdict)
+            ip, timestamp_str, method, url, status, bytes_value, referrer, user_agent = match.group(
+                1, 2, 3, 4, 5, 6, 7, 8
+            )
 
-            # 4. Parsear timestamp (formato Apache)
-            timestamp_str = data["timestamp"]
-            timestamp = datetime.strptime(timestamp_str, ParsingConstants.APACHE_TIMESTAMP_FORMAT)
+            # 4. Parsear timestamp (formato Apache, cacheado por string)
+            timestamp = _parse_apache_ts(timestamp_str)
 
             # 5. Manejar bytes (puede ser "-" en logs)
-            bytes_value = data["bytes"]
             bytes_int = 0 if bytes_value == "-" else int(bytes_value)
 
             # 6. Construir registro estructurado
             return {
-                "ip": data["ip"],
+                "ip": ip,
                 "timestamp": timestamp,
-                "method": data["method"],
-                "url": data["url"],
-                "status": int(data["status"]),
+                "method": method,
+                "url": url,
+                "status": int(status),
                 "bytes": bytes_int,
-                "referrer": data.get("referrer", "-"),
-                "user_agent": data.get("user_agent", "-"),
+                "referrer": referrer,
+                "user_agent": user_agent,
             }
 
         except (ValueError, KeyError) as e:
@@ -157,18 +221,11 @@ class ApacheParser(BaseParser):
             >>> ApacheParser._is_valid_ipv4('999.999.999.999')
             False
         """
-        parts = ip.split(".")
-
-        # Debe tener exactamente 4 octetos
-        if len(parts) != ParsingConstants.IPV4_OCTETS:
-            return False
-
+        # inet_pton hace el parseo completo en C, sin split ni cuatro
+        # int() por llamada. A diferencia de inet_aton, rechaza formas
+        # cortas/octales ('1', '0x7f.1'), igual que el chequeo anterior.
         try:
-            # Cada octeto debe ser 0-255
-            for part in parts:
-                num = int(part)
-                if not (ParsingConstants.IPV4_MIN_VALUE <= num <= ParsingConstants.IPV4_MAX_VALUE):
-                    return False
+            socket.inet_pton(socket.AF_INET, ip)
             return True
-        except ValueError:
+        except OSError:
             return False
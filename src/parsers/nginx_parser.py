@@ -92,16 +92,26 @@ class NginxParser(BaseParser):
             return None
 
         try:
-            # 3. Extraer todos los grupos
-            data = match.groupdict()
+            # 3. Extraer grupos por posición en una sola llamada
+            # (group(1..10) evita el dict que construye groupdict)
+            (
+                ip,
+                user,
+                timestamp_str,
+                request,
+                status,
+                bytes_value,
+                referrer,
+                user_agent,
+                request_time_str,
+                upstream_time_str,
+            ) = match.group(1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
 
             # 4. Parsear timestamp (mismo formato que Apache)
-            timestamp_str = data["timestamp"]
             timestamp = datetime.strptime(timestamp_str, ParsingConstants.APACHE_TIMESTAMP_FORMAT)
 
             # 5. Parsear el request (METHOD /url HTTP/version)
             # CUIDADO: Puede ser malformado o vacío
-            request = data["request"]
             method, url = self._parse_request(request)
 
             # Si no se pudo parsear el request, es inválido
@@ -109,24 +119,23 @@ class NginxParser(BaseParser):
                 return None
 
             # 6. Parsear bytes (puede ser "-")
-            bytes_value = data["bytes"]
             bytes_int = 0 if bytes_value == "-" else int(bytes_value)
 
             # 7. Parsear campos opcionales (tiempos de respuesta)
-            request_time = self._parse_float_or_none(data.get("request_time"))
-            upstream_time = self._parse_float_or_none(data.get("upstream_time"))
+            request_time = self._parse_float_or_none(request_time_str)
+            upstream_time = self._parse_float_or_none(upstream_time_str)
 
             # 8. Construir registro estructurado
             record = {
-                "ip": data["ip"],
-                "user": data["user"],  # Nginx incluye este campo
+                "ip": ip,
+                "user": user,  # Nginx incluye este campo
                 "timestamp": timestamp,
                 "method": method,
                 "url": url,
-                "status": int(data["status"]),
+                "status": int(status),
                 "bytes": bytes_int,
-                "referrer": data["referrer"] if data["referrer"] != "-" else None,
-                "user_agent": data["user_agent"] if data["user_agent"] != "-" else None,
+                "referrer": referrer if referrer != "-" else None,
+                "user_agent": user_agent if user_agent != "-" else None,
             }
 
             # 9. Agregar campos opcionales solo si existen
@@ -178,3 +178,67 @@ class TestEnrichedLogEntry:
         device = enriched.get_device_string()
         assert "Chrome 120.0" in device
         assert "Windows 10" in device
+
+
+class TestBatchConstruction:
+    """Tests para from_basic y enrich_batch."""
+
+    @staticmethod
+    def _basic_log(ip: str = "10.0.0.1", user_agent: str = "Mozilla/5.0") -> LogEntry:
+        return LogEntry(
+            ip_address=ip,
+            timestamp=datetime(2026, 1, 10, 14, 0, 0),
+            method="GET",
+            endpoint="/api/users",
+            status_code=200,
+            response_size=1234,
+            user_agent=user_agent,
+        )
+
+    def test_from_basic_preserves_base_fields(self):
+        """Test que from_basic conserva los campos del LogEntry."""
+        basic = self._basic_log()
+
+        enriched = EnrichedLogEntry.from_basic(basic)
+
+        assert isinstance(enriched, EnrichedLogEntry)
+        assert enriched.ip_address == basic.ip_address
+        assert enriched.method == basic.method
+        assert enriched.status_code == basic.status_code
+        assert enriched.geo_info is None
+
+    def test_from_basic_attaches_enrichment(self):
+        """Test que from_basic adjunta los sub-modelos de enriquecimiento."""
+        geo = GeoLocationInfo(country_code="AR", city="Buenos Aires")
+
+        enriched = EnrichedLogEntry.from_basic(
+            self._basic_log(), geo_info=geo, enrichment_sources=["geoip"]
+        )
+
+        assert enriched.geo_info.city == "Buenos Aires"
+        assert enriched.enrichment_sources == ["geoip"]
+
+    def test_enrich_batch_preserves_order(self):
+        """Test que enrich_batch devuelve los logs en orden de entrada."""
+        logs = [self._basic_log(ip=f"10.0.0.{i}") for i in range(1, 4)]
+
+        enriched = EnrichedLogEntry.enrich_batch(logs)
+
+        assert len(enriched) == 3
+        assert [e.ip_address for e in enriched] == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+        assert all(isinstance(e, EnrichedLogEntry) for e in enriched)
+
+    def test_enrich_batch_applies_lookups(self):
+        """Test que los lookups se aplican por IP y por User-Agent."""
+        logs = [self._basic_log(ip="10.0.0.1"), self._basic_log(ip="10.0.0.2")]
+        geo_lookups = {"10.0.0.1": GeoLocationInfo(country_code="AR")}
+        ua_lookups = {"Mozilla/5.0": UserAgentInfo(browser="Firefox", device_type="desktop")}
+
+        enriched = EnrichedLogEntry.enrich_batch(
+            logs, geo_lookups=geo_lookups, ua_lookups=ua_lookups
+        )
+
+        assert enriched[0].geo_info.country_code == "AR"
+        assert enriched[1].geo_info is None
+        assert enriched[0].user_agent_info.browser == "Firefox"
+        assert enriched[1].user_agent_info.browser == "Firefox"
@@ -0,0 +1,76 @@
+"""
+Tests para la representación columnar LogEntryBatch.
+"""
+
+from datetime import datetime, timedelta
+
+from src.models.log_entry_batch import LogEntryBatch
+
+
+def _records():
+    base = datetime(2026, 1, 10, 14, 0, 0)
+    statuses = [200, 201, 404, 500, 301]
+    return [
+        {
+            "status_code": status,
+            "response_size": 100 * (i + 1),
+            "timestamp": base + timedelta(seconds=i),
+            "method": "GET" if i % 2 == 0 else "POST",
+        }
+        for i, status in enumerate(statuses)
+    ]
+
+
+class TestLogEntryBatch:
+    """Tests para LogEntryBatch."""
+
+    def test_from_records_builds_columns(self):
+        """Test que from_records llena las columnas en orden."""
+        batch = LogEntryBatch.from_records(_records())
+
+        assert len(batch) == 5
+        assert batch.statuses == [200, 201, 404, 500, 301]
+        assert batch.sizes == [100, 200, 300, 400, 500]
+        assert batch.methods == ["GET", "POST", "GET", "POST", "GET"]
+
+    def test_error_mask_and_count(self):
+        """Test máscara y conteo de errores 4xx/5xx."""
+        batch = LogEntryBatch.from_records(_records())
+
+        assert batch.error_mask() == [False, False, True, True, False]
+        assert batch.error_count() == 2
+
+    def test_error_and_success_rates(self):
+        """Test cálculo de tasas de error y éxito."""
+        batch = LogEntryBatch.from_records(_records())
+
+        assert batch.error_rate() == 0.4  # 2/5
+        assert batch.success_rate() == 0.4  # 200 y 201
+
+    def test_status_histogram(self):
+        """Test histograma por centena de status."""
+        batch = LogEntryBatch.from_records(_records())
+
+        assert batch.status_histogram() == [0, 0, 2, 1, 1, 1]
+
+    def test_total_bytes(self):
+        """Test suma de bytes del lote."""
+        batch = LogEntryBatch.from_records(_records())
+
+        assert batch.total_bytes() == 1500
+
+    def test_throughput(self):
+        """Test registros por segundo según rango de timestamps."""
+        batch = LogEntryBatch.from_records(_records())
+
+        # 5 registros en 4 segundos de rango
+        assert batch.throughput() == 1.25
+
+    def test_empty_batch_rates_are_zero(self):
+        """Test que un lote vacío no divide por cero."""
+        batch = LogEntryBatch.from_records([])
+
+        assert len(batch) == 0
+        assert batch.error_rate() == 0.0
+        assert batch.success_rate() == 0.0
+        assert batch.throughput() == 0.0
@@ -0,0 +1,103 @@
+"""
+Tests para LogRow y el scanner posicional del LogParser.
+
+El scanner tiene dos implementaciones (Python puro y kernel numba);
+estos tests corren ambas sobre los mismos casos para que nunca
+diverjan en qué líneas aceptan.
+"""
+
+import pytest
+
+from src.log_parser import LogParser, LogRow
+
+# Ambas implementaciones deben aceptar y rechazar exactamente lo mismo
+IMPLEMENTATIONS = [LogParser._parse_line_py, LogParser._parse_line_jit]
+
+VALID_LINE = '192.168.1.100 - - [10/Jan/2026:14:23:45 +0000] "GET /home HTTP/1.1" 200 4523'
+
+
+class TestLogRow:
+    """Tests para LogRow."""
+
+    def test_subscript_access(self):
+        """Test acceso por subíndice estilo dict."""
+        row = LogRow("10.0.0.1", None, "GET", "/home", 200, 1234)
+
+        assert row["ip"] == "10.0.0.1"
+        assert row["method"] == "GET"
+        assert row["status"] == 200
+        assert row["bytes"] == 1234
+
+    def test_unknown_key_raises_keyerror(self):
+        """Test que una clave inexistente levanta KeyError."""
+        row = LogRow("10.0.0.1", None, "GET", "/home", 200, 1234)
+
+        with pytest.raises(KeyError):
+            row["no_existe"]
+
+
+class TestScannerAcceptance:
+    """Tests de qué líneas acepta el scanner (ambas variantes)."""
+
+    @pytest.mark.parametrize("parse", IMPLEMENTATIONS)
+    def test_parses_valid_line(self, parse):
+        """Test parseo de una línea válida."""
+        row = parse(VALID_LINE)
+
+        assert row is not None
+        assert row["ip"] == "192.168.1.100"
+        assert row["method"] == "GET"
+        assert row["url"] == "/home"
+        assert row["status"] == 200
+        assert row["bytes"] == 4523
+
+    @pytest.mark.parametrize("parse", IMPLEMENTATIONS)
+    def test_accepts_non_dash_ident_fields(self, parse):
+        """Test que ident/authuser con valores reales se aceptan."""
+        line = '10.0.0.1 frank alice [10/Jan/2026:14:23:45 +0000] "GET /x HTTP/1.1" 200 99'
+
+        assert parse(line) is not None
+
+    @pytest.mark.parametrize("parse", IMPLEMENTATIONS)
+    def test_rejects_missing_ident_fields(self, parse):
+        """Test que sin los campos ident/authuser la línea se rechaza."""
+        line = '10.0.0.1 [10/Jan/2026:14:23:45 +0000] "GET /x HTTP/1.1" 200 99'
+
+        assert parse(line) is None
+
+    @pytest.mark.parametrize("parse", IMPLEMENTATIONS)
+    def test_rejects_single_ident_field(self, parse):
+        """Test que con un solo campo entre IP y timestamp se rechaza."""
+        line = '10.0.0.1 - [10/Jan/2026:14:23:45 +0000] "GET /x HTTP/1.1" 200 99'
+
+        assert parse(line) is None
+
+    @pytest.mark.parametrize("parse", IMPLEMENTATIONS)
+    def test_rejects_empty_http_version(self, parse):
+        """Test que una request sin versión HTTP se rechaza."""
+        line = '10.0.0.1 - - [10/Jan/2026:14:23:45 +0000] "GET /x " 200 99'
+
+        assert parse(line) is None
+
+    @pytest.mark.parametrize("parse", IMPLEMENTATIONS)
+    def test_rejects_non_numeric_status(self, parse):
+        """Test que un status no numérico se rechaza."""
+        line = '10.0.0.1 - - [10/Jan/2026:14:23:45 +0000] "GET /x HTTP/1.1" abc 99'
+
+        assert parse(line) is None
+
+    def test_implementations_agree_on_edge_cases(self):
+        """Test paridad py/numba sobre un set de líneas límite."""
+        lines = [
+            VALID_LINE,
+            "",
+            "no es un log",
+            '10.0.0.1 - - [mal timestamp] "GET /x HTTP/1.1" 200 99',
+            '10.0.0.1 - - [10/Jan/2026:14:23:45 +0000] "GET /x" 200 99',
+            '10.0.0.1 - - [10/Jan/2026:14:23:45 +0000] "GET /x HTTP/1.1" 200',
+        ]
+
+        for line in lines:
+            py = LogParser._parse_line_py(line)
+            jit = LogParser._parse_line_jit(line)
+            assert (py is None) == (jit is None), line
@@ -276,3 +276,54 @@ class TestValidationErrorModel:
         from datetime import datetime
 
         assert isinstance(error.timestamp, datetime)
+
+
+class TestBinarySerialization:
+    """Tests para to_bytes/from_bytes."""
+
+    def test_processing_result_round_trip(self, processing_result_data):
+        """Test round-trip binario de ProcessingResultModel."""
+        original = ProcessingResultModel(**processing_result_data)
+
+        restored = ProcessingResultModel.from_bytes(original.to_bytes())
+
+        assert restored == original
+
+    def test_processing_result_round_trip_with_details(self):
+        """Test que message y details sobreviven el round-trip."""
+        original = ProcessingResultModel(
+            success=True,
+            records_processed=100,
+            errors=0,
+            duration_seconds=1.5,
+            status=ProcessingStatus.COMPLETED,
+            message="Procesamiento OK",
+            details={"source": "access.log", "batch": 7},
+        )
+
+        restored = ProcessingResultModel.from_bytes(original.to_bytes())
+
+        assert restored.message == "Procesamiento OK"
+        assert restored.details == {"source": "access.log", "batch": 7}
+
+    def test_processing_result_rejects_unknown_schema_version(self, processing_result_data):
+        """Test que una versión de schema desconocida levanta error."""
+        data = ProcessingResultModel(**processing_result_data).to_bytes()
+        corrupted = bytes([99]) + data[1:]
+
+        with pytest.raises(ValueError, match="schema"):
+            ProcessingResultModel.from_bytes(corrupted)
+
+    def test_parser_stats_round_trip(self):
+        """Test round-trip binario de ParserStatsModel."""
+        original = ParserStatsModel(
+            total_lines=1000,
+            parsed_successfully=950,
+            parse_errors=30,
+            validation_errors=20,
+            duration_seconds=5.5,
+        )
+
+        restored = ParserStatsModel.from_bytes(original.to_bytes())
+
+        assert restored == original
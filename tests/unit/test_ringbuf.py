@@ -0,0 +1,57 @@
+"""
+Tests para los ring buffers de métricas.
+"""
+
+from src.core.metrics.ringbuf import RingBuffer, push_metric, stop_drainer
+
+
+class TestRingBuffer:
+    """Tests para RingBuffer."""
+
+    def test_push_and_drain_preserves_order(self):
+        """Test que drain devuelve las entradas en orden FIFO."""
+        ring = RingBuffer(capacity=8)
+
+        for i in range(5):
+            assert ring.push(("metric", i)) is True
+
+        assert ring.drain() == [("metric", i) for i in range(5)]
+
+    def test_drain_empties_the_ring(self):
+        """Test que drain consume las entradas."""
+        ring = RingBuffer(capacity=8)
+        ring.push(("metric", 1))
+
+        assert ring.drain() == [("metric", 1)]
+        assert ring.drain() == []
+
+    def test_full_ring_rejects_push(self):
+        """Test que un ring lleno rechaza el push sin bloquear."""
+        # Un ring de capacidad N guarda N-1 entradas (un slot separa
+        # head de tail)
+        ring = RingBuffer(capacity=4)
+
+        assert ring.push(("a",)) is True
+        assert ring.push(("b",)) is True
+        assert ring.push(("c",)) is True
+        assert ring.push(("d",)) is False
+
+    def test_push_works_again_after_drain(self):
+        """Test que el ring se reutiliza después de drenar."""
+        ring = RingBuffer(capacity=4)
+        for item in ("a", "b", "c"):
+            ring.push((item,))
+        ring.drain()
+
+        assert ring.push(("d",)) is True
+        assert ring.drain() == [("d",)]
+
+
+class TestPushMetric:
+    """Tests para push_metric."""
+
+    def test_push_metric_without_drainer_falls_back(self):
+        """Test que sin drainer activo push_metric devuelve False."""
+        stop_drainer()
+
+        assert push_metric("default", "latency", 1.0, "timer", None) is False
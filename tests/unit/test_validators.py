@@ -6,6 +6,13 @@ from src.core.validators import (
     validate_ipv4,
     validate_url,
 )
+from src.core.validators.log_validators import (
+    BulkLogFormatValidator,
+    validate_log_format,
+    validate_log_record,
+    validate_log_records_bulk,
+)
+from src.core.validators.timestamp_validators import parse_apache_ts, validate_timestamp
 
 
 class TestIPValidators:
@@ -47,3 +54,93 @@ class TestHTTPValidators:
     def test_invalid_status_codes(self):
         assert validate_http_status(999) is False
         assert validate_http_status(-1) is False
+
+
+class TestLogRecordBulkValidation:
+    """Tests de validación de registros por lotes."""
+
+    @staticmethod
+    def _record(**overrides):
+        record = {
+            "timestamp": "2024-01-15 10:30:00",
+            "ip_address": "192.168.1.1",
+            "http_method": "GET",
+            "url": "https://example.com/api",
+            "status_code": 200,
+        }
+        record.update(overrides)
+        return record
+
+    def test_bulk_mask_matches_record_validity(self):
+        records = [
+            self._record(),
+            self._record(ip_address="999.999.999.999"),
+            self._record(status_code=999),
+            self._record(),
+        ]
+        assert validate_log_records_bulk(records) == [True, False, False, True]
+
+    def test_bulk_rejects_missing_fields(self):
+        record = self._record()
+        del record["url"]
+        assert validate_log_records_bulk([record]) == [False]
+
+    def test_bulk_tolerates_unhashable_values(self):
+        # Un campo con tipo inesperado invalida el registro sin levantar
+        # TypeError desde los caches de los validadores
+        records = [self._record(url=["no-es-str"]), self._record()]
+        assert validate_log_records_bulk(records) == [False, True]
+
+    def test_record_validation_reports_unhashable_value(self):
+        errors = validate_log_record(self._record(url=["no-es-str"]))
+        assert errors == ["Invalid URL: ['no-es-str']"]
+
+
+class TestBulkFormatValidator:
+    """Tests del validador de formato por lotes."""
+
+    def test_validate_many_apache_lines(self):
+        validator = BulkLogFormatValidator()
+        lines = [
+            '192.168.1.1 - - [10/Jan/2026:14:23:45 +0000] "GET /home HTTP/1.1" 200 4523',
+            "esto no es un log",
+            '10.0.0.5 - - [28/Jan/2026:10:15:30 +0000] "POST /login HTTP/1.1" 302 0',
+        ]
+        assert validator.validate_many(lines, "apache") == [True, False, True]
+
+    def test_validate_many_matches_single_line_validator(self):
+        validator = BulkLogFormatValidator()
+        lines = [
+            '1.2.3.4 - - [10/Jan/2026:14:23:45 +0000] "GET / HTTP/1.1" 200 1',
+            "invalido",
+        ]
+        expected = [validate_log_format(line, "apache") for line in lines]
+        assert validator.validate_many(lines, "apache") == expected
+
+
+class TestApacheTimestampParser:
+    """Tests del parser de timestamps Apache por offsets fijos."""
+
+    def test_parses_utc_offset(self):
+        from datetime import datetime, timezone
+
+        result = parse_apache_ts("10/Jan/2026:14:23:45 +0000")
+        assert result == datetime(2026, 1, 10, 14, 23, 45, tzinfo=timezone.utc)
+
+    def test_parses_negative_offset(self):
+        result = parse_apache_ts("10/Jan/2026:14:23:45 -0330")
+        offset = result.utcoffset()
+        assert offset.total_seconds() == -(3 * 3600 + 30 * 60)
+
+    def test_invalid_timestamp_returns_none(self):
+        assert parse_apache_ts("no es un timestamp") is None
+        assert parse_apache_ts("99/Zzz/2026:14:23:45 +0000") is None
+
+    def test_validate_timestamp_accepts_apache_format(self):
+        assert validate_timestamp("10/Jan/2026:14:23:45 +0000") is True
+
+    def test_validate_timestamp_rejects_non_string_types(self):
+        # El guard de tipo corre antes del cache: no debe levantar
+        # TypeError con valores no hasheables
+        assert validate_timestamp(["10/Jan/2026:14:23:45 +0000"]) is False
+        assert validate_timestamp(None) is False